@@ -10,7 +10,7 @@ from typing import List
 
 from ..core.database import get_db
 from ..models.user import User as UserModel
-from ..models.api_key import APIKey as APIKeyModel
+from ..models.api_key import APIKey as APIKeyModel, DEFAULT_KEY_HASH_ALGO
 from ..schemas.api_key import APIKeyCreate, APIKeyResponse, APIKeyCreated, APIKeyList
 from .auth import get_current_user
 
@@ -30,13 +30,14 @@ def create_api_key(
     """
     # Generate new key
     key, prefix = APIKeyModel.generate_key()
-    key_hash = APIKeyModel.hash_key(key)
+    key_hash = APIKeyModel.hash_key(key, DEFAULT_KEY_HASH_ALGO)
 
     # Create API key record
     api_key = APIKeyModel(
         user_id=current_user.id,
         key_hash=key_hash,
         key_prefix=prefix,
+        hash_algo=DEFAULT_KEY_HASH_ALGO,
         name=key_data.name,
         description=key_data.description,
         scopes=key_data.scopes or "*",
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from datetime import timedelta
 
@@ -35,7 +36,9 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if username is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.query(UserModel).filter(UserModel.username == username).first()
+    # Runs on every authenticated request; the lambda statement is only
+    # built once and later calls just rebind username
+    user = db.scalars(lambda_stmt(lambda: select(UserModel).where(UserModel.username == username))).first()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
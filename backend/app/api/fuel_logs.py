@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from typing import List, Optional
@@ -8,6 +8,7 @@ from datetime import datetime
 from ..core.database import get_db
 from ..models.fuel_log import FuelLog as FuelLogModel
 from ..models.user import User as UserModel
+from ..schemas import FuelLogListAdapter
 from ..schemas.fuel_log import FuelLog, FuelLogCreate
 from .auth import get_current_user
 
@@ -99,7 +100,8 @@ def get_fuel_logs(
         query = query.filter(FuelLogModel.date <= end_date)
 
     logs = query.order_by(desc(FuelLogModel.date)).offset(skip).limit(limit).all()
-    return logs
+    logs = FuelLogListAdapter.validate_python(logs, from_attributes=True)
+    return Response(FuelLogListAdapter.dump_json(logs), media_type="application/json")
 
 
 @router.get("/{log_id}", response_model=FuelLog)
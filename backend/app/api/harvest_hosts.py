@@ -479,8 +479,6 @@ def add_stay_to_trip(
         state=host.state,
         zip_code=host.zip_code,
         location=location,
-        latitude=host.latitude,
-        longitude=host.longitude,
         arrival_time=datetime.combine(stay.check_in_date, datetime.min.time()) if stay.check_in_date else None,
         departure_time=datetime.combine(stay.check_out_date, datetime.min.time()) if stay.check_out_date else None,
         is_overnight=True,
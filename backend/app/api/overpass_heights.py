@@ -11,6 +11,7 @@ from geoalchemy2.functions import ST_DWithin, ST_MakePoint
 from geoalchemy2 import WKTElement
 
 from ..core.database import get_road_db
+from ..core.geo import route_distances_miles
 from ..models.poi_sources import OverpassPOI
 from ..models.poi import OverpassHeight as OverpassHeightModel
 
@@ -234,36 +235,14 @@ def get_heights_along_route(
     all_heights = query.all()
 
     # Filter to only heights within buffer distance of route
-    def point_to_segment_distance(px, py, x1, y1, x2, y2):
-        """Calculate distance from point (px, py) to line segment (x1,y1)-(x2,y2)"""
-        dx = x2 - x1
-        dy = y2 - y1
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-
-        # Convert to miles (rough approximation)
-        dlat = abs(px - proj_x) * 69
-        dlon = abs(py - proj_y) * 55
-        return math.sqrt(dlat ** 2 + dlon ** 2)
+    min_dists = route_distances_miles(
+        [h.latitude for h in all_heights],
+        [h.longitude for h in all_heights],
+        sampled_coords
+    ).tolist()
 
     filtered_heights = []
-    for height in all_heights:
-        # Check distance to each route segment
-        min_dist = float('inf')
-        for i in range(len(sampled_coords) - 1):
-            dist = point_to_segment_distance(
-                height.latitude, height.longitude,
-                sampled_coords[i][0], sampled_coords[i][1],
-                sampled_coords[i + 1][0], sampled_coords[i + 1][1]
-            )
-            min_dist = min(min_dist, dist)
-            if min_dist <= buffer_miles:
-                break
-
+    for height, min_dist in zip(all_heights, min_dists):
         if min_dist <= buffer_miles:
             is_parking = is_parking_garage(height.name, height.road_name)
             if is_parking and not include_parking:
@@ -6,17 +6,50 @@ from geoalchemy2.elements import WKTElement
 from geoalchemy2.functions import ST_DWithin, ST_Distance
 from geoalchemy2 import Geography
 import httpx
+import math
 from datetime import datetime, timedelta
 
 from ..core.database import get_db, get_poi_db
+from ..core.geo import route_distances_miles
+from ..core.zorder import zorder_range
 from ..models.poi import POI as POIModel, OverpassHeight as OverpassHeightModel, SurveillanceCamera as SurveillanceCameraModel
 from ..models.user import User as UserModel
 from ..schemas.poi import POI, POICreate, OverpassHeight, SurveillanceCamera
+from ..services.poi_cache import get_cached_poi, set_cached_poi
 from .auth import get_current_user
 
 router = APIRouter()
 
 
+def _poi_within_radius(search_point, longitude: float, latitude: float, radius_meters: float):
+    """
+    Radius filter for POIs: a zorder_cell range and a planar ST_DWithin on the
+    indexed location_3857 column select candidates, then the geography check
+    keeps exact semantics.
+    Web Mercator stretches distances by 1/cos(latitude), so the planar radius
+    uses the scale at the poleward edge of the circle to never miss a POI.
+    """
+    edge_lat = min(abs(latitude) + radius_meters / 111320.0, 85.0)
+    center_3857 = func.ST_Transform(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326), 3857)
+
+    filters = [
+        func.ST_DWithin(POIModel.location_3857, center_3857, radius_meters / math.cos(math.radians(edge_lat))),
+        ST_DWithin(POIModel.location, search_point, radius_meters)
+    ]
+
+    # Bounding box of the circle, widened slightly, as a zorder_cell range
+    # (skipped when the box would wrap the antimeridian or a pole)
+    lat_pad = radius_meters / 111320.0 * 1.01
+    lon_pad = lat_pad / math.cos(math.radians(edge_lat))
+    south, north = latitude - lat_pad, latitude + lat_pad
+    west, east = longitude - lon_pad, longitude + lon_pad
+    if south >= -90 and north <= 90 and west >= -180 and east <= 180:
+        cell_min, cell_max = zorder_range(south, west, north, east)
+        filters.insert(0, POIModel.zorder_cell.between(cell_min, cell_max))
+
+    return and_(*filters)
+
+
 @router.post("/refresh")
 async def trigger_poi_refresh(
     current_user: UserModel = Depends(get_current_user)
@@ -498,7 +531,7 @@ async def cached_poi_search(
 
     # Build base query
     filters = [
-        ST_DWithin(POIModel.location, search_point, radius_meters),
+        _poi_within_radius(search_point, longitude, latitude, radius_meters),
         POIModel.category.in_(category_list),
         POIModel.source == "overpass"
     ]
@@ -577,7 +610,7 @@ async def cached_poi_search(
         # If Overpass fails, return whatever cached data we have (even if old)
         fallback_query = db.query(POIModel).filter(
             and_(
-                ST_DWithin(POIModel.location, search_point, radius_meters),
+                _poi_within_radius(search_point, longitude, latitude, radius_meters),
                 POIModel.category.in_(category_list),
                 POIModel.source == "overpass"
             )
@@ -657,11 +690,7 @@ def search_pois(
     search_point = WKTElement(point_wkt, srid=4326)
 
     query = db.query(POIModel).filter(
-        ST_DWithin(
-            POIModel.location,
-            search_point,
-            radius_meters
-        )
+        _poi_within_radius(search_point, longitude, latitude, radius_meters)
     )
 
     if category:
@@ -817,35 +846,15 @@ def get_cameras_along_route(
 
     all_cameras = query.all()
 
-    # Distance from point to line segment
-    def point_to_segment_distance(px, py, x1, y1, x2, y2):
-        dx = x2 - x1
-        dy = y2 - y1
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-
-        dlat = abs(px - proj_x) * 69
-        dlon = abs(py - proj_y) * 55
-        return math.sqrt(dlat ** 2 + dlon ** 2)
-
     # Filter cameras within buffer distance of route
-    filtered_cameras = []
-    for camera in all_cameras:
-        min_dist = float('inf')
-        for i in range(len(sampled_coords) - 1):
-            dist = point_to_segment_distance(
-                camera.latitude, camera.longitude,
-                sampled_coords[i][0], sampled_coords[i][1],
-                sampled_coords[i + 1][0], sampled_coords[i + 1][1]
-            )
-            min_dist = min(min_dist, dist)
-            if min_dist <= buffer_miles:
-                break
+    min_dists = route_distances_miles(
+        [c.latitude for c in all_cameras],
+        [c.longitude for c in all_cameras],
+        sampled_coords
+    ).tolist()
 
+    filtered_cameras = []
+    for camera, min_dist in zip(all_cameras, min_dists):
         if min_dist <= buffer_miles:
             filtered_cameras.append({
                 "id": camera.id,
@@ -922,9 +931,15 @@ def get_poi(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get POI by ID"""
+    cached = get_cached_poi(poi_id)
+    if cached is not None:
+        return cached
+
     poi = db.query(POIModel).filter(POIModel.id == poi_id).first()
     if not poi:
         raise HTTPException(status_code=404, detail="POI not found")
+
+    set_cached_poi(poi_id, POI.model_validate(poi).model_dump(mode="json"))
     return poi
 
 
@@ -2,13 +2,12 @@
 Bounding Box POI Search - for comprehensive POI display at any zoom level
 """
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 from typing import List
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.functions import ST_MakeEnvelope, ST_Intersects
 
-from ..core.database import get_poi_db
+from ..core.database import get_async_poi_db, execute_query
 from ..models.poi_sources import OverpassPOI as POIModel
 from ..models.user import User as UserModel
 from ..schemas.poi import POI
@@ -26,7 +25,7 @@ async def bbox_poi_search(
     categories: str = Query(..., description="Comma-separated category list"),
     subcategories: str = Query(None, description="Optional comma-separated subcategory list"),
     limit: int = Query(5000, description="Maximum POIs to return (prevent browser overload)"),
-    db: Session = Depends(get_poi_db),
+    db = Depends(get_async_poi_db),
     current_user: UserModel = Depends(get_current_user)
 ):
     """
@@ -108,9 +107,30 @@ async def bbox_poi_search(
         if subcategory_list:
             filters.append(POIModel.subcategory.in_(subcategory_list))
 
-        query = db.query(POIModel).filter(and_(*filters)).limit(limit)
-
-        pois = query.all()
+        # Select only the serialized columns (skips images, raw API payloads, geometry)
+        query = select(
+            POIModel.id,
+            POIModel.name,
+            POIModel.category,
+            POIModel.subcategory,
+            POIModel.address,
+            POIModel.city,
+            POIModel.state,
+            POIModel.zip_code,
+            POIModel.country,
+            POIModel.latitude,
+            POIModel.longitude,
+            POIModel.description,
+            POIModel.phone,
+            POIModel.website,
+            POIModel.amenities,
+            POIModel.max_rv_length,
+            POIModel.rating,
+            POIModel.external_id,
+            POIModel.created_at
+        ).where(and_(*filters)).limit(limit)
+
+        pois = (await execute_query(db, query)).all()
 
         # Manually serialize to avoid validation issues
         result = []
@@ -131,10 +151,10 @@ async def bbox_poi_search(
                 "phone": poi.phone,
                 "website": poi.website,
                 "amenities": poi.amenities,
-                "rv_friendly": getattr(poi, 'rv_friendly', True),
+                "rv_friendly": True,  # overpass_pois has no rv_friendly column
                 "max_rv_length": poi.max_rv_length,
                 "rating": poi.rating,
-                "notes": getattr(poi, 'notes', None),
+                "notes": None,
                 "source": "overpass",  # All POIs from overpass_pois table
                 "external_id": poi.external_id,
                 "created_at": poi.created_at.isoformat() if poi.created_at else None,
@@ -155,7 +175,7 @@ async def bbox_poi_count(
     north: float = Query(...),
     east: float = Query(...),
     categories: str = Query(...),
-    db: Session = Depends(get_poi_db),
+    db = Depends(get_async_poi_db),
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get count of POIs in bounding box without returning all data"""
@@ -167,12 +187,12 @@ async def bbox_poi_count(
 
     bbox = ST_MakeEnvelope(west, south, east, north, 4326)
 
-    count = db.query(func.count(POIModel.id)).filter(
+    count = (await execute_query(db, select(func.count(POIModel.id)).where(
         and_(
             ST_Intersects(POIModel.location, bbox),
             POIModel.category.in_(category_list)
         )
-    ).scalar()
+    ))).scalar()
 
     return {"count": count}
 
@@ -180,18 +200,18 @@ async def bbox_poi_count(
 @router.get("/subcategories")
 async def get_subcategories(
     category: str = Query(..., description="Category to get subcategories for"),
-    db: Session = Depends(get_poi_db),
+    db = Depends(get_async_poi_db),
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get list of available subcategories for a given category"""
     # Query distinct subcategories for this category
-    subcategories = db.query(POIModel.subcategory).filter(
+    subcategories = (await execute_query(db, select(POIModel.subcategory).where(
         and_(
             POIModel.category == category,
             POIModel.subcategory.isnot(None),
             POIModel.subcategory != ''
         )
-    ).distinct().all()
+    ).distinct())).all()
 
     # Extract subcategory values from result tuples
     subcategory_list = [s[0] for s in subcategories if s[0]]
@@ -11,6 +11,7 @@ from geoalchemy2.functions import ST_DWithin
 from geoalchemy2 import WKTElement
 
 from ..core.database import get_road_db
+from ..core.geo import route_distances_miles
 from ..models.poi import RailroadCrossing as RailroadCrossingModel
 
 router = APIRouter()
@@ -137,33 +138,14 @@ def get_crossings_along_route(
     all_crossings = query.all()
 
     # Filter to crossings within buffer distance
-    def point_to_segment_distance(px, py, x1, y1, x2, y2):
-        dx = x2 - x1
-        dy = y2 - y1
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-
-        dlat = abs(px - proj_x) * 69
-        dlon = abs(py - proj_y) * 55
-        return math.sqrt(dlat ** 2 + dlon ** 2)
+    min_dists = route_distances_miles(
+        [c.latitude for c in all_crossings],
+        [c.longitude for c in all_crossings],
+        sampled_coords
+    ).tolist()
 
     filtered_crossings = []
-    for crossing in all_crossings:
-        min_dist = float('inf')
-        for i in range(len(sampled_coords) - 1):
-            dist = point_to_segment_distance(
-                crossing.latitude, crossing.longitude,
-                sampled_coords[i][0], sampled_coords[i][1],
-                sampled_coords[i + 1][0], sampled_coords[i + 1][1]
-            )
-            min_dist = min(min_dist, dist)
-            if min_dist <= buffer_miles:
-                break
-
+    for crossing, min_dist in zip(all_crossings, min_dists):
         if min_dist <= buffer_miles:
             has_gates = crossing.gates or False
             has_lights = crossing.light or False
@@ -257,35 +239,15 @@ def search_crossings_along_route_post(
 
     all_crossings = query.all()
 
-    # Distance from point to line segment
-    def point_to_segment_distance(px, py, x1, y1, x2, y2):
-        dx = x2 - x1
-        dy = y2 - y1
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-
-        dlat = abs(px - proj_x) * 69
-        dlon = abs(py - proj_y) * 55
-        return math.sqrt(dlat ** 2 + dlon ** 2)
-
     # Filter crossings within radius
-    filtered_crossings = []
-    for crossing in all_crossings:
-        min_dist = float('inf')
-        for i in range(len(route_coords) - 1):
-            dist = point_to_segment_distance(
-                crossing.latitude, crossing.longitude,
-                route_coords[i][0], route_coords[i][1],
-                route_coords[i + 1][0], route_coords[i + 1][1]
-            )
-            min_dist = min(min_dist, dist)
-            if min_dist <= radius_miles:
-                break
+    min_dists = route_distances_miles(
+        [c.latitude for c in all_crossings],
+        [c.longitude for c in all_crossings],
+        route_coords
+    ).tolist()
 
+    filtered_crossings = []
+    for crossing, min_dist in zip(all_crossings, min_dists):
         if min_dist <= radius_miles:
             has_gates = crossing.gates or False
             has_lights = crossing.light or False
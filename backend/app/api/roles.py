@@ -14,12 +14,20 @@ from ..schemas.role import (
     CustomRole, CustomRoleCreate, CustomRoleUpdate,
     RolePermission, RolePermissionCreate, UserRoleUpdate, PermissionCheck
 )
-from ..core.permissions import require_owner, get_user_permissions, can_modify_user_role, Permissions
+from ..core.permissions import require_owner, get_user_permissions, can_modify_user_role, Permissions, ALL_PERMISSIONS
+from ..core.permission_cache import invalidate_role, publish_role_change
 from ..api.auth import get_current_user
 
 router = APIRouter()
 
 
+def _validate_permission_keys(permissions: List[RolePermissionCreate]):
+    """Reject unknown permission keys before any database work."""
+    unknown = sorted({p.permission_key for p in permissions} - ALL_PERMISSIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown permission keys: {', '.join(unknown)}")
+
+
 @router.get("/", response_model=List[CustomRole])
 def list_roles(
     db: Session = Depends(get_db),
@@ -58,6 +66,9 @@ def create_custom_role(
     Create a new custom role with permissions.
     Only the Owner can create custom roles.
     """
+    if role_data.permissions:
+        _validate_permission_keys(role_data.permissions)
+
     # Check if role name already exists
     existing = db.query(CustomRoleModel).filter(CustomRoleModel.name == role_data.name).first()
     if existing:
@@ -88,7 +99,9 @@ def create_custom_role(
             )
             db.add(role_perm)
 
+    publish_role_change(db, new_role.name)
     db.commit()
+    invalidate_role(new_role.name)
     db.refresh(new_role)
     return new_role
 
@@ -105,6 +118,9 @@ def update_custom_role(
     Only the Owner can update roles.
     System roles (owner, admin, user) cannot be modified.
     """
+    if role_update.permissions:
+        _validate_permission_keys(role_update.permissions)
+
     role = db.query(CustomRoleModel).filter(CustomRoleModel.name == role_name).first()
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
@@ -133,7 +149,11 @@ def update_custom_role(
             )
             db.add(role_perm)
 
+    if role_update.permissions is not None:
+        publish_role_change(db, role_name)
     db.commit()
+    if role_update.permissions is not None:
+        invalidate_role(role_name)
     db.refresh(role)
     return role
 
@@ -167,7 +187,9 @@ def delete_custom_role(
         )
 
     db.delete(role)
+    publish_role_change(db, role_name)
     db.commit()
+    invalidate_role(role_name)
 
     return {"message": f"Role '{role_name}' deleted successfully"}
 
@@ -239,7 +261,7 @@ def get_user_permissions_endpoint(
     return {
         "user_id": user_id,
         "role": user.role,
-        "permissions": permissions
+        "permissions": dict(permissions)
     }
 
 
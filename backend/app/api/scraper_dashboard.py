@@ -6,11 +6,12 @@ reporting and unified control over all scraper types.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from datetime import datetime, timezone
 from typing import List, Optional
 from pydantic import BaseModel
 import logging
+import time
 
 from ..core.database import get_db
 from ..models.user import User as UserModel
@@ -22,6 +23,18 @@ from .auth import get_current_user
 
 logger = logging.getLogger(__name__)
 
+# The dashboard polls /status continuously from every open tab. Polls within
+# this window share one computed payload; writes through this API drop it, and
+# scrapers updating their rows directly are picked up when it expires.
+STATUS_CACHE_TTL_SECONDS = 2
+
+_status_cache = None  # (expires_at, payload)
+
+
+def _invalidate_status_cache():
+    global _status_cache
+    _status_cache = None
+
 
 class POIStartRequest(BaseModel):
     categories: List[str] = []
@@ -106,7 +119,7 @@ def get_debug_status(db: Session = Depends(get_db)):
     Debug endpoint - no auth required.
     Returns raw scraper status for debugging.
     """
-    scrapers = db.query(ScraperStatus).all()
+    scrapers = db.query(ScraperStatus).options(undefer(ScraperStatus.last_error)).all()
     return {
         "scrapers": [
             {
@@ -142,6 +155,7 @@ def debug_reset_scraper(scraper_type: str, db: Session = Depends(get_db)):
     scraper.errors_count = 0
     scraper.consecutive_errors = 0
     db.commit()
+    _invalidate_status_cache()
     return {"success": True, "message": f"Reset {scraper_type}"}
 
 
@@ -152,8 +166,6 @@ def debug_start_scraper(
     db: Session = Depends(get_db)
 ):
     """Debug endpoint to start a scraper - no auth required."""
-    import json as json_lib
-
     scraper = db.query(ScraperStatus).filter(
         ScraperStatus.scraper_type == scraper_type
     ).first()
@@ -164,13 +176,9 @@ def debug_start_scraper(
     if scraper.status == 'running':
         return {"error": f"Scraper already running"}
 
-    # Build config - merge with existing config, only overwrite if values provided
-    existing_config = {}
-    if scraper.config:
-        try:
-            existing_config = json_lib.loads(scraper.config) if isinstance(scraper.config, str) else scraper.config
-        except (json_lib.JSONDecodeError, TypeError):
-            existing_config = {}
+    # Build config - merge with existing config, only overwrite if values provided.
+    # Copy so assigning it back registers as a change on the JSONB column.
+    existing_config = dict(scraper.config or {})
 
     if request and scraper_type == 'poi_crawler':
         # Only set categories/states if explicitly provided (non-empty)
@@ -194,9 +202,10 @@ def debug_start_scraper(
     scraper.errors_count = 0
     scraper.last_error = None
     scraper.total_runs = (scraper.total_runs or 0) + 1
-    scraper.config = json_lib.dumps(existing_config) if existing_config else None
+    scraper.config = existing_config or None
 
     db.commit()
+    _invalidate_status_cache()
     return {"success": True, "message": f"Started {scraper_type}", "config": existing_config}
 
 
@@ -220,9 +229,15 @@ def get_all_scraper_status(
     Get status of all scrapers for dashboard display.
     Returns intelligent, verbose status for each scraper type.
     """
-    scrapers = db.query(ScraperStatus).order_by(ScraperStatus.display_name).all()
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache and _status_cache[0] > now:
+        return _status_cache[1]
 
-    return {
+    # last_error is deferred; failed scrapers show it, so load it with the rows
+    scrapers = db.query(ScraperStatus).options(undefer(ScraperStatus.last_error)).order_by(ScraperStatus.display_name).all()
+
+    payload = {
         "scrapers": [scraper.to_dashboard_dict() for scraper in scrapers],
         "summary": {
             "total": len(scrapers),
@@ -232,6 +247,8 @@ def get_all_scraper_status(
             "any_running": any(s.status == 'running' for s in scrapers)
         }
     }
+    _status_cache = (now + STATUS_CACHE_TTL_SECONDS, payload)
+    return payload
 
 
 @router.get("/status/{scraper_type}")
@@ -393,7 +410,7 @@ def start_scraper(
     scraper.total_runs += 1
 
     # Store config for the scraper service to pick up
-    scraper_config = scraper.config or {}
+    scraper_config = dict(scraper.config or {})
     if scraper_type == 'poi_crawler':
         scraper_config['selected_categories'] = categories if categories else []
         scraper_config['selected_states'] = states if states else []
@@ -411,6 +428,7 @@ def start_scraper(
 
     scraper.config = scraper_config
     db.commit()
+    _invalidate_status_cache()
 
     # The master controller service (wandermage-scraper-master) will detect
     # the 'running' status and start the appropriate systemd scraper service.
@@ -462,6 +480,7 @@ def stop_scraper(
     scraper.current_detail = None
 
     db.commit()
+    _invalidate_status_cache()
 
     # TODO: Actually stop the scraper process
 
@@ -547,6 +566,7 @@ def update_scraper_status(
             scraper.avg_items_per_minute = round(scraper.items_found / elapsed_minutes, 2)
 
     db.commit()
+    _invalidate_status_cache()
 
     return {"success": True}
 
@@ -577,6 +597,7 @@ def complete_scraper(
     scraper.status = 'idle'
 
     db.commit()
+    _invalidate_status_cache()
 
     return {"success": True, "scraper": scraper.to_dashboard_dict()}
 
@@ -602,6 +623,7 @@ def fail_scraper(
     scraper.current_activity = f"Failed - {error[:100]}"
 
     db.commit()
+    _invalidate_status_cache()
 
     return {"success": True, "scraper": scraper.to_dashboard_dict()}
 
@@ -636,6 +658,7 @@ def reset_scraper(
     scraper.consecutive_errors = 0
 
     db.commit()
+    _invalidate_status_cache()
 
     return {"success": True, "message": f"Reset {scraper.display_name}", "scraper": scraper.to_dashboard_dict()}
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 from ..core.database import get_db, get_poi_db
@@ -41,8 +41,7 @@ class SerializedItemResponse(BaseModel):
     updated_at: Optional[datetime]
     google_maps_url: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 def require_admin(current_user: UserModel = Depends(get_current_user)):
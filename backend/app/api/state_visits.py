@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -29,27 +31,9 @@ def create_state_visit(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Create or update a state visit"""
-    # Check if state visit already exists for this user
-    existing = db.query(StateVisitModel).filter(
-        StateVisitModel.user_id == current_user.id,
-        StateVisitModel.state_code == state_visit.state_code.upper()
-    ).first()
-
-    if existing:
-        # Update existing visit
-        existing.visit_count = state_visit.visit_count
-        existing.nightly_stops = state_visit.nightly_stops
-        existing.monthly_stays = state_visit.monthly_stays
-        if state_visit.first_visit:
-            existing.first_visit = state_visit.first_visit
-        if state_visit.last_visit:
-            existing.last_visit = state_visit.last_visit
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    # Create new state visit
-    db_state_visit = StateVisitModel(
+    # Single upsert on (user_id, state_code); an existing visit keeps its
+    # dates unless new ones are given
+    stmt = insert(StateVisitModel).values(
         user_id=current_user.id,
         state_code=state_visit.state_code.upper(),
         state_name=state_visit.state_name,
@@ -59,7 +43,19 @@ def create_state_visit(
         first_visit=state_visit.first_visit,
         last_visit=state_visit.last_visit
     )
-    db.add(db_state_visit)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[StateVisitModel.user_id, StateVisitModel.state_code],
+        set_={
+            'visit_count': stmt.excluded.visit_count,
+            'nightly_stops': stmt.excluded.nightly_stops,
+            'monthly_stays': stmt.excluded.monthly_stays,
+            'first_visit': func.coalesce(stmt.excluded.first_visit, StateVisitModel.first_visit),
+            'last_visit': func.coalesce(stmt.excluded.last_visit, StateVisitModel.last_visit),
+            'updated_at': func.now(),
+        }
+    ).returning(StateVisitModel)
+
+    db_state_visit = db.scalars(stmt).one()
     db.commit()
     db.refresh(db_state_visit)
     return db_state_visit
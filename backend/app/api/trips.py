@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Numeric, cast, delete, func, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from typing import List, Optional
 from geoalchemy2.elements import WKTElement
 from geopy.distance import geodesic
@@ -8,12 +9,17 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from ..core.database import get_db
+from ..core.geo import cumulative_route_miles
 from ..models.trip import Trip as TripModel, TripStop as TripStopModel, RouteNote as RouteNoteModel, GapSuggestion as GapSuggestionModel
 from ..models.user import User as UserModel
-from ..schemas.trip import Trip, TripCreate, TripUpdate, TripStop, TripStopCreate, RouteNote, RouteNoteCreate
+from ..schemas import TripListAdapter, TripStopListAdapter
+from ..schemas.trip import Trip, TripStatus, TripCreate, TripUpdate, TripStop, TripStopCreate, RouteNote, RouteNoteCreate
 from .auth import get_current_user
-from ..services.trip_planning_service import plan_trip_route, get_route_geometry_sync, get_layered_isochrones, get_route_distance, get_route_preferences
+from ..services.trip_planning_service import plan_trip_route, get_route_geometry_sync, get_route_polyline_sync, get_layered_isochrones, get_route_distance, get_route_preferences
 import asyncio
+import hashlib
+import json
+import numpy as np
 from ..services.trip_map_service import generate_trip_map, delete_trip_map, get_trip_map_url
 from ..services.stop_categorizer import detect_category, get_category_icon, get_category_color
 
@@ -116,24 +122,28 @@ class TripPlanResponse(BaseModel):
     gap_suggestions: List[GapSuggestion] = []
 
 
-def calculate_trip_distance(stops: List[TripStopModel]) -> float:
-    """Calculate total distance of a trip based on stops"""
-    if len(stops) < 2:
-        return 0.0
+METERS_PER_MILE = 1609.344
 
-    total_distance = 0.0
-    for i in range(len(stops) - 1):
-        # Extract coordinates from geography type
-        start = stops[i]
-        end = stops[i + 1]
 
-        # Assuming latitude/longitude are stored separately for easier access
-        if hasattr(start, 'latitude') and hasattr(end, 'latitude'):
-            start_coords = (start.latitude, start.longitude)
-            end_coords = (end.latitude, end.longitude)
-            total_distance += geodesic(start_coords, end_coords).miles
-
-    return round(total_distance, 2)
+def update_trip_distance(db: Session, trip_id: int) -> None:
+    """
+    Set a trip's total_distance_miles to the geodesic length of its stops in
+    stop order, computed by PostGIS (ST_MakeLine + geography ST_Length) in the
+    same UPDATE instead of loading the stops and summing pairs in Python.
+    Does not commit.
+    """
+    line = func.ST_MakeLine(aggregate_order_by(func.geometry(TripStopModel.location), TripStopModel.stop_order))
+    meters = (
+        select(func.ST_Length(func.geography(line)))
+        .where(TripStopModel.trip_id == trip_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(TripModel)
+        .where(TripModel.id == trip_id)
+        .values(total_distance_miles=func.coalesce(func.round(cast(meters / METERS_PER_MILE, Numeric), 2), 0))
+        .execution_options(synchronize_session=False)
+    )
 
 
 @router.post("/", response_model=Trip)
@@ -178,7 +188,7 @@ def create_trip(
 def get_trips(
     skip: int = 0,
     limit: int = 100,
-    status: str = None,
+    status: Optional[TripStatus] = None,
     db: Session = Depends(get_db),
     current_user: UserModel = Depends(get_current_user)
 ):
@@ -207,7 +217,35 @@ def get_trips(
     if updated:
         db.commit()
 
-    return trips
+    trips = TripListAdapter.validate_python(trips, from_attributes=True)
+    return Response(TripListAdapter.dump_json(trips), media_type="application/json")
+
+
+def compute_gap_analysis_hash(stops, max_daily_miles, start_date, include_isochrones: bool) -> str:
+    """
+    Hash the inputs that determine a trip's gap analysis.
+    If the hash is unchanged, the previously saved analysis is still valid.
+    """
+    payload = [[s.id, s.latitude, s.longitude, s.stop_order] for s in stops] + [
+        max_daily_miles,
+        start_date.isoformat() if start_date else None,
+        include_isochrones
+    ]
+    return hashlib.blake2b(
+        json.dumps(payload, separators=(',', ':')).encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+def _get_user_trip(db: Session, trip_id: int, user_id: int) -> Optional[TripModel]:
+    """
+    Load a trip owned by user_id, or None.
+    Nearly every trip endpoint starts with this lookup, so it is a lambda
+    statement: the SELECT is built and cache-keyed once, and later calls
+    only rebind trip_id/user_id.
+    """
+    stmt = lambda_stmt(lambda: select(TripModel).where(TripModel.id == trip_id, TripModel.user_id == user_id))
+    return db.scalars(stmt).first()
 
 
 def compute_trip_status(trip, db) -> tuple:
@@ -250,10 +288,7 @@ def get_trip(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get trip by ID"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -300,10 +335,7 @@ def update_trip(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Update trip and auto-match Harvest Hosts stays if dates changed"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -342,10 +374,7 @@ def delete_trip(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Delete trip and all associated data (stops, weather forecasts, gap suggestions, notes)"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -380,10 +409,7 @@ def add_trip_stop(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Add a stop to a trip"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -402,19 +428,15 @@ def add_trip_stop(
     stop = TripStopModel(
         **stop_dict,
         trip_id=trip_id,
-        latitude=stop_data.latitude,
-        longitude=stop_data.longitude,
         location=WKTElement(point_wkt, srid=4326)
     )
 
     db.add(stop)
+    db.flush()
+    update_trip_distance(db, trip_id)
     db.commit()
     db.refresh(stop)
 
-    # Recalculate trip distance
-    trip.total_distance_miles = calculate_trip_distance(trip.stops)
-    db.commit()
-
     return stop
 
 
@@ -425,15 +447,13 @@ def get_trip_stops(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get all stops for a trip"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    return trip.stops
+    stops = TripStopListAdapter.validate_python(trip.stops, from_attributes=True)
+    return Response(TripStopListAdapter.dump_json(stops), media_type="application/json")
 
 
 @router.delete("/{trip_id}/stops/{stop_id}")
@@ -444,10 +464,7 @@ def delete_trip_stop(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Delete a trip stop"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -461,10 +478,8 @@ def delete_trip_stop(
         raise HTTPException(status_code=404, detail="Stop not found")
 
     db.delete(stop)
-    db.commit()
-
-    # Recalculate trip distance
-    trip.total_distance_miles = calculate_trip_distance(trip.stops)
+    db.flush()
+    update_trip_distance(db, trip_id)
     db.commit()
 
     return {"message": "Stop deleted successfully"}
@@ -479,10 +494,7 @@ def add_route_note(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Add a note along the route"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -492,8 +504,6 @@ def add_route_note(
     note = RouteNoteModel(
         **note_data.model_dump(exclude={'latitude', 'longitude'}),
         trip_id=trip_id,
-        latitude=note_data.latitude,
-        longitude=note_data.longitude,
         location=WKTElement(point_wkt, srid=4326)
     )
 
@@ -511,10 +521,7 @@ def get_route_notes(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Get all route notes for a trip"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -530,10 +537,7 @@ def delete_route_note(
     current_user: UserModel = Depends(get_current_user)
 ):
     """Delete a route note"""
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -704,8 +708,6 @@ def plan_and_create_trip(
             address=plan_data.start.address,
             city=plan_data.start.city,
             state=plan_data.start.state,
-            latitude=plan_data.start.latitude,
-            longitude=plan_data.start.longitude,
             location=WKTElement(start_point, srid=4326),
             departure_time=plan_data.departure_datetime,
             is_overnight=False
@@ -724,8 +726,6 @@ def plan_and_create_trip(
                     address=wp.address,
                     city=wp.city,
                     state=wp.state,
-                    latitude=wp.latitude,
-                    longitude=wp.longitude,
                     location=WKTElement(point_wkt, srid=4326),
                     is_overnight=True,
                     notes=f"Source: {wp.source}" if wp.source else None
@@ -759,8 +759,6 @@ def plan_and_create_trip(
             address=plan_data.destination.address,
             city=plan_data.destination.city,
             state=plan_data.destination.state,
-            latitude=plan_data.destination.latitude,
-            longitude=plan_data.destination.longitude,
             location=WKTElement(dest_point, srid=4326),
             arrival_time=result["estimated_arrival"],
             is_overnight=False
@@ -808,10 +806,7 @@ def regenerate_trip_map(
     """
     Regenerate the map image for an existing trip.
     """
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -850,11 +845,10 @@ def analyze_trip_gaps(
     Analyze gaps between stops in a trip to identify segments that exceed daily driving limits.
     Returns suggestions for additional stops where gaps are too long.
     Results are automatically saved to the database for instant loading.
+    If the stops, daily limit and start date are unchanged since the last saved
+    analysis, that analysis is returned without any routing or geocoding calls.
     """
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -885,6 +879,11 @@ def analyze_trip_gaps(
     max_daily_miles = driver_prefs.get('daily_miles_target', 300)
     max_driving_hours = driver_prefs.get('max_driving_hours', 8.0)
 
+    # Reuse the saved analysis if nothing that affects it has changed
+    analysis_hash = compute_gap_analysis_hash(stops, max_daily_miles, trip.start_date, include_isochrones)
+    if save and trip.gap_analysis_hash == analysis_hash and trip.gap_analysis_result:
+        return trip.gap_analysis_result
+
     gaps = []
     total_distance = 0
     max_segment = 0
@@ -951,6 +950,12 @@ def analyze_trip_gaps(
                 import logging
                 logging.getLogger(__name__).warning(f"Failed to get route geometry: {e}, using linear interpolation")
 
+            # Cumulative miles along the route, computed once for all of this
+            # segment's suggested stops
+            route_miles = None
+            if route_coords and len(route_coords) > 2:
+                route_miles = cumulative_route_miles(route_coords)
+
             # Generate each suggested stop
             for stop_num in range(1, num_stops_needed + 1):
                 # Each gap stop represents one day of travel
@@ -971,25 +976,16 @@ def analyze_trip_gaps(
                 stop_lon = start.longitude + (end.longitude - start.longitude) * fraction
 
                 # Try to find point on actual route
-                if route_coords and len(route_coords) > 2:
-                    accumulated = 0
-                    for j in range(len(route_coords) - 1):
-                        point1 = route_coords[j]
-                        point2 = route_coords[j + 1]
-                        leg_distance = geodesic(
-                            (point1[0], point1[1]),
-                            (point2[0], point2[1])
-                        ).miles
-
-                        if accumulated + leg_distance >= target_distance:
-                            # Interpolate within this leg
-                            remaining = target_distance - accumulated
-                            leg_fraction = remaining / leg_distance if leg_distance > 0 else 0
-                            stop_lat = point1[0] + (point2[0] - point1[0]) * leg_fraction
-                            stop_lon = point1[1] + (point2[1] - point1[1]) * leg_fraction
-                            break
-
-                        accumulated += leg_distance
+                if route_miles is not None:
+                    k = int(np.searchsorted(route_miles, target_distance))
+                    if 0 < k < len(route_miles):
+                        # Interpolate within the leg ending at point k
+                        leg_distance = route_miles[k] - route_miles[k - 1]
+                        remaining = target_distance - route_miles[k - 1]
+                        leg_fraction = remaining / leg_distance if leg_distance > 0 else 0
+                        point1, point2 = route_coords[k - 1], route_coords[k]
+                        stop_lat = point1[0] + (point2[0] - point1[0]) * leg_fraction
+                        stop_lon = point1[1] + (point2[1] - point1[1]) * leg_fraction
 
                 gap = {
                     "from_stop": start.name,
@@ -1041,7 +1037,11 @@ def analyze_trip_gaps(
     if save:
         from datetime import datetime as dt
         # Delete existing gap suggestions for this trip
-        db.query(GapSuggestionModel).filter(GapSuggestionModel.trip_id == trip_id).delete()
+        db.execute(
+            delete(GapSuggestionModel)
+            .where(GapSuggestionModel.trip_id == trip_id)
+            .execution_options(synchronize_session=False)
+        )
 
         # Save new gap suggestions
         for i, gap in enumerate(gaps):
@@ -1058,9 +1058,7 @@ def analyze_trip_gaps(
             )
             db.add(gap_model)
 
-        db.commit()
-
-    return {
+    result = {
         "gaps": gaps,
         "total_distance": round(total_distance, 1),
         "max_segment_distance": round(max_segment, 1),
@@ -1070,6 +1068,13 @@ def analyze_trip_gaps(
         "daily_miles_limit": max_daily_miles
     }
 
+    if save:
+        trip.gap_analysis_hash = analysis_hash
+        trip.gap_analysis_result = result
+        db.commit()
+
+    return result
+
 
 @router.get("/{trip_id}/gap-suggestions")
 def get_saved_gap_suggestions(
@@ -1082,32 +1087,43 @@ def get_saved_gap_suggestions(
     Returns pre-calculated gap suggestions from the database for instant loading.
     If no saved suggestions exist, returns an empty list.
     """
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    # Get saved gap suggestions
-    saved_gaps = db.query(GapSuggestionModel).filter(
-        GapSuggestionModel.trip_id == trip_id
-    ).order_by(GapSuggestionModel.position_after_stop).all()
+    # Get saved gap suggestions as plain rows (only the serialized columns,
+    # no ORM instances or identity-map bookkeeping)
+    saved_gaps = db.execute(
+        select(
+            GapSuggestionModel.latitude,
+            GapSuggestionModel.longitude,
+            GapSuggestionModel.radius_miles,
+            GapSuggestionModel.estimated_date,
+            GapSuggestionModel.day_number,
+            GapSuggestionModel.distance_from_previous_miles,
+            GapSuggestionModel.state,
+            GapSuggestionModel.position_after_stop
+        )
+        .where(GapSuggestionModel.trip_id == trip_id)
+        .order_by(GapSuggestionModel.position_after_stop)
+    ).all()
 
     # Convert to response format matching analyze-gaps output
-    gaps = []
-    for gap in saved_gaps:
-        gaps.append({
-            "suggested_latitude": gap.latitude,
-            "suggested_longitude": gap.longitude,
-            "search_radius_miles": gap.radius_miles,
-            "estimated_date": gap.estimated_date.isoformat() if gap.estimated_date else None,
-            "day_number": gap.day_number,
-            "segment_distance": gap.distance_from_previous_miles,
-            "suggested_state": gap.state,
-            "position": gap.position_after_stop
-        })
+    gaps = [
+        {
+            "suggested_latitude": latitude,
+            "suggested_longitude": longitude,
+            "search_radius_miles": radius_miles,
+            "estimated_date": estimated_date.isoformat() if estimated_date else None,
+            "day_number": day_number,
+            "segment_distance": distance_from_previous_miles,
+            "suggested_state": state,
+            "position": position_after_stop
+        }
+        for (latitude, longitude, radius_miles, estimated_date, day_number,
+             distance_from_previous_miles, state, position_after_stop) in saved_gaps
+    ]
 
     return {
         "gaps": gaps,
@@ -1119,17 +1135,19 @@ def get_saved_gap_suggestions(
 @router.get("/{trip_id}/route")
 def get_trip_route(
     trip_id: int,
+    encoded: bool = False,
     db: Session = Depends(get_db),
     current_user: UserModel = Depends(get_current_user)
 ):
     """
     Get the route polyline coordinates for a trip.
     Returns coordinates that follow actual roads via OSRM routing.
+
+    With encoded=true, returns OSRM's encoded polyline (precision 6) as
+    route_encoded instead of a decoded coordinate list, for clients that
+    decode it themselves.
     """
-    trip = db.query(TripModel).filter(
-        TripModel.id == trip_id,
-        TripModel.user_id == current_user.id
-    ).first()
+    trip = _get_user_trip(db, trip_id, current_user.id)
 
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -1146,6 +1164,13 @@ def get_trip_route(
     # Build list of waypoints
     points = [(stop.latitude, stop.longitude) for stop in stops]
 
+    if encoded:
+        route_encoded = get_route_polyline_sync(points)
+        if route_encoded:
+            return {"route_encoded": route_encoded, "precision": 6}
+        # Fallback to straight lines between stops
+        return {"route": [[p[0], p[1]] for p in points]}
+
     # Get actual route geometry from OSRM
     try:
         route_coords = get_route_geometry_sync(points)
@@ -4,24 +4,29 @@ User Preferences API
 Handles saving and loading user preferences for map settings, layers, UI state, etc.
 """
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import cast, func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import json
 
-from ..core.database import SessionLocal
+from ..core.database import get_db
 from ..models.user import User as UserModel
 from .auth import get_current_user
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def _write_preferences(db: Session, user_id: int, new_value) -> None:
+    """Single server-side UPDATE of the preferences blob (no read-modify-write)."""
+    db.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(preferences=new_value)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
 
 
 class UserPreferencesUpdate(BaseModel):
@@ -92,17 +97,14 @@ async def update_user_preferences(
 
     Use this to batch-update multiple preferences at once.
     """
-    user = db.query(UserModel).filter(UserModel.id == current_user.id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    user.preferences = update_data.preferences
+    # current_user shares this request's session (same get_db dependency),
+    # so no re-query is needed and the new value is already known.
+    current_user.preferences = update_data.preferences
     db.commit()
-    db.refresh(user)
 
     return {
         "message": "Preferences updated successfully",
-        "preferences": user.preferences
+        "preferences": update_data.preferences
     }
 
 
@@ -118,21 +120,13 @@ async def save_user_preference(
     Updates or creates a specific preference without affecting others.
     Perfect for incremental updates like toggling a map layer.
     """
-    user = db.query(UserModel).filter(UserModel.id == current_user.id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Get existing preferences or create empty dict
-    preferences = dict(user.preferences) if user.preferences else {}
-
-    # Update the specific key
-    preferences[save_data.key] = save_data.value
-
-    # Save back to database - create new dict to ensure SQLAlchemy detects change
-    user.preferences = preferences
-    flag_modified(user, 'preferences')
-    db.commit()
-    db.refresh(user)
+    # Set the key in place with jsonb_set instead of rewriting the whole blob
+    _write_preferences(db, current_user.id, func.jsonb_set(
+        UserModel.preferences,
+        array([save_data.key]),
+        cast(literal(json.dumps(save_data.value)), JSONB),
+        True,
+    ))
 
     return {
         "message": f"Preference '{save_data.key}' saved successfully",
@@ -150,23 +144,13 @@ async def delete_user_preference(
     """
     Delete a specific preference by key.
     """
-    user = db.query(UserModel).filter(UserModel.id == current_user.id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    preferences = dict(user.preferences) if user.preferences else {}
+    preferences = current_user.preferences or {}
 
     if key not in preferences:
         raise HTTPException(status_code=404, detail=f"Preference '{key}' not found")
 
-    # Remove the key
-    del preferences[key]
-
-    # Save back to database - create new dict to ensure SQLAlchemy detects change
-    user.preferences = preferences
-    flag_modified(user, 'preferences')
-    db.commit()
-    db.refresh(user)
+    # Remove the key server-side with the jsonb "-" operator
+    _write_preferences(db, current_user.id, UserModel.preferences.op('-')(key))
 
     return {
         "message": f"Preference '{key}' deleted successfully"
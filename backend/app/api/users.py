@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -24,7 +25,21 @@ def get_users(
             status_code=403,
             detail="Only administrators can list all users"
         )
-    users = db.query(UserModel).offset(skip).limit(limit).all()
+    # Fetch only the columns the User schema serializes (no ORM hydration)
+    users = db.execute(
+        select(
+            UserModel.id,
+            UserModel.username,
+            UserModel.email,
+            UserModel.full_name,
+            UserModel.is_active,
+            UserModel.is_admin,
+            UserModel.role,
+            UserModel.created_at
+        )
+        .offset(skip)
+        .limit(limit)
+    ).all()
     return users
 
 
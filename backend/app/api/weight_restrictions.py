@@ -4,17 +4,19 @@ Weight Restrictions API Endpoints
 Provides API for fetching bridge and road weight restrictions for RV safety
 """
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
 from typing import Optional
 
 from ..core.database import get_road_db
+from ..core.geo import route_distances_miles
 from ..models.poi import WeightRestriction as WeightRestrictionModel
 
 router = APIRouter()
 
 
-@router.get("/bbox-search")
+@router.get("/bbox-search", response_class=ORJSONResponse)
 def search_weight_restrictions_by_bbox(
     south: float = Query(..., description="Southern latitude"),
     west: float = Query(..., description="Western longitude"),
@@ -58,8 +60,7 @@ def search_weight_restrictions_by_bbox(
                 "latitude": restriction.latitude,
                 "longitude": restriction.longitude,
                 "weight_tons": restriction.weight_tons,
-                "weight_lbs": restriction.weight_lbs or (restriction.weight_tons * 2000 if restriction.weight_tons else None),
-                "weight_display": f"{restriction.weight_tons:.1f} tons" if restriction.weight_tons else None,
+                "weight_lbs": restriction.weight_lbs,
                 "road_name": restriction.road_name,
                 "restriction_type": restriction.restriction_type,
                 "applies_to": restriction.applies_to,
@@ -82,7 +83,7 @@ def search_weight_restrictions_by_bbox(
         }
 
 
-@router.get("/along-route")
+@router.get("/along-route", response_class=ORJSONResponse)
 def get_weight_restrictions_along_route(
     route_coords: str = Query(..., description="JSON array of [lat,lon] coordinate pairs"),
     buffer_miles: float = Query(3.0, le=10.0, description="Buffer distance from route in miles"),
@@ -96,6 +97,7 @@ def get_weight_restrictions_along_route(
     """
     import json
     import math
+    import numpy as np
 
     try:
         coords = json.loads(route_coords)
@@ -106,27 +108,27 @@ def get_weight_restrictions_along_route(
     if not coords or len(coords) < 2:
         return {"count": 0, "restrictions": []}
 
-    # Sample route points for efficiency
-    sampled_coords = [coords[0]]
-    last_lat, last_lon = coords[0]
-
-    for coord in coords[1:]:
-        lat, lon = coord
-        dlat = abs(lat - last_lat)
-        dlon = abs(lon - last_lon)
-        dist = math.sqrt((dlat * 69) ** 2 + (dlon * 55) ** 2)
-        if dist >= 0.5:
-            sampled_coords.append(coord)
-            last_lat, last_lon = coord
-
-    if sampled_coords[-1] != coords[-1]:
-        sampled_coords.append(coords[-1])
-
-    # Get bounding box with buffer
+    # Miles per degree, with longitude scaled by the route's mean latitude
+    # (a fixed 55 mi/deg is only accurate near 37N)
     lats = [c[0] for c in coords]
     lons = [c[1] for c in coords]
-    lat_buffer = buffer_miles / 69.0
-    lon_buffer = buffer_miles / 55.0
+    mean_lat = sum(lats) / len(lats)
+    LAT_MI = 69.0
+    LON_MI = 69.172 * math.cos(math.radians(mean_lat))
+
+    # Sample route points for efficiency: keep one point per 0.5 miles of
+    # cumulative arc length (plus the endpoint), computed in a single
+    # vectorized pass instead of a Python loop over every coordinate
+    arr = np.asarray(coords, dtype=float)
+    seg_miles = np.hypot(np.diff(arr[:, 0]) * LAT_MI, np.diff(arr[:, 1]) * LON_MI)
+    cum_miles = np.concatenate(([0.0], np.cumsum(seg_miles)))
+    sample_idx = np.searchsorted(cum_miles, np.arange(0.0, cum_miles[-1], 0.5))
+    sample_idx = np.unique(np.append(sample_idx, len(arr) - 1))
+    sampled_coords = arr[sample_idx].tolist()
+
+    # Get bounding box with buffer
+    lat_buffer = buffer_miles / LAT_MI
+    lon_buffer = buffer_miles / LON_MI
 
     south = min(lats) - lat_buffer
     north = max(lats) + lat_buffer
@@ -154,31 +156,14 @@ def get_weight_restrictions_along_route(
         return {"count": 0, "restrictions": []}
 
     # Filter to only restrictions within buffer of route
-    def point_to_segment_distance(px, py, x1, y1, x2, y2):
-        dx = x2 - x1
-        dy = y2 - y1
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-        dlat = abs(px - proj_x) * 69
-        dlon = abs(py - proj_y) * 55
-        return math.sqrt(dlat ** 2 + dlon ** 2)
+    min_dists = route_distances_miles(
+        [r.latitude for r in all_restrictions],
+        [r.longitude for r in all_restrictions],
+        sampled_coords, LAT_MI, LON_MI
+    ).tolist()
 
     filtered = []
-    for restriction in all_restrictions:
-        min_dist = float('inf')
-        for i in range(len(sampled_coords) - 1):
-            dist = point_to_segment_distance(
-                restriction.latitude, restriction.longitude,
-                sampled_coords[i][0], sampled_coords[i][1],
-                sampled_coords[i + 1][0], sampled_coords[i + 1][1]
-            )
-            min_dist = min(min_dist, dist)
-            if min_dist <= buffer_miles:
-                break
-
+    for restriction, min_dist in zip(all_restrictions, min_dists):
         if min_dist <= buffer_miles:
             # Check if this restriction applies to the RV weight
             is_hazard = False
@@ -191,8 +176,7 @@ def get_weight_restrictions_along_route(
                 "latitude": restriction.latitude,
                 "longitude": restriction.longitude,
                 "weight_tons": restriction.weight_tons,
-                "weight_lbs": restriction.weight_lbs or (restriction.weight_tons * 2000 if restriction.weight_tons else None),
-                "weight_display": f"{restriction.weight_tons:.1f} tons" if restriction.weight_tons else None,
+                "weight_lbs": restriction.weight_lbs,
                 "road_name": restriction.road_name,
                 "restriction_type": restriction.restriction_type,
                 "applies_to": restriction.applies_to,
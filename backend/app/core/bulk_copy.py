@@ -0,0 +1,110 @@
+"""
+COPY-based bulk upserts for large road hazard imports.
+
+Rows are streamed into a temporary staging table with COPY FROM STDIN, then
+merged into the real table with one INSERT ... SELECT ... ON CONFLICT. This
+avoids a SELECT and an INSERT per row, and geography points are sent as
+hex EWKB so Postgres does not parse WKT for each row.
+
+Requires the psycopg2 driver (copy_expert).
+"""
+import io
+import struct
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Little-endian EWKB point header with the SRID flag set
+_EWKB_POINT = 0x20000001
+
+
+def ewkb_point(lon: float, lat: float, srid: int = 4326) -> bytes:
+    """EWKB for a POINT, decoded server-side by ST_GeomFromEWKB."""
+    return struct.pack('<BIIdd', 1, _EWKB_POINT, srid, lon, lat)
+
+
+def ewkb_point_hex(lon: float, lat: float, srid: int = 4326) -> str:
+    """Hex EWKB for a POINT, accepted directly by geometry/geography input."""
+    return ewkb_point(lon, lat, srid).hex()
+
+
+def _copy_value(value) -> str:
+    """Format one value for COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def copy_upsert(
+    session: Session,
+    model,
+    rows: List[Dict],
+    conflict_column: str,
+    update_columns: Sequence[str],
+    keep_existing_on_null: Sequence[str] = ()
+) -> Tuple[int, int]:
+    """
+    Upsert rows (dicts with identical keys) into model's table via COPY.
+
+    Existing rows, matched on conflict_column, only have update_columns
+    rewritten, and only when one of them actually changed. A NULL for a
+    column in keep_existing_on_null leaves the stored value in place. Rows
+    repeating a conflict_column value within the batch are collapsed to one.
+    Does not commit. Returns (inserted, updated).
+    """
+    if not rows:
+        return 0, 0
+
+    table = model.__table__
+    columns = list(rows[0].keys())
+    column_list = ', '.join(columns)
+    staging = f"_copy_{table.name}"
+
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join(_copy_value(row[c]) for c in columns))
+        buf.write('\n')
+    buf.seek(0)
+
+    # Created in the caller's transaction, so a rollback also removes it
+    session.execute(text(
+        f"CREATE TEMP TABLE {staging} AS SELECT {column_list} FROM {table.name} WITH NO DATA"
+    ))
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buf)
+    finally:
+        cursor.close()
+
+    def incoming_value(c):
+        if c in keep_existing_on_null:
+            return f"COALESCE(EXCLUDED.{c}, {table.name}.{c})"
+        return f"EXCLUDED.{c}"
+
+    assignments = [f"{c} = {incoming_value(c)}" for c in update_columns]
+    if 'updated_at' in table.c:
+        assignments.append("updated_at = now()")
+    existing = ', '.join(f"{table.name}.{c}" for c in update_columns)
+    incoming = ', '.join(incoming_value(c) for c in update_columns)
+
+    result = session.execute(text(f"""
+        INSERT INTO {table.name} ({column_list})
+        SELECT DISTINCT ON ({conflict_column}) {column_list} FROM {staging}
+        ON CONFLICT ({conflict_column}) DO UPDATE SET {', '.join(assignments)}
+        WHERE ROW({existing}) IS DISTINCT FROM ROW({incoming})
+        RETURNING (xmax = 0) AS inserted
+    """))
+    flags = [inserted for (inserted,) in result]
+    session.execute(text(f"DROP TABLE {staging}"))
+
+    inserted = sum(flags)
+    return inserted, len(flags) - inserted
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
 
@@ -11,6 +11,12 @@ class Settings(BaseSettings):
     POI_DATABASE_URL: str = ""  # POI database (campgrounds, fuel stations, etc.)
     ROAD_DATABASE_URL: str = ""  # Road hazards database (overpass heights, railroad crossings)
 
+    # Use asyncpg + AsyncSession for the async-converted routes (POI bbox search)
+    ASYNC_DB: bool = False
+
+    # Optional Redis for shared caches (e.g. custom-role permissions); in-process cache if empty
+    REDIS_URL: str = ""
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -27,8 +33,7 @@ class Settings(BaseSettings):
     SSL_CERTFILE: str = "ssl/cert.pem"
     SSL_KEYFILE: str = "ssl/key.pem"
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
     @property
     def cors_origins_list(self) -> List[str]:
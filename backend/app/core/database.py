@@ -1,111 +1,225 @@
-from sqlalchemy import create_engine
+import logging
+
+from sqlalchemy import LargeBinary, bindparam, create_engine, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
 from .config import settings
 
-# Industry-standard connection pool settings
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=5,  # Number of persistent connections
-    max_overflow=10,  # Number of connections that can be created beyond pool_size
-    pool_timeout=30,  # Timeout in seconds to get a connection from the pool
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    pool_pre_ping=True,  # Test connections before using them (prevents stale connections)
-    echo=settings.DEBUG,
-    connect_args={
-        "options": "-c timezone=utc",
-        "connect_timeout": 10,  # Connection timeout in seconds
-    }
-)
+logger = logging.getLogger(__name__)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# POI Database engine (separate database for POI data)
+def _create_engine(url: str, pool_size: int, max_overflow: int, pre_ping: bool = False):
+    """Create an engine with the standard connection pool settings.
+
+    Stale connections are bounded by pool_recycle and detected by TCP
+    keepalives, so pre-ping (a SELECT 1 on every checkout) is off by default.
+    """
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=pool_size,  # Number of persistent connections
+        max_overflow=max_overflow,  # Number of connections that can be created beyond pool_size
+        pool_timeout=30,  # Timeout in seconds to get a connection from the pool
+        pool_recycle=1800,  # Recycle connections after 30 minutes
+        pool_pre_ping=pre_ping,  # Test connections before using them
+        echo=settings.DEBUG,
+        connect_args={
+            "options": "-c timezone=utc",
+            "connect_timeout": 10,  # Connection timeout in seconds
+            # Detect dead TCP connections out-of-band instead of per checkout
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        }
+    )
+
+
+# POI and road hazard data may live in separate databases; when they share the
+# main DATABASE_URL (the default), all three reuse one engine and pool instead
+# of holding three independent pools open against the same server.
 poi_database_url = settings.POI_DATABASE_URL or settings.DATABASE_URL
-poi_engine = create_engine(
-    poi_database_url,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=3600,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-    connect_args={
-        "options": "-c timezone=utc",
-        "connect_timeout": 10,
-    }
+road_database_url = settings.ROAD_DATABASE_URL or settings.DATABASE_URL
+_shares_poi = poi_database_url == settings.DATABASE_URL
+_shares_road = road_database_url == settings.DATABASE_URL
+
+# Size the main pool for whatever traffic it absorbs from the shared databases
+engine = _create_engine(
+    settings.DATABASE_URL,
+    pool_size=5 + (5 if _shares_poi else 0) + (3 if _shares_road else 0),
+    max_overflow=10 + (10 if _shares_poi else 0) + (5 if _shares_road else 0)
 )
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-POISessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=poi_engine)
+# POI Database engine (separate database for POI data)
+if _shares_poi:
+    poi_engine = engine
+    POISessionLocal = SessionLocal
+else:
+    poi_engine = _create_engine(poi_database_url, pool_size=5, max_overflow=10)
+    POISessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=poi_engine)
 
 # Road Hazards Database engine (overpass heights, railroad crossings, weight restrictions)
-road_database_url = settings.ROAD_DATABASE_URL or settings.DATABASE_URL
-road_engine = create_engine(
-    road_database_url,
-    poolclass=QueuePool,
-    pool_size=3,  # Smaller pool for road data (less frequent access)
-    max_overflow=5,
-    pool_timeout=30,
-    pool_recycle=3600,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-    connect_args={
-        "options": "-c timezone=utc",
-        "connect_timeout": 10,
-    }
-)
+if _shares_road:
+    road_engine = engine
+    RoadSessionLocal = SessionLocal
+else:
+    # Smaller pool for road data (less frequent access); a separate host may sit
+    # behind a less reliable network hop, so keep pre-ping on here
+    road_engine = _create_engine(road_database_url, pool_size=3, max_overflow=5, pre_ping=True)
+    RoadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=road_engine)
 
-RoadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=road_engine)
+# Async POI engine (asyncpg) for the per-map-pan POI routes, behind the ASYNC_DB flag.
+# The sync engines above remain the default and are still used for migrations/scripts.
+def _async_url(url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver."""
+    return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1).replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+if settings.ASYNC_DB:
+    async_poi_engine = create_async_engine(
+        _async_url(poi_database_url),
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_recycle=1800,
+        echo=settings.DEBUG,
+        connect_args={
+            "server_settings": {"timezone": "utc"},
+            "timeout": 10,
+        }
+    )
+    AsyncPOISessionLocal = async_sessionmaker(async_poi_engine, autoflush=False, expire_on_commit=False)
+else:
+    async_poi_engine = None
+    AsyncPOISessionLocal = None
 
 Base = declarative_base()
 POIBase = declarative_base()  # Separate base for POI models
 RoadBase = declarative_base()  # Separate base for road hazard models
 
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+class BulkInsertMixin:
+    """Adds a Core executemany insert for ingestion tables."""
+
+    @classmethod
+    def bulk_insert(cls, session, rows, chunk_size: int = BULK_INSERT_CHUNK_SIZE, ewkb_columns=()) -> int:
+        """
+        Insert a list of column dicts in chunks without building ORM objects.
+        Column defaults apply; ORM events and relationship cascades do not.
+        Values of spatial columns named in ewkb_columns must be EWKB bytes
+        (see bulk_copy.ewkb_point); they are decoded with ST_GeomFromEWKB
+        instead of parsing WKT text for every row.
+        Does not commit.
+        """
+        stmt = insert(cls)
+        if ewkb_columns:
+            # A VALUES bind can't share its column's name, so the bytes are
+            # passed under <column>_ewkb
+            stmt = stmt.values({
+                c: func.ST_GeomFromEWKB(bindparam(f"{c}_ewkb", type_=LargeBinary))
+                for c in ewkb_columns
+            })
+            rows = [
+                {f"{k}_ewkb" if k in ewkb_columns else k: v for k, v in row.items()}
+                for row in rows
+            ]
+        for i in range(0, len(rows), chunk_size):
+            session.execute(stmt, rows[i:i + chunk_size])
+        return len(rows)
 
-def get_db():
+    @classmethod
+    def bulk_insert_or_skip(cls, session, rows, chunk_size: int = BULK_INSERT_CHUNK_SIZE, ewkb_columns=()) -> int:
+        """
+        Like bulk_insert, but one bad row doesn't abort the batch: if the
+        executemany fails, its savepoint is rolled back and the rows are
+        retried one at a time, logging and skipping the ones that fail.
+        Returns the number of rows inserted. Does not commit.
+        """
+        try:
+            with session.begin_nested():
+                return cls.bulk_insert(session, rows, chunk_size, ewkb_columns)
+        except Exception as e:
+            logger.warning(f"Bulk insert into {cls.__tablename__} failed ({e}); retrying row by row")
+
+        inserted = 0
+        for row in rows:
+            try:
+                with session.begin_nested():
+                    cls.bulk_insert(session, [row], chunk_size, ewkb_columns)
+                inserted += 1
+            except Exception as e:
+                logger.error(f"Skipping {cls.__tablename__} row {row.get('external_id', '')}: {e}")
+        return inserted
+
+    @classmethod
+    def bulk_insert_returning_ids(cls, session, rows, chunk_size: int = BULK_INSERT_CHUNK_SIZE) -> list:
+        """
+        Like bulk_insert, but return the generated ids in the same order as rows,
+        e.g. to link child rows to just-inserted parents in the same transaction.
+        """
+        stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        ids = []
+        for i in range(0, len(rows), chunk_size):
+            ids.extend(session.scalars(stmt, rows[i:i + chunk_size]))
+        return ids
+
+
+def _db_dep(session_factory, doc: str):
     """
-    Dependency for FastAPI to get database session.
-    Automatically handles session lifecycle and cleanup.
+    Build a FastAPI dependency that yields a session from session_factory.
+    Rolls back on any exception and always closes the session.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        # Rollback on any exception
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+    def _get_session():
+        db = session_factory()
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
 
+    _get_session.__doc__ = doc
+    return _get_session
 
-def get_poi_db():
+
+get_db = _db_dep(SessionLocal, "Dependency for FastAPI to get a main database session.")
+get_poi_db = _db_dep(POISessionLocal, "Dependency for POI-related database operations (separate POI database).")
+get_road_db = _db_dep(
+    RoadSessionLocal,
+    "Dependency for road hazard database operations (overpass heights, railroad crossings, etc.)."
+)
+
+
+async def get_async_poi_db():
     """
-    Dependency for POI-related database operations.
-    Connects to the separate POI database.
+    Dependency for async POI routes.
+    Yields an AsyncSession when ASYNC_DB is enabled, otherwise a regular POI session.
+    Run statements through execute_query so either kind works without blocking the event loop.
     """
+    if AsyncPOISessionLocal is not None:
+        async with AsyncPOISessionLocal() as db:
+            yield db
+        return
+
     db = POISessionLocal()
     try:
         yield db
-    except Exception as e:
+    except Exception:
         db.rollback()
-        raise e
+        raise
     finally:
         db.close()
 
 
-def get_road_db():
-    """
-    Dependency for road hazard database operations.
-    Connects to the separate road hazards database (overpass heights, railroad crossings, etc.).
-    """
-    db = RoadSessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+async def execute_query(db, statement):
+    """Execute a statement on an AsyncSession, or on a sync Session in the threadpool."""
+    if isinstance(db, AsyncSession):
+        return await db.execute(statement)
+    return await run_in_threadpool(db.execute, statement)
@@ -0,0 +1,67 @@
+"""
+Vectorized distance helpers for along-route searches.
+
+Route endpoints fetch every candidate in the route's bounding box and then
+keep those within a buffer of the route. Measuring each candidate against
+each route segment in Python is O(points x segments) interpreter work; here
+it is one NumPy broadcast per block of points.
+"""
+from typing import Sequence
+
+import numpy as np
+
+# Upper bound on points x segments evaluated per block, to cap temporaries
+_BLOCK_ELEMENTS = 1_000_000
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def route_distances_miles(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    route: Sequence[Sequence[float]],
+    lat_miles: float = 69.0,
+    lon_miles: float = 55.0
+) -> np.ndarray:
+    """
+    Miles from each (lat, lon) point to the nearest segment of a
+    [[lat, lon], ...] polyline, using a flat projection with the given
+    miles per degree of latitude and longitude.
+    """
+    px = np.asarray(lats, dtype=np.float64) * lat_miles
+    py = np.asarray(lons, dtype=np.float64) * lon_miles
+
+    r = np.asarray(route, dtype=np.float64).reshape(-1, 2)
+    if len(r) < 2:
+        # No segments: nothing is "along" a route of zero or one point
+        return np.full(len(px), np.inf)
+    x1 = r[:-1, 0] * lat_miles
+    y1 = r[:-1, 1] * lon_miles
+    dx = r[1:, 0] * lat_miles - x1
+    dy = r[1:, 1] * lon_miles - y1
+    # Zero-length segments get t = 0, i.e. distance to their start point
+    seg_len2 = dx * dx + dy * dy
+    seg_len2[seg_len2 == 0] = 1.0
+
+    out = np.empty(len(px))
+    block = max(1, _BLOCK_ELEMENTS // max(1, len(x1)))
+    for start in range(0, len(px), block):
+        bx = px[start:start + block, None] - x1
+        by = py[start:start + block, None] - y1
+        t = np.clip((bx * dx + by * dy) / seg_len2, 0.0, 1.0)
+        out[start:start + block] = np.hypot(bx - t * dx, by - t * dy).min(axis=1)
+    return out
+
+
+def cumulative_route_miles(route: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Cumulative great-circle (haversine) miles along a [[lat, lon], ...]
+    polyline, starting at 0 for the first point. Lets callers locate a
+    distance along the route with np.searchsorted instead of walking it.
+    """
+    r = np.radians(np.asarray(route, dtype=np.float64))
+    lat, lon = r[:, 0], r[:, 1]
+    a = (np.sin(np.diff(lat) / 2) ** 2
+         + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2)
+    legs = 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+    return np.concatenate(([0.0], np.cumsum(legs)))
@@ -0,0 +1,16 @@
+"""
+Cache-safe spatial column types.
+
+GeoAlchemy2 declares Geometry and Geography with cache_ok = False, so
+SQLAlchemy recompiles every statement that selects or filters such a column.
+Their constructor arguments (geometry type, SRID, dimension, index flags) are
+plain hashable values, which is all the compiled-statement cache keys on, so
+these subclasses opt back in. Behaviour is otherwise unchanged.
+"""
+from geoalchemy2 import Geography
+
+
+class CachedGeography(Geography):
+    """Geography column type that participates in SQLAlchemy's statement cache."""
+
+    cache_ok = True
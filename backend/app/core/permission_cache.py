@@ -0,0 +1,120 @@
+"""
+Cache for resolved custom-role permissions.
+
+Custom role definitions change rarely but are read on every permission check,
+so the resolved {permission_key: bool} dict is cached by role name with a TTL.
+When REDIS_URL is configured the cache lives in Redis, so all workers share
+warmed entries and see invalidations; otherwise it is kept in-process.
+Any Redis error falls back silently to the database.
+
+Role changes are broadcast with Postgres NOTIFY on the perm_changed channel;
+each worker runs listen_for_role_changes() so in-process entries are dropped
+everywhere, not just in the worker that handled the write.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from .config import settings
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+ROLE_CACHE_TTL_SECONDS = 3600
+NOTIFY_CHANNEL = "perm_changed"
+LISTENER_RETRY_SECONDS = 5
+_KEY_PREFIX = "wm:perm:role:"
+
+# role_name -> (expires_at, permissions)
+_local_cache: Dict[str, tuple] = {}
+
+
+def get_cached_role_permissions(role_name: str) -> Optional[Dict[str, bool]]:
+    """Return cached permissions for a custom role, or None on a miss."""
+    client = get_redis()
+    if client is not None:
+        try:
+            raw = client.get(_KEY_PREFIX + role_name)
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.debug(f"Redis permission cache read failed: {e}")
+            return None
+
+    entry = _local_cache.get(role_name)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def set_cached_role_permissions(role_name: str, permissions: Dict[str, bool]) -> None:
+    """Store resolved permissions for a custom role."""
+    client = get_redis()
+    if client is not None:
+        try:
+            client.setex(_KEY_PREFIX + role_name, ROLE_CACHE_TTL_SECONDS, json.dumps(permissions))
+        except Exception as e:
+            logger.debug(f"Redis permission cache write failed: {e}")
+        return
+
+    _local_cache[role_name] = (time.monotonic() + ROLE_CACHE_TTL_SECONDS, permissions)
+
+
+def invalidate_role(role_name: str) -> None:
+    """Drop cached permissions for a role. Call after any change to its RolePermission rows."""
+    _local_cache.pop(role_name, None)
+
+    client = get_redis()
+    if client is not None:
+        try:
+            client.delete(_KEY_PREFIX + role_name)
+        except Exception as e:
+            logger.debug(f"Redis permission cache invalidation failed: {e}")
+
+
+def publish_role_change(db, role_name: str) -> None:
+    """
+    Queue a NOTIFY for a changed role on the current transaction.
+    Postgres delivers it to listeners only when the transaction commits.
+    """
+    db.execute(text("SELECT pg_notify(:channel, :role)"), {"channel": NOTIFY_CHANNEL, "role": role_name})
+
+
+def _on_role_changed(connection, pid, channel, role_name):
+    invalidate_role(role_name)
+
+
+async def listen_for_role_changes() -> None:
+    """
+    Invalidate cached roles on NOTIFY from any worker.
+    Holds a dedicated asyncpg connection and reconnects if it drops.
+    """
+    try:
+        import asyncpg
+    except ImportError:
+        logger.warning("asyncpg is not installed; permission cache changes will not propagate across workers")
+        return
+
+    dsn = settings.DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1)
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(dsn, timeout=10)
+            await conn.add_listener(NOTIFY_CHANNEL, _on_role_changed)
+            # Entries cached while disconnected may have missed a notification
+            _local_cache.clear()
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda c: closed.set())
+            await closed.wait()
+            logger.warning("Permission change listener connection closed; reconnecting")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Permission change listener failed: {e}")
+        finally:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+        await asyncio.sleep(LISTENER_RETRY_SECONDS)
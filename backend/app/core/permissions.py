@@ -1,10 +1,13 @@
 """
 Permission system for role-based access control.
 """
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from functools import wraps
+from types import MappingProxyType
+
+from .permission_cache import get_cached_role_permissions, set_cached_role_permissions
 
 
 class Permissions:
@@ -23,9 +26,15 @@ class Permissions:
     MANAGE_CRAWLERS = "manage_crawlers"
 
 
-# Default permissions for system roles
+# Every valid permission key, for validating keys before touching the database
+ALL_PERMISSIONS: FrozenSet[str] = frozenset(
+    v for k, v in vars(Permissions).items() if not k.startswith("_") and isinstance(v, str)
+)
+
+
+# Default permissions for system roles (read-only, returned without copying)
 SYSTEM_ROLE_PERMISSIONS = {
-    "owner": {
+    "owner": MappingProxyType({
         Permissions.MANAGE_USERS: True,
         Permissions.MANAGE_ROLES: True,
         Permissions.MANAGE_CUSTOM_ROLES: True,
@@ -38,8 +47,8 @@ SYSTEM_ROLE_PERMISSIONS = {
         Permissions.MANAGE_RV_PROFILES: True,
         Permissions.VIEW_CRAWL_STATUS: True,
         Permissions.MANAGE_CRAWLERS: True,
-    },
-    "admin": {
+    }),
+    "admin": MappingProxyType({
         Permissions.MANAGE_USERS: True,
         Permissions.MANAGE_ROLES: False,
         Permissions.MANAGE_CUSTOM_ROLES: False,
@@ -52,8 +61,8 @@ SYSTEM_ROLE_PERMISSIONS = {
         Permissions.MANAGE_RV_PROFILES: True,
         Permissions.VIEW_CRAWL_STATUS: True,
         Permissions.MANAGE_CRAWLERS: True,
-    },
-    "user": {
+    }),
+    "user": MappingProxyType({
         Permissions.MANAGE_USERS: False,
         Permissions.MANAGE_ROLES: False,
         Permissions.MANAGE_CUSTOM_ROLES: False,
@@ -66,22 +75,37 @@ SYSTEM_ROLE_PERMISSIONS = {
         Permissions.MANAGE_RV_PROFILES: True,
         Permissions.VIEW_CRAWL_STATUS: True,
         Permissions.MANAGE_CRAWLERS: False,
-    },
+    }),
+}
+
+# Granted permission keys per system role, for single-probe membership checks
+SYSTEM_ROLE_PERMS = {
+    role: frozenset(key for key, granted in perms.items() if granted)
+    for role, perms in SYSTEM_ROLE_PERMISSIONS.items()
 }
 
 
-def get_user_permissions(db: Session, user) -> Dict[str, bool]:
+def is_owner(user) -> bool:
+    """The owner (role 'owner', or the first user) is granted every permission."""
+    return getattr(user, 'role', 'user') == 'owner' or getattr(user, 'id', None) == 1
+
+
+def get_user_permissions(db: Session, user) -> Mapping[str, bool]:
     """
     Get all permissions for a user based on their role.
-    Returns a dict of permission_key -> bool.
+    Returns a read-only mapping of permission_key -> bool.
     """
     role = getattr(user, 'role', 'user') or 'user'
 
     # Check system roles first
     if role in SYSTEM_ROLE_PERMISSIONS:
-        return SYSTEM_ROLE_PERMISSIONS[role].copy()
+        return SYSTEM_ROLE_PERMISSIONS[role]
+
+    # For custom roles, use the warmed cache before querying the database
+    cached = get_cached_role_permissions(role)
+    if cached is not None:
+        return MappingProxyType(cached)
 
-    # For custom roles, query the database
     from ..models.custom_role import RolePermission
     permissions = {}
 
@@ -89,12 +113,52 @@ def get_user_permissions(db: Session, user) -> Dict[str, bool]:
     for perm in role_perms:
         permissions[perm.permission_key] = perm.permission_value
 
-    return permissions
+    set_cached_role_permissions(role, permissions)
+    return MappingProxyType(permissions)
+
 
+def get_permissions_cache(request: Request) -> Dict[Tuple[int, str], Mapping[str, bool]]:
+    """
+    Dependency returning a per-request permissions cache.
+    Stacked permission guards on the same request share one lookup.
+    """
+    cache = getattr(request.state, "permissions", None)
+    if cache is None:
+        cache = {}
+        request.state.permissions = cache
+    return cache
+
+
+def has_permission(
+    db: Session,
+    user,
+    permission_key: str,
+    cache: Optional[Dict[Tuple[int, str], Mapping[str, bool]]] = None
+) -> bool:
+    """
+    Check if a user has a specific permission.
+    If a per-request cache is given, permissions are resolved at most once per user and role.
+    """
+    if permission_key not in ALL_PERMISSIONS:
+        return False
 
-def has_permission(db: Session, user, permission_key: str) -> bool:
-    """Check if a user has a specific permission."""
-    permissions = get_user_permissions(db, user)
+    if is_owner(user):
+        return True
+
+    role = getattr(user, 'role', 'user') or 'user'
+
+    # System roles are known at import time; no dict lookup or DB needed
+    system_perms = SYSTEM_ROLE_PERMS.get(role)
+    if system_perms is not None:
+        return permission_key in system_perms
+
+    if cache is None:
+        permissions = get_user_permissions(db, user)
+    else:
+        cache_key = (user.id, role)
+        permissions = cache.get(cache_key)
+        if permissions is None:
+            permissions = cache[cache_key] = get_user_permissions(db, user)
     return permissions.get(permission_key, False)
 
 
@@ -122,7 +186,7 @@ def require_owner():
     from ..api.auth import get_current_user
 
     async def _require_owner(current_user = Depends(get_current_user)):
-        if getattr(current_user, 'role', 'user') != 'owner' and current_user.id != 1:
+        if not is_owner(current_user):
             raise HTTPException(
                 status_code=403,
                 detail="Only the owner can perform this action"
@@ -137,14 +201,21 @@ def require_permission(permission_key: str):
     Dependency that requires the current user to have a specific permission.
     Use as: current_user: User = Depends(require_permission(Permissions.MANAGE_USERS))
     """
+    if permission_key not in ALL_PERMISSIONS:
+        raise ValueError(f"Unknown permission key: {permission_key}")
+
     from ..api.auth import get_current_user
     from ..core.database import get_db
 
-    async def _require_permission(
+    # Plain def so FastAPI runs it in the threadpool: a cache miss does a
+    # blocking Redis/database lookup
+    def _require_permission(
         current_user = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        permissions_cache: dict = Depends(get_permissions_cache)
     ):
-        if not has_permission(db, current_user, permission_key):
+        # has_permission already lets the owner through
+        if not has_permission(db, current_user, permission_key, permissions_cache):
             raise HTTPException(
                 status_code=403,
                 detail=f"Permission denied: {permission_key}"
@@ -0,0 +1,31 @@
+"""
+Shared Redis client for the optional caches.
+
+get_redis() returns None when REDIS_URL is unset or the redis package is not
+installed; callers then fall back to in-process state or the database.
+"""
+import logging
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+_redis_unavailable = False
+
+
+def get_redis():
+    """Return a Redis client if REDIS_URL is set and redis is installed, else None."""
+    global _redis_client, _redis_unavailable
+
+    if _redis_client is not None or _redis_unavailable or not settings.REDIS_URL:
+        return _redis_client
+
+    try:
+        import redis
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed; Redis caching is disabled")
+        _redis_unavailable = True
+
+    return _redis_client
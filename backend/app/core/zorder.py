@@ -0,0 +1,65 @@
+"""
+Z-order (Morton) cell ids for points.
+
+Latitude and longitude are each quantized to 31 bits and bit-interleaved into
+one 62-bit integer, stored in zorder_cell columns and indexed with B-trees.
+Interleaving is monotone in both coordinates, so every point inside a
+bounding box has a cell id between the ids of the box's south-west and
+north-east corners; zorder_range() gives that range as a cheap B-tree
+prefilter ahead of the exact spatial predicate.
+
+The database computes the columns with wm_zorder_cell() (ZORDER_FUNCTION_SQL);
+zorder_cell() here must stay bit-for-bit identical to it.
+"""
+from typing import Tuple
+
+_BITS = 31
+_SCALE = float(1 << _BITS)
+_MAX = (1 << _BITS) - 1
+
+ZORDER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION wm_zorder_cell(lat double precision, lon double precision)
+RETURNS bigint
+LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+DECLARE
+    x bigint := least(greatest(floor((lon + 180.0) / 360.0 * 2147483648.0), 0), 2147483647);
+    y bigint := least(greatest(floor((lat + 90.0) / 180.0 * 2147483648.0), 0), 2147483647);
+BEGIN
+    x := (x | (x << 16)) & 281470681808895;
+    x := (x | (x << 8)) & 71777214294589695;
+    x := (x | (x << 4)) & 1085102592571150095;
+    x := (x | (x << 2)) & 3689348814741910323;
+    x := (x | (x << 1)) & 6148914691236517205;
+    y := (y | (y << 16)) & 281470681808895;
+    y := (y | (y << 8)) & 71777214294589695;
+    y := (y | (y << 4)) & 1085102592571150095;
+    y := (y | (y << 2)) & 3689348814741910323;
+    y := (y | (y << 1)) & 6148914691236517205;
+    RETURN x | (y << 1);
+END
+$$;
+"""
+
+
+def _spread(v: int) -> int:
+    """Insert a zero bit between each of the low 31 bits of v."""
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+def _quantize(value: float, offset: float, span: float) -> int:
+    return min(max(int((value + offset) / span * _SCALE), 0), _MAX)
+
+
+def zorder_cell(lat: float, lon: float) -> int:
+    """Morton cell id of a point, matching wm_zorder_cell() in the database."""
+    return _spread(_quantize(lon, 180.0, 360.0)) | (_spread(_quantize(lat, 90.0, 180.0)) << 1)
+
+
+def zorder_range(south: float, west: float, north: float, east: float) -> Tuple[int, int]:
+    """Inclusive cell id range covering a bounding box (west <= east)."""
+    return zorder_cell(south, west), zorder_cell(north, east)
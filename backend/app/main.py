@@ -1,28 +1,66 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from contextlib import asynccontextmanager
+import asyncio
+import importlib
 import os
+import time
 
 from .core.config import settings
 from .core.database import get_db
-from .api import (
-    auth, users, rv_profiles, trips, pois, fuel_logs, metrics, state_visits,
-    settings as settings_api, crawl_status, user_preferences, overpass_heights,
-    railroad_crossings, weight_restrictions, achievements, fuel_prices, import_stops,
-    overpass_search, pois_bbox, roles, scraping_control, weather, harvest_hosts,
-    api_keys, scraper_dashboard, serialization
-)
+from .core.permission_cache import listen_for_role_changes
 from .services.scheduler import start_scheduler, stop_scheduler
 
+# API routers as (module in .api, prefix, tag)
+ROUTERS = [
+    ("auth", "/api/auth", "Authentication"),
+    ("users", "/api/users", "Users"),
+    ("rv_profiles", "/api/rv-profiles", "RV Profiles"),
+    ("trips", "/api/trips", "Trips"),
+    ("pois", "/api/pois", "POIs"),
+    ("fuel_logs", "/api/fuel-logs", "Fuel Logs"),
+    ("metrics", "/api/metrics", "Metrics"),
+    ("state_visits", "/api/state-visits", "State Visits"),
+    ("settings", "/api/settings", "Settings"),
+    ("crawl_status", "/api/crawl-status", "Crawl Status"),
+    ("user_preferences", "/api/user", "User Preferences"),
+    ("fuel_prices", "/api/fuel-prices", "Fuel Prices"),
+    ("import_stops", "/api/import-stops", "Import Stops"),
+    ("roles", "/api/roles", "Roles"),
+    ("weather", "/api/weather", "Weather"),
+    ("overpass_heights", "/api/overpass-heights", "Overpass Heights"),
+    ("railroad_crossings", "/api/railroad-crossings", "Railroad Crossings"),
+    ("weight_restrictions", "/api/weight-restrictions", "Weight Restrictions"),
+    ("overpass_search", "/api/overpass-search", "Overpass Search"),
+    ("pois_bbox", "/api/pois-bbox", "POIs BBox"),
+    ("scraping_control", "/api/scraping-control", "Scraping Control"),
+    ("achievements", "/api/achievements", "Achievements"),
+    ("harvest_hosts", "/api/harvest-hosts", "Harvest Hosts"),
+    ("api_keys", "/api/api-keys", "API Keys"),
+    ("scraper_dashboard", "/api/scraper-dashboard", "Scraper Dashboard"),
+    ("serialization", "/api/serialization", "Serialization"),
+]
+
+
+def include_routers(app: FastAPI):
+    """Import each API router module and register it on the app."""
+    for module_name, prefix, tag in ROUTERS:
+        module = importlib.import_module(f".api.{module_name}", __package__)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Start background scheduler
     start_scheduler()
+    # Drop cached role permissions when another worker changes a role
+    role_listener = asyncio.create_task(listen_for_role_changes())
     yield
-    # Shutdown: Stop background scheduler
+    # Shutdown: Stop background scheduler and the role change listener
+    role_listener.cancel()
     stop_scheduler()
 
 
@@ -30,8 +68,11 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="RV Trip Planning and Tracking API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Encode JSON responses with orjson (C) instead of json.dumps
+    default_response_class=ORJSONResponse
 )
+include_routers(app)
 
 # CORS middleware
 app.add_middleware(
@@ -48,37 +89,10 @@ os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 # Mount static files for uploads
 app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(rv_profiles.router, prefix="/api/rv-profiles", tags=["RV Profiles"])
-app.include_router(trips.router, prefix="/api/trips", tags=["Trips"])
-app.include_router(pois.router, prefix="/api/pois", tags=["POIs"])
-app.include_router(fuel_logs.router, prefix="/api/fuel-logs", tags=["Fuel Logs"])
-app.include_router(metrics.router, prefix="/api/metrics", tags=["Metrics"])
-app.include_router(state_visits.router, prefix="/api/state-visits", tags=["State Visits"])
-app.include_router(settings_api.router, prefix="/api/settings", tags=["Settings"])
-app.include_router(crawl_status.router, prefix="/api/crawl-status", tags=["Crawl Status"])
-app.include_router(user_preferences.router, prefix="/api/user", tags=["User Preferences"])
-app.include_router(fuel_prices.router, prefix="/api/fuel-prices", tags=["Fuel Prices"])
-app.include_router(import_stops.router, prefix="/api/import-stops", tags=["Import Stops"])
-app.include_router(roles.router, prefix="/api/roles", tags=["Roles"])
-app.include_router(weather.router, prefix="/api/weather", tags=["Weather"])
-app.include_router(overpass_heights.router, prefix="/api/overpass-heights", tags=["Overpass Heights"])
-app.include_router(railroad_crossings.router, prefix="/api/railroad-crossings", tags=["Railroad Crossings"])
-app.include_router(weight_restrictions.router, prefix="/api/weight-restrictions", tags=["Weight Restrictions"])
-app.include_router(overpass_search.router, prefix="/api/overpass-search", tags=["Overpass Search"])
-app.include_router(pois_bbox.router, prefix="/api/pois-bbox", tags=["POIs BBox"])
-app.include_router(scraping_control.router, prefix="/api/scraping-control", tags=["Scraping Control"])
-app.include_router(achievements.router, prefix="/api/achievements", tags=["Achievements"])
-app.include_router(harvest_hosts.router, prefix="/api/harvest-hosts", tags=["Harvest Hosts"])
-app.include_router(api_keys.router, prefix="/api/api-keys", tags=["API Keys"])
-app.include_router(scraper_dashboard.router, prefix="/api/scraper-dashboard", tags=["Scraper Dashboard"])
-app.include_router(serialization.router, prefix="/api/serialization", tags=["Serialization"])
-
-
-# Health check endpoint (no auth required)
+
+# Health check endpoints (no auth required)
 @app.get("/api/health")
+@app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "wandermage-api"}
 
@@ -92,32 +106,39 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
-
-
 @app.get("/api/version")
 async def get_version():
     from .version import __version__
     return {"version": __version__}
 
 
+# Credential names checked by /api/credentials/status; each may be stored
+# lowercase or uppercase.
+CREDENTIAL_KEYS = ("eia_api_key", "ors_api_key", "hh_email", "hh_password", "mapbox_token")
+CREDENTIALS_STATUS_TTL_SECONDS = 30
+
+_credentials_status_cache = None  # (expires_at, status)
+
+
 @app.get("/api/credentials/status")
 async def get_credentials_status(db: Session = Depends(get_db)):
     """Get status of all configured credentials/API keys"""
-    from .models.system_setting import get_setting
-
-    # Check database for credentials (using lowercase key names)
-    eia_key = get_setting(db, 'eia_api_key') or get_setting(db, 'EIA_API_KEY')
-    ors_key = get_setting(db, 'ors_api_key') or get_setting(db, 'ORS_API_KEY')
-    hh_email = get_setting(db, 'hh_email') or get_setting(db, 'HH_EMAIL')
-    hh_password = get_setting(db, 'hh_password') or get_setting(db, 'HH_PASSWORD')
-    mapbox_token = get_setting(db, 'mapbox_token') or get_setting(db, 'MAPBOX_TOKEN')
-
-    return {
-        "eia_api_key": bool(eia_key),
-        "ors_api_key": bool(ors_key),
-        "harvest_hosts": bool(hh_email) and bool(hh_password),
-        "mapbox_token": bool(mapbox_token)
+    global _credentials_status_cache
+    from .models.system_setting import get_settings_bulk
+
+    now = time.monotonic()
+    if _credentials_status_cache and _credentials_status_cache[0] > now:
+        return _credentials_status_cache[1]
+
+    # Check database for credentials (lowercase key names, uppercase as fallback)
+    values = get_settings_bulk(db, [k for key in CREDENTIAL_KEYS for k in (key, key.upper())])
+    creds = {key: values[key] or values[key.upper()] for key in CREDENTIAL_KEYS}
+
+    status = {
+        "eia_api_key": bool(creds["eia_api_key"]),
+        "ors_api_key": bool(creds["ors_api_key"]),
+        "harvest_hosts": bool(creds["hh_email"]) and bool(creds["hh_password"]),
+        "mapbox_token": bool(creds["mapbox_token"])
     }
+    _credentials_status_cache = (now + CREDENTIALS_STATUS_TTL_SECONDS, status)
+    return status
@@ -1,3 +1,7 @@
+import importlib
+
+# Models joined to User/Trip/TripStop by string relationships must be imported
+# together so the mappers can configure.
 from .achievement import AchievementDefinition, UserAchievement
 from .user import User
 from .api_key import APIKey
@@ -6,11 +10,16 @@ from .trip import Trip, TripStop, RouteNote
 from .poi import POI, OverpassHeight
 from .fuel_log import FuelLog
 from .state_visit import StateVisit
-from .crawl_status import CrawlStatus
-from .harvest_host import HarvestHost
 from .harvest_host_stay import HarvestHostStay
-from .scraper_status import ScraperStatus
-from .weather_forecast import WeatherForecast, WeatherAlert
+
+# Standalone models are imported on first attribute access (PEP 562).
+_LAZY_MODELS = {
+    "CrawlStatus": "crawl_status",
+    "HarvestHost": "harvest_host",
+    "ScraperStatus": "scraper_status",
+    "WeatherForecast": "weather_forecast",
+    "WeatherAlert": "weather_forecast",
+}
 
 __all__ = [
     "AchievementDefinition",
@@ -32,3 +41,18 @@ __all__ = [
     "WeatherForecast",
     "WeatherAlert",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(f".{module}", __name__).__dict__[name]
+    globals()[name] = value
+    return value
+
+
+def load_all_models():
+    """Import the lazy model modules so their tables are registered on the metadata."""
+    for module in set(_LAZY_MODELS.values()):
+        importlib.import_module(f".{module}", __name__)
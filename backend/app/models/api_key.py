@@ -2,8 +2,25 @@ from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
-import secrets
+import base64
 import hashlib
+import hmac
+import os
+
+
+# Digest constructors for key hashing; all produce 32-byte digests (64 hex chars).
+# blake2b is faster than SHA-256 on CPUs without SHA extensions; sha256 is kept
+# so keys created before blake2b was adopted still verify.
+KEY_HASH_ALGORITHMS = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32),
+}
+DEFAULT_KEY_HASH_ALGO = "blake2b"
+
+
+def _key_digest(key: str, algo: str) -> bytes:
+    """Digest of an API key with the named algorithm."""
+    return KEY_HASH_ALGORITHMS[algo](key.encode()).digest()
 
 
 class APIKey(Base):
@@ -15,6 +32,8 @@ class APIKey(Base):
     # Store hashed key, not plaintext
     key_hash = Column(String(64), unique=True, nullable=False, index=True)
     key_prefix = Column(String(8), nullable=False)  # First 8 chars for identification
+    # Algorithm used for key_hash; rows that predate this column are sha256
+    hash_algo = Column(String(16), nullable=False, default=DEFAULT_KEY_HASH_ALGO, server_default="sha256")
 
     name = Column(String(100), nullable=False)  # User-friendly name for the key
     description = Column(String(500))
@@ -39,16 +58,36 @@ class APIKey(Base):
     @staticmethod
     def generate_key():
         """Generate a new API key with prefix"""
-        # Generate 32-byte random key
-        key = secrets.token_urlsafe(32)
-        prefix = key[:8]
-        return key, prefix
+        return APIKey.generate_keys(1)[0]
+
+    @staticmethod
+    def generate_keys(count: int):
+        """Generate several (key, prefix) pairs from a single urandom read"""
+        # 32 random bytes per key, same encoding as secrets.token_urlsafe(32)
+        raw = os.urandom(32 * count)
+        keys = []
+        for i in range(0, len(raw), 32):
+            key = base64.urlsafe_b64encode(raw[i:i + 32]).rstrip(b'=').decode('ascii')
+            keys.append((key, key[:8]))
+        return keys
 
     @staticmethod
-    def hash_key(key: str) -> str:
+    def hash_key(key: str, algo: str = DEFAULT_KEY_HASH_ALGO) -> str:
         """Hash an API key for storage"""
-        return hashlib.sha256(key.encode()).hexdigest()
+        return _key_digest(key, algo).hex()
+
+    @staticmethod
+    def hash_key_bytes(key: str, algo: str = DEFAULT_KEY_HASH_ALGO) -> bytes:
+        """Raw digest of an API key (no hex encoding)"""
+        return _key_digest(key, algo)
+
+    @property
+    def key_hash_bytes(self) -> bytes:
+        """Stored hash decoded to its raw 32-byte digest"""
+        return bytes.fromhex(self.key_hash)
 
     def verify_key(self, key: str) -> bool:
-        """Verify a key against this API key's hash"""
-        return self.key_hash == self.hash_key(key)
+        """Verify a key against this API key's hash (constant-time compare)"""
+        algo = self.hash_algo or "sha256"
+        return hmac.compare_digest(self.key_hash_bytes, self.hash_key_bytes(key, algo))
+
@@ -3,7 +3,8 @@ Crawl Status Model
 
 Tracks the real-time status of POI crawl operations for display on the web interface.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, case, extract, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime, timezone
 from ..core.database import Base
 
@@ -45,14 +46,23 @@ class CrawlStatus(Base):
     categories = Column(Text)  # JSON string of categories being crawled
     notes = Column(Text, nullable=True)
 
-    @property
+    # Progress metrics are hybrids: computed in Python on loaded rows, and as
+    # SQL expressions when used in select()/filter()/order_by().
+    @hybrid_property
     def progress_percentage(self) -> float:
         """Calculate progress percentage"""
         if self.total_cells == 0:
             return 0.0
         return (self.current_cell / self.total_cells) * 100
 
-    @property
+    @progress_percentage.expression
+    def progress_percentage(cls):
+        return case(
+            (cls.total_cells == 0, 0.0),
+            else_=cls.current_cell * 100.0 / cls.total_cells
+        )
+
+    @hybrid_property
     def elapsed_time_seconds(self) -> float:
         """Calculate elapsed time in seconds"""
         if not self.start_time:
@@ -60,17 +70,38 @@ class CrawlStatus(Base):
         end = self.end_time or datetime.now(timezone.utc)
         return (end - self.start_time).total_seconds()
 
-    @property
+    @elapsed_time_seconds.expression
+    def elapsed_time_seconds(cls):
+        return case(
+            (cls.start_time.is_(None), 0.0),
+            else_=extract('epoch', func.coalesce(cls.end_time, func.now()) - cls.start_time)
+        )
+
+    @hybrid_property
     def avg_time_per_cell(self) -> float:
         """Average time per cell in seconds"""
         if self.current_cell == 0:
             return 0.0
         return self.elapsed_time_seconds / self.current_cell
 
-    @property
+    @avg_time_per_cell.expression
+    def avg_time_per_cell(cls):
+        return case(
+            (cls.current_cell == 0, 0.0),
+            else_=cls.elapsed_time_seconds / cls.current_cell
+        )
+
+    @hybrid_property
     def estimated_time_remaining_seconds(self) -> float:
         """Estimate remaining time in seconds"""
         if self.current_cell == 0 or self.total_cells == 0:
             return 0.0
         cells_remaining = self.total_cells - self.current_cell
         return cells_remaining * self.avg_time_per_cell
+
+    @estimated_time_remaining_seconds.expression
+    def estimated_time_remaining_seconds(cls):
+        return case(
+            ((cls.current_cell == 0) | (cls.total_cells == 0), 0.0),
+            else_=(cls.total_cells - cls.current_cell) * cls.avg_time_per_cell
+        )
@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, Numeric, Text, desc
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from geoalchemy2 import Geography
-from ..core.database import Base
+from ..core.database import Base, BulkInsertMixin
 
 
-class FuelLog(Base):
+class FuelLog(BulkInsertMixin, Base):
     """Track fuel purchases and calculate costs/mileage"""
     __tablename__ = "fuel_logs"
 
@@ -17,8 +17,10 @@ class FuelLog(Base):
     # Fuel purchase details
     date = Column(DateTime(timezone=True), nullable=False, index=True)
     gallons = Column(Float, nullable=False)
-    price_per_gallon = Column(Float, nullable=False)
-    total_cost = Column(Float, nullable=False)
+    # Money is stored exactly (NUMERIC) so SUM() doesn't accumulate float
+    # error; asdecimal=False keeps plain floats on the Python side
+    price_per_gallon = Column(Numeric(12, 4, asdecimal=False), nullable=False)
+    total_cost = Column(Numeric(12, 4, asdecimal=False), nullable=False)
 
     # Odometer reading
     odometer_reading = Column(Float)  # in miles
@@ -43,3 +45,8 @@ class FuelLog(Base):
     user = relationship("User", back_populates="fuel_logs")
     trip = relationship("Trip")
     rv_profile = relationship("RVProfile")
+
+    __table_args__ = (
+        # "Latest fuel logs for a user" (listing and previous-fill MPG lookup)
+        Index('ix_fuel_logs_user_date', 'user_id', desc('date')),
+    )
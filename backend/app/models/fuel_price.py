@@ -23,7 +23,7 @@ class FuelPrice(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Region - PADD code or 'US' for national average
-    region = Column(String, nullable=False, index=True)  # PADD1, PADD2, PADD3, PADD4, PADD5, US
+    region = Column(String, nullable=False)  # PADD1, PADD2, PADD3, PADD4, PADD5, US
 
     # Fuel grade
     grade = Column(String, nullable=False, index=True)  # regular, midgrade, premium, diesel
@@ -32,14 +32,17 @@ class FuelPrice(Base):
     price_per_gallon = Column(Float, nullable=False)
 
     # Date this price was recorded (from EIA)
-    price_date = Column(Date, nullable=False, index=True)
+    price_date = Column(Date, nullable=False)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     __table_args__ = (
-        Index('ix_fuel_prices_region_grade_date', 'region', 'grade', 'price_date'),
+        # Unique so EIA dumps can be upserted with ON CONFLICT
+        Index('ix_fuel_prices_region_grade_date', 'region', 'grade', 'price_date', unique=True),
+        # Rows arrive in date order, so a BRIN index covers date range scans at a fraction of a B-tree's size
+        Index('ix_fuel_prices_date_brin', 'price_date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -68,6 +71,14 @@ STATE_TO_PADD = {
 }
 
 
+# Upper- and lowercase codes, so the common cases need no .upper() copy
+STATE_TO_PADD_CI = {**STATE_TO_PADD, **{k.lower(): v for k, v in STATE_TO_PADD.items()}}
+
+
 def get_padd_for_state(state_code: str) -> str:
     """Get the PADD region for a state code."""
-    return STATE_TO_PADD.get(state_code.upper(), 'US')
+    padd = STATE_TO_PADD_CI.get(state_code)
+    if padd is None:
+        # Mixed case ("Mo") or unknown code
+        padd = STATE_TO_PADD.get(state_code.upper(), 'US')
+    return padd
@@ -1,12 +1,21 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, Float, DateTime, Text, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from geoalchemy2 import Geography
-from ..core.database import POIBase
+from geoalchemy2 import Geography, Geometry
+from ..core.database import POIBase, BulkInsertMixin
 
 
-class HarvestHost(POIBase):
+class HarvestHost(BulkInsertMixin, POIBase):
     """Harvest Hosts locations - wineries, farms, breweries for RV overnight stays"""
     __tablename__ = "harvest_hosts"
+    __table_args__ = (
+        Index('idx_harvest_hosts_location_spgist', 'location', postgresql_using='spgist'),
+        Index('idx_harvest_hosts_location_3857_spgist', 'location_3857', postgresql_using='spgist'),
+        Index('idx_harvest_hosts_host_type_zorder', 'host_type', 'zorder_cell'),
+        Index('idx_harvest_hosts_state_zorder', 'state', 'zorder_cell'),
+        Index('idx_harvest_hosts_amenities_gin', 'amenities', postgresql_using='gin', postgresql_ops={'amenities': 'jsonb_path_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -17,17 +26,24 @@ class HarvestHost(POIBase):
 
     # Basic info
     name = Column(String, nullable=False, index=True)
-    host_type = Column(String, index=True)  # winery, farm, brewery, attraction, etc.
+    host_type = Column(String)  # winery, farm, brewery, attraction, etc.
     product_id = Column(Integer)  # 1=Harvest Hosts, 2=Boondockers, etc.
 
     # Location
     address = Column(String)
     city = Column(String)
-    state = Column(String(2), index=True)
+    state = Column(String(2))
     zip_code = Column(String)
     country = Column(String, default="USA")
 
-    location = Column(Geography(geometry_type='POINT', srid=4326))
+    location = Column(Geography(geometry_type='POINT', srid=4326, spatial_index=False))
+    # Web Mercator copy for planar radius searches (see api/pois.py); not loaded by default
+    location_3857 = deferred(Column(
+        Geometry('POINT', srid=3857, spatial_index=False),
+        Computed("ST_Transform(location::geometry, 3857)", persisted=True)
+    ))
+    # Morton cell of (latitude, longitude) for B-tree range prefilters (core/zorder.py)
+    zorder_cell = Column(BigInteger, Computed("wm_zorder_cell(latitude, longitude)", persisted=True))
     latitude = Column(Float)
     longitude = Column(Float)
 
@@ -74,23 +90,23 @@ class HarvestHost(POIBase):
     instagram = Column(String)
 
     # Business hours (stored as JSON)
-    business_hours = Column(JSON)
+    business_hours = Column(JSONB)
 
     # Features & Amenities (stored as JSON arrays)
-    amenities = Column(JSON)  # ["wine_tasting", "gift_shop", "picnic_area"]
-    highlights = Column(JSON)  # ["Historic pipe organ", "Rose garden"]
-    on_site_features = Column(JSON)
+    amenities = Column(JSONB)  # ["wine_tasting", "gift_shop", "picnic_area"]
+    highlights = Column(JSONB)  # ["Historic pipe organ", "Rose garden"]
+    on_site_features = Column(JSONB)
 
     # Description
     description = Column(Text)
     host_notes = Column(Text)  # Special instructions from host
 
-    # Nearby hosts (for discovery)
-    nearby_hosts = Column(JSON)  # List of nearby host IDs
+    # Nearby hosts (for discovery); deferred so row loads skip the TOASTed JSON
+    nearby_hosts = deferred(Column(JSONB))  # List of nearby host IDs
 
     # Metadata
     source = Column(String, default="harvest_hosts")
-    raw_json = Column(JSON)  # Store full scraped data for future parsing
+    raw_json = deferred(Column(JSONB))  # Full scraped data for future parsing; loaded only when accessed
     last_scraped = Column(DateTime(timezone=True))
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
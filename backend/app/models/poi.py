@@ -1,18 +1,30 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, Float, DateTime, Text, Boolean, Index
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from geoalchemy2 import Geography
-from ..core.database import Base
+from geoalchemy2 import Geography, Geometry
+from ..core.database import Base, BulkInsertMixin
 
 
-class POI(Base):
+class POI(BulkInsertMixin, Base):
     """Points of Interest - campgrounds, attractions, services, etc."""
     __tablename__ = "pois"
+    __table_args__ = (
+        Index('idx_pois_location_spgist', 'location', postgresql_using='spgist'),
+        Index('idx_pois_location_3857_spgist', 'location_3857', postgresql_using='spgist'),
+        Index('idx_pois_category_zorder', 'category', 'zorder_cell'),
+        Index('idx_pois_state_zorder', 'state', 'zorder_cell'),
+        # Trigram indexes for substring (ILIKE '%q%') search
+        Index('idx_pois_serial_trgm', 'serial', postgresql_using='gin', postgresql_ops={'serial': 'gin_trgm_ops'}),
+        Index('idx_pois_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('idx_pois_brand_trgm', 'brand', postgresql_using='gin', postgresql_ops={'brand': 'gin_trgm_ops'}),
+        Index('idx_pois_city_trgm', 'city', postgresql_using='gin', postgresql_ops={'city': 'gin_trgm_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     serial = Column(String(64), unique=True, index=True)  # 64-char unique identifier
 
     name = Column(String, nullable=False, index=True)
-    category = Column(String, index=True)  # campground, restaurant, gas_station, attraction, etc.
+    category = Column(String)  # campground, restaurant, gas_station, attraction, etc.
     subcategory = Column(String)
 
     # Location
@@ -22,7 +34,14 @@ class POI(Base):
     zip_code = Column(String)
     country = Column(String, default="USA")
 
-    location = Column(Geography(geometry_type='POINT', srid=4326), nullable=False)
+    location = Column(Geography(geometry_type='POINT', srid=4326, spatial_index=False), nullable=False)
+    # Web Mercator copy for planar radius searches (see api/pois.py); not loaded by default
+    location_3857 = deferred(Column(
+        Geometry('POINT', srid=3857, spatial_index=False),
+        Computed("ST_Transform(location::geometry, 3857)", persisted=True)
+    ))
+    # Morton cell of (latitude, longitude) for B-tree range prefilters (core/zorder.py)
+    zorder_cell = Column(BigInteger, Computed("wm_zorder_cell(latitude, longitude)", persisted=True))
     latitude = Column(Float)
     longitude = Column(Float)
 
@@ -54,7 +73,7 @@ class POI(Base):
 
     # External data source (OSM, Google, manual, etc.)
     source = Column(String)
-    external_id = Column(String)
+    external_id = Column(String, unique=True, index=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -63,6 +82,9 @@ class POI(Base):
 class OverpassHeight(Base):
     """Bridge and overpass height clearances"""
     __tablename__ = "overpass_heights"
+    __table_args__ = (
+        Index('idx_overpass_heights_location_spgist', 'location', postgresql_using='spgist'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     serial = Column(String(64), unique=True, index=True)  # 64-char unique identifier
@@ -71,7 +93,7 @@ class OverpassHeight(Base):
     road_name = Column(String, index=True)
 
     # Location
-    location = Column(Geography(geometry_type='POINT', srid=4326), nullable=False)
+    location = Column(Geography(geometry_type='POINT', srid=4326, spatial_index=False), nullable=False)
     latitude = Column(Float)
     longitude = Column(Float)
 
@@ -96,6 +118,9 @@ class OverpassHeight(Base):
 class RailroadCrossing(Base):
     """Railroad crossing locations with safety information"""
     __tablename__ = "railroad_crossings"
+    __table_args__ = (
+        Index('idx_railroad_crossings_location_spgist', 'location', postgresql_using='spgist'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     serial = Column(String(64), unique=True, index=True)  # 64-char unique identifier
@@ -105,7 +130,7 @@ class RailroadCrossing(Base):
     railway_name = Column(String)
 
     # Location
-    location = Column(Geography(geometry_type='POINT', srid=4326))
+    location = Column(Geography(geometry_type='POINT', srid=4326, spatial_index=False))
     latitude = Column(Float, index=True)
     longitude = Column(Float, index=True)
 
@@ -136,6 +161,9 @@ class RailroadCrossing(Base):
 class WeightRestriction(Base):
     """Bridge and road weight restrictions for heavy vehicles"""
     __tablename__ = "weight_restrictions"
+    __table_args__ = (
+        Index('idx_weight_restrictions_location_spgist', 'location', postgresql_using='spgist'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     serial = Column(String(64), unique=True, index=True)  # 64-char unique identifier
@@ -144,13 +172,13 @@ class WeightRestriction(Base):
     road_name = Column(String, index=True)
 
     # Location
-    location = Column(Geography(geometry_type='POINT', srid=4326))
+    location = Column(Geography(geometry_type='POINT', srid=4326, spatial_index=False))
     latitude = Column(Float, index=True)
     longitude = Column(Float, index=True)
 
     # Weight limit in tons
     weight_tons = Column(Float, nullable=False, index=True)
-    weight_lbs = Column(Float)  # Calculated from tons
+    weight_lbs = Column(Float, Computed("weight_tons * 2000", persisted=True))
 
     # Additional info
     restriction_type = Column(String)  # bridge, road, seasonal, etc.
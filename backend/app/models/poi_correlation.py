@@ -3,15 +3,16 @@ POI Correlation and Master Models
 
 Models for correlating POIs across sources and creating verified master records
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, LargeBinary, Index, Computed
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime, timezone
 from geoalchemy2 import Geometry
 
-from ..core.database import POIBase, Base
+from ..core.database import POIBase, Base, BulkInsertMixin
 
 
-class POICorrelation(POIBase):
+class POICorrelation(BulkInsertMixin, POIBase):
     """Links POIs from different sources that represent the same physical location"""
     __tablename__ = "poi_correlation"
 
@@ -45,7 +46,7 @@ class POICorrelation(POIBase):
 
     # Conflict flags
     has_conflicts = Column(Boolean, default=False)
-    conflict_fields = Column(JSON)  # Array of fields with conflicts
+    conflict_fields = Column(JSONB)  # Array of fields with conflicts
 
     # Verification (no FK constraint - cross-database reference)
     verified_by_user_id = Column(Integer)  # References users.id in main database
@@ -59,27 +60,42 @@ class POICorrelation(POIBase):
     master_poi = relationship("POIMaster", back_populates="correlations")
 
 
-class POIMaster(POIBase):
+class POIMaster(BulkInsertMixin, POIBase):
     """Master POI record - correlated and verified data from all sources"""
     __tablename__ = "poi_master"
+    __table_args__ = (
+        Index('idx_poi_master_location_spgist', 'location', postgresql_using='spgist'),
+        Index('idx_poi_master_location_3857_spgist', 'location_3857', postgresql_using='spgist'),
+        Index('idx_poi_master_category_zorder', 'category', 'zorder_cell'),
+        Index('idx_poi_master_state_zorder', 'state', 'zorder_cell'),
+        Index('idx_poi_master_amenities_gin', 'amenities', postgresql_using='gin', postgresql_ops={'amenities': 'jsonb_path_ops'}),
+        Index('idx_poi_master_hours_gin', 'hours', postgresql_using='gin', postgresql_ops={'hours': 'jsonb_path_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Core location data (best from all sources)
     latitude = Column(Float, nullable=False, index=True)
     longitude = Column(Float, nullable=False, index=True)
-    location = Column(Geometry('POINT', srid=4326), index=True)
+    location = Column(Geometry('POINT', srid=4326, spatial_index=False))
+    # Web Mercator copy for planar radius searches (see api/pois.py); not loaded by default
+    location_3857 = deferred(Column(
+        Geometry('POINT', srid=3857, spatial_index=False),
+        Computed("ST_Transform(location, 3857)", persisted=True)
+    ))
+    # Morton cell of (latitude, longitude) for B-tree range prefilters (core/zorder.py)
+    zorder_cell = Column(BigInteger, Computed("wm_zorder_cell(latitude, longitude)", persisted=True))
 
     # Basic information (merged from all sources)
     name = Column(String(255), nullable=False, index=True)
-    category = Column(String(100), index=True)
+    category = Column(String(100))
     subcategory = Column(String(100))
     description = Column(Text)
 
     # Address (best/most complete from all sources)
     address = Column(String(512))
     city = Column(String(100), index=True)
-    state = Column(String(50), index=True)
+    state = Column(String(50))
     zip_code = Column(String(20))
     formatted_address = Column(String(512))
 
@@ -98,7 +114,7 @@ class POIMaster(POIBase):
     brand = Column(String(255))
 
     # Operating hours (merged/verified)
-    hours = Column(JSON)
+    hours = Column(JSONB)
     open_24_7 = Column(Boolean, default=False)
 
     # Aggregated ratings (weighted average from all sources)
@@ -107,17 +123,17 @@ class POIMaster(POIBase):
     total_review_count = Column(Integer, default=0)
 
     # Source ratings breakdown (JSON: {"google": 4.5, "yelp": 4.2, ...})
-    source_ratings = Column(JSON)
+    source_ratings = Column(JSONB)
 
     # Amenities (merged from all sources)
-    amenities = Column(JSON)
+    amenities = Column(JSONB)
 
     # Accessibility
     wheelchair_accessible = Column(Boolean)
     wifi = Column(Boolean)
 
     # Payment methods (merged array)
-    payment_methods = Column(JSON)
+    payment_methods = Column(JSONB)
 
     # Fee information
     fee = Column(Boolean, default=False)
@@ -128,11 +144,11 @@ class POIMaster(POIBase):
     water = Column(Boolean)
     sewer = Column(Boolean)
     dump_station = Column(Boolean)
-    fuel_types = Column(JSON)
+    fuel_types = Column(JSONB)
 
     # Images (merged from all sources)
-    images = Column(JSON)  # Array of image URLs from all sources
-    primary_image = Column(LargeBinary)
+    images = Column(JSONB)  # Array of image URLs from all sources
+    primary_image = deferred(Column(LargeBinary))  # loaded only when accessed
     primary_image_mime = Column(String(50))
 
     # Data quality
@@ -163,6 +179,12 @@ class POIMaster(POIBase):
 class POIVerified(POIBase):
     """Final production-ready POI table - only high-quality, verified POIs"""
     __tablename__ = "pois_verified"
+    __table_args__ = (
+        Index('idx_pois_verified_location_spgist', 'location', postgresql_using='spgist'),
+        Index('idx_pois_verified_location_3857_spgist', 'location_3857', postgresql_using='spgist'),
+        Index('idx_pois_verified_category_zorder', 'category', 'zorder_cell'),
+        Index('idx_pois_verified_state_zorder', 'state', 'zorder_cell'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -173,22 +195,29 @@ class POIVerified(POIBase):
     # (denormalized for performance)
     latitude = Column(Float, nullable=False, index=True)
     longitude = Column(Float, nullable=False, index=True)
-    location = Column(Geometry('POINT', srid=4326), index=True)
+    location = Column(Geometry('POINT', srid=4326, spatial_index=False))
+    # Web Mercator copy for planar radius searches (see api/pois.py); not loaded by default
+    location_3857 = deferred(Column(
+        Geometry('POINT', srid=3857, spatial_index=False),
+        Computed("ST_Transform(location, 3857)", persisted=True)
+    ))
+    # Morton cell of (latitude, longitude) for B-tree range prefilters (core/zorder.py)
+    zorder_cell = Column(BigInteger, Computed("wm_zorder_cell(latitude, longitude)", persisted=True))
 
     name = Column(String(255), nullable=False, index=True)
-    category = Column(String(100), index=True)
+    category = Column(String(100))
     description = Column(Text)
     address = Column(String(512))
     city = Column(String(100), index=True)
-    state = Column(String(50), index=True)
+    state = Column(String(50))
     zip_code = Column(String(20))
     phone = Column(String(50))
     website = Column(String(512))
     rating = Column(Float)
-    hours = Column(JSON)
-    amenities = Column(JSON)
-    images = Column(JSON)
-    primary_image = Column(LargeBinary)
+    hours = Column(JSONB)
+    amenities = Column(JSONB)
+    images = Column(JSONB)
+    primary_image = deferred(Column(LargeBinary))  # loaded only when accessed
     primary_image_mime = Column(String(50))
 
     # RV-specific
@@ -196,7 +225,7 @@ class POIVerified(POIBase):
     water = Column(Boolean)
     sewer = Column(Boolean)
     dump_station = Column(Boolean)
-    fuel_types = Column(JSON)
+    fuel_types = Column(JSONB)
 
     # Quality indicators
     confidence_score = Column(Float)
@@ -3,9 +3,11 @@ Base POI Source Model
 
 Common fields for all POI source tables (Overpass, Google Places, Yelp, Foursquare)
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, LargeBinary
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, LargeBinary, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declared_attr
-from datetime import datetime, timezone
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
 from geoalchemy2 import Geometry
 
 from ..core.database import POIBase
@@ -18,6 +20,18 @@ class POISourceBase:
     def __tablename__(cls):
         return cls.__name__.lower()
 
+    @declared_attr
+    def __table_args__(cls):
+        # Bbox/radius lookups go through location; SP-GiST suits point-only data
+        return (
+            Index(f'idx_{cls.__tablename__}_location_spgist', 'location', postgresql_using='spgist'),
+            # Substring / fuzzy name search (ILIKE '%q%'); needs pg_trgm
+            Index(
+                f'idx_{cls.__tablename__}_name_trgm', 'name',
+                postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+            ),
+        )
+
     id = Column(Integer, primary_key=True, index=True)
 
     # External API identifiers
@@ -25,12 +39,12 @@ class POISourceBase:
     external_url = Column(String(512))
 
     # Core location data
-    latitude = Column(Float, nullable=False, index=True)
-    longitude = Column(Float, nullable=False, index=True)
-    location = Column(Geometry('POINT', srid=4326), index=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    location = Column(Geometry('POINT', srid=4326, spatial_index=False))
 
     # Basic information
-    name = Column(String(255), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
     category = Column(String(100), index=True)
     subcategory = Column(String(100))
     description = Column(Text)
@@ -39,9 +53,9 @@ class POISourceBase:
     address = Column(String(512))
     street_number = Column(String(50))
     street_name = Column(String(255))
-    city = Column(String(100), index=True)
+    city = Column(String(100))
     county = Column(String(100))
-    state = Column(String(50), index=True)
+    state = Column(String(50))
     zip_code = Column(String(20))
     country = Column(String(50))
     formatted_address = Column(String(512))
@@ -64,7 +78,7 @@ class POISourceBase:
     franchise = Column(Boolean, default=False)
 
     # Operating hours (JSON: {"monday": "9:00-17:00", ...})
-    hours = Column(JSON)
+    hours = Column(JSONB)
     open_24_7 = Column(Boolean, default=False)
 
     # Ratings and reviews
@@ -74,7 +88,7 @@ class POISourceBase:
     price_level = Column(Integer)  # 1-4 scale
 
     # Amenities (JSON array)
-    amenities = Column(JSON)
+    amenities = Column(JSONB)
 
     # Accessibility
     wheelchair_accessible = Column(Boolean)
@@ -83,7 +97,7 @@ class POISourceBase:
     restrooms = Column(Boolean)
 
     # Payment methods (JSON array: ["cash", "credit_card", ...])
-    payment_methods = Column(JSON)
+    payment_methods = Column(JSONB)
 
     # Fee information
     fee = Column(Boolean, default=False)
@@ -103,16 +117,21 @@ class POISourceBase:
     propane = Column(Boolean)
 
     # Fuel station specifics (JSON array: ["diesel", "gasoline", ...])
-    fuel_types = Column(JSON)
-    fuel_brands = Column(JSON)
+    fuel_types = Column(JSONB)
+    fuel_brands = Column(JSONB)
 
     # Images (JSON array of URLs or base64)
-    images = Column(JSON)
-    primary_image = Column(LargeBinary)  # Store primary image as binary
+    images = Column(JSONB)
+
+    @declared_attr
+    def primary_image(cls):
+        # Store primary image as binary; loaded only when accessed
+        return deferred(Column(LargeBinary))
+
     primary_image_mime = Column(String(50))
 
     # Tags from API (JSON: raw tag data)
-    raw_tags = Column(JSON)
+    raw_tags = Column(JSONB)
 
     # Data quality metrics
     data_completeness_score = Column(Float)  # 0-100
@@ -120,11 +139,15 @@ class POISourceBase:
     verification_status = Column(String(50))  # 'unverified', 'verified', 'flagged'
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-    last_fetched = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    last_fetched = Column(DateTime(timezone=True), server_default=func.now())
 
     # API source metadata
-    api_response = Column(JSON)  # Store full API response for debugging
+    @declared_attr
+    def api_response(cls):
+        # Store full API response for debugging; loaded only when accessed
+        return deferred(Column(JSONB))
+
     fetch_status = Column(String(50))  # 'success', 'partial', 'failed'
     fetch_error = Column(Text)
@@ -6,9 +6,10 @@ Models for user-submitted reports, corrections, and voting on POI accuracy
 NOTE: These models use Base (main database) instead of POIBase because they have
 foreign keys to the users table, which is in the main database.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey, LargeBinary
-from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, LargeBinary, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func
 
 from ..core.database import Base
 
@@ -22,6 +23,12 @@ class POIUserReport(Base):
     # Which POI this report is about (no FK - cross-database reference to wandermage_pois.poi_master.id)
     poi_id = Column(Integer, nullable=False, index=True)
 
+    # Snapshot of the POI basics taken when the report is filed, so report
+    # listings don't need a cross-database lookup per row
+    poi_name = Column(String(255))
+    poi_category = Column(String(100))
+    poi_state = Column(String(50))
+
     # Who submitted the report
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
 
@@ -35,7 +42,7 @@ class POIUserReport(Base):
     description = Column(Text)
 
     # Specific field corrections (JSON: {"field": "hours", "old_value": "...", "new_value": "..."})
-    field_corrections = Column(JSON)
+    field_corrections = Column(JSONB)
 
     # If suggesting new location
     suggested_latitude = Column(Float)
@@ -45,8 +52,8 @@ class POIUserReport(Base):
     suggested_category = Column(String(100))
 
     # Evidence (images, URLs, etc.)
-    evidence_images = Column(JSON)  # Array of image data or URLs
-    evidence_urls = Column(JSON)  # Array of evidence URLs
+    evidence_images = Column(JSONB)  # Array of image data or URLs
+    evidence_urls = Column(JSONB)  # Array of evidence URLs
     evidence_notes = Column(Text)
 
     # Status of report
@@ -67,13 +74,22 @@ class POIUserReport(Base):
     not_helpful_votes = Column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships (no POI relationship - cross-database)
     reporter = relationship("User", foreign_keys=[user_id])
     reviewer = relationship("User", foreign_keys=[reviewed_by_user_id])
 
+    __table_args__ = (
+        # Admin review queue: open reports oldest-first, answered from the index alone
+        Index(
+            'ix_poi_reports_pending', 'status', 'created_at',
+            postgresql_include=['id', 'poi_id', 'report_type', 'user_id'],
+            postgresql_where=status.in_(['pending', 'under_review'])
+        ),
+    )
+
 
 class POIVerificationVote(Base):
     """Community voting on POI accuracy"""
@@ -82,7 +98,7 @@ class POIVerificationVote(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Which POI this vote is for (no FK - cross-database reference to wandermage_pois.poi_master.id)
-    poi_id = Column(Integer, nullable=False, index=True)
+    poi_id = Column(Integer, nullable=False)
 
     # Who voted
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
@@ -101,19 +117,22 @@ class POIVerificationVote(Base):
     visit_date = Column(DateTime(timezone=True))
 
     # Evidence (photos from visit, etc.)
-    evidence_images = Column(JSON)
+    evidence_images = Column(JSONB)
 
     # Vote weight (based on user reputation)
     vote_weight = Column(Float, default=1.0)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationships (no POI relationship - cross-database)
     user = relationship("User")
 
     # Unique constraint: one vote per user per POI
     __table_args__ = (
+        UniqueConstraint('poi_id', 'user_id', name='uq_verify_vote_user_poi'),
+        # Vote tallies per POI; also serves plain poi_id lookups
+        Index('ix_poi_votes_poi_type', 'poi_id', 'vote_type', postgresql_include=['vote_weight']),
         {'extend_existing': True},
     )
 
@@ -146,7 +165,7 @@ class POIUserContribution(Base):
     verified_at = Column(DateTime(timezone=True))
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationships (no POI relationship - cross-database)
     user = relationship("User")
@@ -159,13 +178,13 @@ class POIImage(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Which POI (no FK - cross-database reference to wandermage_pois.poi_master.id)
-    poi_id = Column(Integer, nullable=False, index=True)
+    poi_id = Column(Integer, nullable=False)
 
     # Who uploaded
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
 
     # Image data
-    image_data = Column(LargeBinary, nullable=False)  # Store actual image
+    image_data = deferred(Column(LargeBinary, nullable=False))  # Store actual image; loaded only when accessed
     image_mime_type = Column(String(50), nullable=False)  # e.g., 'image/jpeg'
     image_size_bytes = Column(Integer)
     image_width = Column(Integer)
@@ -197,8 +216,14 @@ class POIImage(Base):
     flag_reason = Column(String(255))
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationships (no POI relationship - cross-database)
     uploader = relationship("User", foreign_keys=[user_id])
     verifier = relationship("User", foreign_keys=[verified_by_user_id])
+
+    __table_args__ = (
+        # Gallery listing: a POI's approved images in display order, without
+        # touching the heap (and its image_data) until a row is picked
+        Index('ix_poi_images_gallery', 'poi_id', 'is_approved', 'display_order', postgresql_include=['id']),
+    )
@@ -5,7 +5,9 @@ This provides a single source of truth for all scraper/crawler activities with
 verbose, human-readable status updates that appear intelligent and contextual.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, Computed, Index, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from datetime import datetime, timedelta
 from ..core.database import Base
@@ -66,7 +68,10 @@ class ScraperStatus(Base):
 
     # Error tracking
     errors_count = Column(Integer, default=0)
-    last_error = Column(Text)
+    # Full text (often a stack trace) is loaded only when accessed; status
+    # lines use the generated short prefix
+    last_error = deferred(Column(Text))
+    last_error_short = Column(String(100), Computed("left(last_error, 100)", persisted=True))
     last_error_at = Column(DateTime(timezone=True))
     consecutive_errors = Column(Integer, default=0)
 
@@ -78,7 +83,7 @@ class ScraperStatus(Base):
     # Last successful item (for verbose display)
     last_item_name = Column(String(255))
     last_item_location = Column(String(255))
-    last_item_details = Column(JSON)  # Additional details about last item
+    last_item_details = Column(JSONB)  # Additional details about last item
 
     # History/stats
     total_runs = Column(Integer, default=0)
@@ -86,18 +91,34 @@ class ScraperStatus(Base):
     last_successful_run = Column(DateTime(timezone=True))
 
     # Configuration
-    config = Column(JSON)  # Scraper-specific configuration
+    config = Column(JSONB)  # Scraper-specific configuration
+
+    # Derived on write by Postgres (generated columns), so the dashboard reads
+    # them like any other column and can filter on health_status
+    progress_percentage = Column(Float, Computed(
+        "CASE WHEN total_segments > 0 "
+        "THEN round(COALESCE(current_segment, 0)::numeric / total_segments * 100, 1)::float8 "
+        "ELSE 0 END",
+        persisted=True
+    ))
+    health_status = Column(String(10), Computed(
+        "CASE WHEN consecutive_errors >= 5 THEN 'critical' "
+        "WHEN consecutive_errors >= 3 OR rate_limit_hits > 10 THEN 'warning' "
+        "WHEN success_rate < 80 THEN 'degraded' "
+        "ELSE 'healthy' END",
+        persisted=True
+    ))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    @property
-    def progress_percentage(self) -> float:
-        """Calculate progress percentage."""
-        if self.total_segments and self.total_segments > 0:
-            return round((self.current_segment / self.total_segments) * 100, 1)
-        return 0.0
+    __table_args__ = (
+        # Stale-run check: running scrapers by last activity
+        Index('ix_scraper_running_activity', 'last_activity_at', postgresql_where=(status == 'running')),
+        # Health filters only ever look for the few unhealthy scrapers
+        Index('ix_scraper_unhealthy', 'health_status', postgresql_where=(health_status != 'healthy')),
+    )
 
     @property
     def elapsed_seconds(self) -> int:
@@ -117,17 +138,6 @@ class ScraperStatus(Base):
         stale_threshold = datetime.now(self.last_activity_at.tzinfo) - timedelta(minutes=5)
         return self.last_activity_at < stale_threshold
 
-    @property
-    def health_status(self) -> str:
-        """Get health status based on errors and rate limits."""
-        if self.consecutive_errors >= 5:
-            return 'critical'
-        if self.consecutive_errors >= 3 or self.rate_limit_hits > 10:
-            return 'warning'
-        if self.success_rate < 80:
-            return 'degraded'
-        return 'healthy'
-
     def get_intelligent_status(self) -> str:
         """
         Generate an intelligent, contextual status message.
@@ -169,8 +179,8 @@ class ScraperStatus(Base):
             return "Paused"
 
         if self.status == 'failed':
-            if self.last_error:
-                return f"Failed - {self.last_error[:100]}"
+            if self.last_error_short:
+                return f"Failed - {self.last_error_short}"
             return "Failed - Unknown error"
 
         if self.status == 'completed':
@@ -180,15 +190,6 @@ class ScraperStatus(Base):
 
     def to_dashboard_dict(self) -> dict:
         """Convert to dictionary for dashboard display."""
-        # Parse config if it's a string
-        config_data = self.config
-        if isinstance(config_data, str):
-            import json
-            try:
-                config_data = json.loads(config_data)
-            except:
-                config_data = {}
-
         return {
             'id': self.id,
             'scraper_type': self.scraper_type,
@@ -215,7 +216,8 @@ class ScraperStatus(Base):
             'elapsed_seconds': self.elapsed_seconds,
             'avg_items_per_minute': self.avg_items_per_minute,
             'errors_count': self.errors_count,
-            'last_error': self.last_error,
+            # The dashboard only shows the full error for failed scrapers
+            'last_error': self.last_error if self.status == 'failed' else self.last_error_short,
             'health_status': self.health_status,
             'last_item_name': self.last_item_name,
             'last_item_location': self.last_item_location,
@@ -224,7 +226,7 @@ class ScraperStatus(Base):
             'total_items_collected': self.total_items_collected,
             'last_successful_run': self.last_successful_run.isoformat() if self.last_successful_run else None,
             'is_stale': self.is_stale,
-            'config': config_data,
+            'config': self.config,
         }
 
 
@@ -291,20 +293,19 @@ DEFAULT_SCRAPERS = [
 
 def initialize_default_scrapers(db):
     """Initialize default scraper status records if they don't exist."""
-    for scraper_config in DEFAULT_SCRAPERS:
-        existing = db.query(ScraperStatus).filter(
-            ScraperStatus.scraper_type == scraper_config['scraper_type']
-        ).first()
-
-        if not existing:
-            scraper = ScraperStatus(
-                scraper_type=scraper_config['scraper_type'],
-                display_name=scraper_config['display_name'],
-                description=scraper_config['description'],
-                icon=scraper_config['icon'],
-                config=scraper_config['config'],
-                status='idle'
-            )
-            db.add(scraper)
-
+    # One INSERT ... ON CONFLICT DO NOTHING instead of a lookup per scraper type
+    rows = [
+        {
+            'scraper_type': scraper_config['scraper_type'],
+            'display_name': scraper_config['display_name'],
+            'description': scraper_config['description'],
+            'icon': scraper_config['icon'],
+            'config': scraper_config['config'],
+            'status': 'idle',
+        }
+        for scraper_config in DEFAULT_SCRAPERS
+    ]
+    db.execute(
+        insert(ScraperStatus).values(rows).on_conflict_do_nothing(index_elements=['scraper_type'])
+    )
     db.commit()
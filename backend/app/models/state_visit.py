@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -30,3 +30,8 @@ class StateVisit(Base):
 
     # Relationships
     user = relationship("User", back_populates="state_visits")
+
+    # One row per user per state; lets create_state_visit upsert in one statement
+    __table_args__ = (
+        UniqueConstraint('user_id', 'state_code', name='uq_state_visit_user_state'),
+    )
@@ -4,7 +4,11 @@ System Settings Model - Stores application-wide configuration like API keys.
 Settings are stored with encryption for sensitive values like API keys.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+import time
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import func
 from ..core.database import Base
 
@@ -30,29 +34,63 @@ class SystemSetting(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+# Settings change rarely but are read on hot paths; get_setting serves repeat
+# reads from memory for this long. set_setting drops the key in this process,
+# other workers pick the change up when their entry expires.
+SETTING_CACHE_TTL_SECONDS = 60
+_SETTING_CACHE_MAX_KEYS = 512
+
+_MISSING = object()
+_setting_cache: Dict[str, tuple] = {}  # key -> (expires_at, value or _MISSING)
+
+
 # Helper functions for common settings
 def get_setting(db, key: str, default: str = None) -> str:
     """Get a setting value by key"""
-    setting = db.query(SystemSetting).filter(SystemSetting.key == key).first()
-    return setting.value if setting else default
+    now = time.monotonic()
+    cached = _setting_cache.get(key)
+    if cached and cached[0] > now:
+        value = cached[1]
+    else:
+        row = db.execute(
+            select(SystemSetting.value).where(SystemSetting.key == key)
+        ).first()
+        value = row[0] if row else _MISSING
+        if len(_setting_cache) >= _SETTING_CACHE_MAX_KEYS:
+            _setting_cache.clear()
+        _setting_cache[key] = (now + SETTING_CACHE_TTL_SECONDS, value)
+    return default if value is _MISSING else value
 
 
-def set_setting(db, key: str, value: str, description: str = None, is_sensitive: bool = False):
-    """Set a setting value"""
-    setting = db.query(SystemSetting).filter(SystemSetting.key == key).first()
+def get_settings_bulk(db, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Get several setting values in one query. Missing keys map to None."""
+    keys = list(keys)
+    rows = db.execute(
+        select(SystemSetting.key, SystemSetting.value).where(SystemSetting.key.in_(keys))
+    ).all()
+    found = dict(rows)
+    return {key: found.get(key) for key in keys}
 
-    if setting:
-        setting.value = value
-        if description:
-            setting.description = description
-    else:
-        setting = SystemSetting(
-            key=key,
-            value=value,
-            description=description,
-            is_sensitive=is_sensitive
-        )
-        db.add(setting)
 
+def set_setting(db, key: str, value: str, description: str = None, is_sensitive: bool = False):
+    """Set a setting value (single INSERT ... ON CONFLICT round trip)"""
+    stmt = insert(SystemSetting).values(
+        key=key,
+        value=value,
+        description=description,
+        is_sensitive=is_sensitive
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SystemSetting.key],
+        set_={
+            'value': stmt.excluded.value,
+            # Keep the existing description unless a new one was given
+            'description': func.coalesce(func.nullif(stmt.excluded.description, ''), SystemSetting.description),
+            'updated_at': func.now(),
+        }
+    ).returning(SystemSetting)
+
+    setting = db.scalars(stmt).one()
     db.commit()
+    _setting_cache.pop(key, None)
     return setting
@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Computed, Integer, Numeric, String, Float, DateTime, Text, ForeignKey, Boolean, JSON
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from geoalchemy2 import Geography
 from ..core.database import Base
+from ..core.geo_types import CachedGeography
+
+TRIP_STATUSES = ('planning', 'planned', 'in_progress', 'completed', 'cancelled')
 
 
 class Trip(Base):
@@ -20,17 +23,21 @@ class Trip(Base):
     end_date = Column(DateTime(timezone=True))
 
     # Status
-    status = Column(String, default="planning")  # planning, planned, in_progress, completed, cancelled
+    status = Column(ENUM(*TRIP_STATUSES, name="trip_status"), default="planning")
     status_detail = Column(String, nullable=True)  # Verbose status message
 
     # Calculated fields (updated via triggers or application logic)
     total_distance_miles = Column(Float, default=0.0)
-    total_fuel_cost = Column(Float, default=0.0)
+    total_fuel_cost = Column(Numeric(12, 4, asdecimal=False), default=0.0)  # exact money, float in Python
     total_fuel_gallons = Column(Float, default=0.0)
 
     # Map image URL
     image_url = Column(String, nullable=True)
 
+    # Cached gap analysis, reused while the hashed inputs (stops, daily limit, start date) are unchanged
+    gap_analysis_hash = Column(String(64), nullable=True)
+    gap_analysis_result = Column(JSON, nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -38,10 +45,14 @@ class Trip(Base):
     user = relationship("User", back_populates="trips", foreign_keys=[user_id])
     driver = relationship("User", foreign_keys=[driver_id])
     rv_profile = relationship("RVProfile")
-    stops = relationship("TripStop", back_populates="trip", cascade="all, delete-orphan", order_by="TripStop.stop_order")
-    route_notes = relationship("RouteNote", back_populates="trip", cascade="all, delete-orphan")
-    gap_suggestions = relationship("GapSuggestion", back_populates="trip", cascade="all, delete-orphan")
-    harvest_host_stays = relationship("HarvestHostStay", back_populates="trip")
+    # The Trip schema embeds stops, route_notes and gap_suggestions, so load
+    # each with one IN (...) query per batch of trips instead of one per trip
+    stops = relationship("TripStop", back_populates="trip", cascade="all, delete-orphan", order_by="TripStop.stop_order", lazy="selectin")
+    route_notes = relationship("RouteNote", back_populates="trip", cascade="all, delete-orphan", lazy="selectin")
+    gap_suggestions = relationship("GapSuggestion", back_populates="trip", cascade="all, delete-orphan", lazy="selectin")
+    # Not part of the Trip schema; raise on implicit access so list endpoints
+    # can't silently N+1 (query the child table or use selectinload instead)
+    harvest_host_stays = relationship("HarvestHostStay", back_populates="trip", lazy="raise")
 
 
 class TripStop(Base):
@@ -61,10 +72,11 @@ class TripStop(Base):
     country = Column(String, default="USA")
     timezone = Column(String)
 
-    # Geographic coordinates (PostGIS point)
-    location = Column(Geography(geometry_type='POINT', srid=4326))
-    latitude = Column(Float)
-    longitude = Column(Float)
+    # Geographic coordinates (PostGIS point); latitude/longitude are derived
+    # from it by the database so only the point is written
+    location = Column(CachedGeography(geometry_type='POINT', srid=4326))
+    latitude = Column(Float, Computed("ST_Y(location::geometry)", persisted=True))
+    longitude = Column(Float, Computed("ST_X(location::geometry)", persisted=True))
 
     # Stop details
     arrival_time = Column(DateTime(timezone=True))
@@ -99,10 +111,10 @@ class RouteNote(Base):
     id = Column(Integer, primary_key=True, index=True)
     trip_id = Column(Integer, ForeignKey("trips.id"), nullable=False)
 
-    # Location along route
-    location = Column(Geography(geometry_type='POINT', srid=4326))
-    latitude = Column(Float)
-    longitude = Column(Float)
+    # Location along route (latitude/longitude derived from the point)
+    location = Column(CachedGeography(geometry_type='POINT', srid=4326))
+    latitude = Column(Float, Computed("ST_Y(location::geometry)", persisted=True))
+    longitude = Column(Float, Computed("ST_X(location::geometry)", persisted=True))
 
     # Note details
     title = Column(String, nullable=False)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -16,14 +17,14 @@ class User(Base):
     is_admin = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    preferences = Column(JSON, default=dict)
+    preferences = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)
 
     # Role for permission system
     role = Column(String(50), default="user")  # owner, admin, user, or custom role
 
     # Relationships
     trips = relationship("Trip", back_populates="user", cascade="all, delete-orphan", foreign_keys="Trip.user_id")
-    fuel_logs = relationship("FuelLog", back_populates="user", cascade="all, delete-orphan")
+    fuel_logs = relationship("FuelLog", back_populates="user", cascade="all, delete-orphan", order_by="FuelLog.date.desc()")
     state_visits = relationship("StateVisit", back_populates="user", cascade="all, delete-orphan")
     rv_profiles = relationship("RVProfile", back_populates="user", cascade="all, delete-orphan")
     harvest_host_stays = relationship("HarvestHostStay", back_populates="user", cascade="all, delete-orphan")
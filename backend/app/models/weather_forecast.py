@@ -1,7 +1,8 @@
 """
 Weather Forecast Model - Stores weather forecasts from NWS API for historical tracking
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Index, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Index, ForeignKey, Boolean
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..core.database import Base
@@ -26,7 +27,7 @@ class WeatherForecast(Base):
     trip_stop_id = Column(Integer, ForeignKey("trip_stops.id"), nullable=True, index=True)
 
     # Location type for easier querying
-    location_type = Column(String, nullable=False, index=True)  # 'user_location', 'trip_stop', 'manual'
+    location_type = Column(ENUM('user_location', 'trip_stop', 'manual', name='weather_location_type'), nullable=False, index=True)
     location_name = Column(String, nullable=True)  # Human-readable name
 
     # NWS Grid information (for API calls)
@@ -35,11 +36,11 @@ class WeatherForecast(Base):
     nws_grid_y = Column(Integer, nullable=True)
 
     # Forecast data
-    forecast_type = Column(String, nullable=False, index=True)  # 'daily', 'hourly'
-    forecast_data = Column(JSON, nullable=False)  # The actual forecast periods
+    forecast_type = Column(ENUM('daily', 'hourly', name='weather_forecast_type'), nullable=False, index=True)
+    forecast_data = Column(JSONB, nullable=False)  # The actual forecast periods
 
     # Weather alerts at time of fetch
-    alerts = Column(JSON, nullable=True)  # Any active alerts
+    alerts = Column(JSONB, nullable=True)  # Any active alerts
 
     # Timing
     fetched_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
@@ -50,7 +51,7 @@ class WeatherForecast(Base):
     valid_until = Column(DateTime(timezone=True), nullable=True)
 
     # Cache status
-    is_current = Column(Boolean, default=True, index=True)  # Is this the latest forecast for this location?
+    is_current = Column(Boolean, default=True)  # Is this the latest forecast for this location?
 
     # Relationships
     user = relationship("User", backref="weather_forecasts")
@@ -58,8 +59,15 @@ class WeatherForecast(Base):
     __table_args__ = (
         Index('ix_weather_forecast_location', 'latitude', 'longitude'),
         Index('ix_weather_forecast_trip_stop', 'trip_stop_id', 'fetched_at'),
-        Index('ix_weather_forecast_user_current', 'user_id', 'location_type', 'is_current'),
-        Index('ix_weather_forecast_type_current', 'forecast_type', 'is_current', 'fetched_at'),
+        # "Latest forecast" lookups only ever want is_current rows, a small
+        # fraction of the retained history
+        Index('ix_weather_forecast_user_current', 'user_id', 'location_type', postgresql_where=(is_current == True)),
+        Index('ix_weather_forecast_type_current', 'forecast_type', 'fetched_at', postgresql_where=(is_current == True)),
+        # Current forecast per trip stop. forecast_data is not INCLUDEd: payloads
+        # can exceed the ~2.7kB B-tree tuple limit, and it is read from the heap anyway
+        Index('ix_wf_current_by_stop', 'trip_stop_id', postgresql_where=(is_current == True),
+              postgresql_include=['forecast_type', 'fetched_at']),
+        Index('ix_weather_forecast_data_gin', 'forecast_data', postgresql_using='gin', postgresql_ops={'forecast_data': 'jsonb_path_ops'}),
     )
 
 
@@ -77,13 +85,13 @@ class WeatherAlert(Base):
 
     # Alert details
     event = Column(String, nullable=False, index=True)  # e.g., "Winter Storm Warning"
-    severity = Column(String, nullable=False, index=True)  # Minor, Moderate, Severe, Extreme
+    severity = Column(ENUM('Minor', 'Moderate', 'Severe', 'Extreme', 'Unknown', name='weather_alert_severity'), nullable=False, index=True)
     certainty = Column(String, nullable=True)  # Possible, Likely, Observed
     urgency = Column(String, nullable=True)  # Immediate, Expected, Future
 
     # Affected area
     area_desc = Column(String, nullable=True)
-    affected_zones = Column(JSON, nullable=True)  # List of NWS zone IDs
+    affected_zones = Column(JSONB, nullable=True)  # List of NWS zone IDs
 
     # Geographic bounds (for quick spatial queries)
     min_lat = Column(Float, nullable=True)
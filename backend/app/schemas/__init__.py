@@ -5,6 +5,17 @@ from .poi import POI, POICreate, OverpassHeight
 from .fuel_log import FuelLog, FuelLogCreate
 from .metrics import TripMetrics, FuelMetrics
 
+from typing import List
+
+from pydantic import TypeAdapter
+
+# List-response adapters, built once at import. Hot list endpoints validate
+# their ORM rows and encode JSON through these directly (validate_python +
+# dump_json) instead of FastAPI's validate, serialize, then json.dumps.
+TripListAdapter = TypeAdapter(List[Trip])
+TripStopListAdapter = TypeAdapter(List[TripStop])
+FuelLogListAdapter = TypeAdapter(List[FuelLog])
+
 __all__ = [
     "User",
     "UserCreate",
@@ -27,4 +38,7 @@ __all__ = [
     "FuelLogCreate",
     "TripMetrics",
     "FuelMetrics",
+    "TripListAdapter",
+    "TripStopListAdapter",
+    "FuelLogListAdapter",
 ]
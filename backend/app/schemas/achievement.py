@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -22,8 +22,7 @@ class AchievementDefinition(BaseModel):
     points: int = 10
     rarity: str = 'common'
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserAchievement(BaseModel):
@@ -47,8 +46,7 @@ class UserAchievement(BaseModel):
     # Include the achievement definition
     achievement: Optional[AchievementDefinition] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AchievementProgress(BaseModel):
@@ -3,7 +3,7 @@ Crawl Status Schemas
 
 Pydantic schemas for crawl status API requests and responses.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -59,5 +59,4 @@ class CrawlStatus(CrawlStatusBase):
     avg_time_per_cell: float
     estimated_time_remaining_seconds: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -34,8 +34,7 @@ class POI(POIBase):
     external_id: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OverpassHeight(BaseModel):
@@ -52,8 +51,7 @@ class OverpassHeight(BaseModel):
     verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SurveillanceCamera(BaseModel):
@@ -82,5 +80,4 @@ class SurveillanceCamera(BaseModel):
     shodan_url: Optional[str] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
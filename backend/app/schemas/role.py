@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 
@@ -17,8 +17,7 @@ class RolePermission(BaseModel):
     permission_value: bool = True
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CustomRoleCreate(BaseModel):
@@ -48,8 +47,7 @@ class CustomRole(BaseModel):
     created_by_user_id: Optional[int] = None
     permissions: List[RolePermission] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserRoleUpdate(BaseModel):
@@ -1,7 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional, List
 from datetime import datetime
 
+TripStatus = Literal['planning', 'planned', 'in_progress', 'completed', 'cancelled']
+
 
 class TripStopBase(BaseModel):
     stop_order: int
@@ -34,8 +36,7 @@ class TripStop(TripStopBase):
     trip_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RouteNoteBase(BaseModel):
@@ -56,8 +57,7 @@ class RouteNote(RouteNoteBase):
     trip_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TripBase(BaseModel):
@@ -66,7 +66,7 @@ class TripBase(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     rv_profile_id: Optional[int] = None
-    status: str = "planning"
+    status: TripStatus = "planning"
     status_detail: Optional[str] = None
 
 
@@ -80,7 +80,7 @@ class TripUpdate(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     rv_profile_id: Optional[int] = None
-    status: Optional[str] = None
+    status: Optional[TripStatus] = None
     status_detail: Optional[str] = None
 
 
@@ -100,8 +100,7 @@ class GapSuggestion(GapSuggestionBase):
     trip_id: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Trip(TripBase):
@@ -117,5 +116,4 @@ class Trip(TripBase):
     route_notes: List[RouteNote] = []
     gap_suggestions: List[GapSuggestion] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -4,6 +4,8 @@ EIA Fuel Price Service - Fetches fuel prices from EIA API and stores in database
 import logging
 import httpx
 from datetime import datetime, date, timezone
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from ..core.database import SessionLocal
@@ -195,9 +197,7 @@ async def fetch_and_store_fuel_prices(api_key: str = None) -> dict:
         db.close()
         return {"success": False, "error": str(e)}
 
-    stored_count = 0
     total_items = sum(len(regions) for regions in prices.values())
-    processed = 0
 
     # Update status with total items found
     update_scraper_status(
@@ -209,50 +209,31 @@ async def fetch_and_store_fuel_prices(api_key: str = None) -> dict:
     )
 
     try:
+        rows = []
         for grade, regions in prices.items():
             for region, data in regions.items():
-                if not data:
-                    processed += 1
-                    continue
-
-                price_date = datetime.strptime(data["date"], "%Y-%m-%d").date()
-                price_value = data["price"]
-
-                # Check if we already have this exact price
-                existing = db.query(FuelPrice).filter(
-                    FuelPrice.region == region,
-                    FuelPrice.grade == grade,
-                    FuelPrice.price_date == price_date
-                ).first()
-
-                if existing:
-                    # Update if price changed, but count as saved either way (confirmed data)
-                    if existing.price_per_gallon != price_value:
-                        existing.price_per_gallon = price_value
-                    stored_count += 1
-                else:
-                    # Insert new price
-                    fuel_price = FuelPrice(
-                        region=region,
-                        grade=grade,
-                        price_per_gallon=price_value,
-                        price_date=price_date
-                    )
-                    db.add(fuel_price)
-                    stored_count += 1
-
-                processed += 1
-
-                # Update progress
-                update_scraper_status(
-                    current_activity=f"Processing {grade}",
-                    current_detail=f"{region}: ${price_value:.3f}",
-                    items_processed=processed,
-                    items_saved=stored_count,
-                    current_segment=processed,
-                    total_segments=total_items,
-                    last_activity_at=datetime.now(timezone.utc)
-                )
+                if data:
+                    rows.append({
+                        "region": region,
+                        "grade": grade,
+                        "price_per_gallon": data["price"],
+                        "price_date": datetime.strptime(data["date"], "%Y-%m-%d").date()
+                    })
+
+        # Upsert the whole dump in one statement; existing prices are only
+        # rewritten when they changed, but count as saved either way (confirmed data)
+        if rows:
+            stmt = insert(FuelPrice).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FuelPrice.region, FuelPrice.grade, FuelPrice.price_date],
+                set_={
+                    "price_per_gallon": stmt.excluded.price_per_gallon,
+                    "updated_at": func.now()
+                },
+                where=FuelPrice.price_per_gallon != stmt.excluded.price_per_gallon
+            )
+            db.execute(stmt)
+        stored_count = len(rows)
 
         db.commit()
         logger.info(f"Stored {stored_count} fuel prices")
@@ -262,7 +243,9 @@ async def fetch_and_store_fuel_prices(api_key: str = None) -> dict:
             status='idle',
             current_activity='Completed',
             current_detail=f'Updated {stored_count} prices',
+            items_processed=total_items,
             items_saved=stored_count,
+            current_segment=total_items,
             completed_at=datetime.now(timezone.utc),
             last_successful_run=datetime.now(timezone.utc)
         )
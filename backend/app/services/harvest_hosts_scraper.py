@@ -16,9 +16,12 @@ import logging
 import asyncio
 import json
 import re
+import time
 from datetime import datetime, timezone, date
 from typing import List, Dict, Optional, Any
 from playwright.async_api import async_playwright, Browser, Page
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from geoalchemy2.elements import WKTElement
 
@@ -29,6 +32,9 @@ from ..models.scraper_status import ScraperStatus
 
 logger = logging.getLogger(__name__)
 
+# Per-item progress is written to scraper_status at most this often
+STATUS_HEARTBEAT_INTERVAL_SECONDS = 5
+
 
 class HarvestHostsScraper:
     """Scraper for Harvest Hosts data"""
@@ -42,6 +48,8 @@ class HarvestHostsScraper:
         self.errors = 0
         self.session_cookies = None
         self.scraper_type = scraper_type
+        self._pending_status: Dict[str, Any] = {}
+        self._status_written_at = 0.0
 
     async def login(self, email: str, password: str) -> bool:
         """Log in to Harvest Hosts using the correct form selectors"""
@@ -378,38 +386,29 @@ class HarvestHostsScraper:
             return None
 
     def save_host(self, db: Session, host_data: dict) -> bool:
-        """Save or update host in database"""
+        """Insert or update host in database with a single upsert"""
         try:
-            existing = db.query(HarvestHost).filter(
-                HarvestHost.hh_id == host_data['hh_id']
-            ).first()
-
-            if existing:
-                # Update existing
-                for key, value in host_data.items():
-                    if key not in ['hh_id', 'latitude', 'longitude']:
-                        setattr(existing, key, value)
-                existing.last_scraped = datetime.now(timezone.utc)
-                existing.updated_at = datetime.now(timezone.utc)
-            else:
-                # Create new
-                lat = host_data.get('latitude')
-                lon = host_data.get('longitude')
-
-                location = None
-                if lat and lon:
-                    point_wkt = f"POINT({lon} {lat})"
-                    location = WKTElement(point_wkt, srid=4326)
-
-                new_host = HarvestHost(
-                    **{k: v for k, v in host_data.items() if k not in ['latitude', 'longitude']},
-                    latitude=lat,
-                    longitude=lon,
-                    location=location,
-                    last_scraped=datetime.now(timezone.utc)
-                )
-                db.add(new_host)
-
+            now = datetime.now(timezone.utc)
+            lat = host_data.get('latitude')
+            lon = host_data.get('longitude')
+
+            location = None
+            if lat and lon:
+                point_wkt = f"POINT({lon} {lat})"
+                location = WKTElement(point_wkt, srid=4326)
+
+            stmt = insert(HarvestHost).values(**host_data, location=location, last_scraped=now)
+            # Coordinates are kept from the first scrape of a host
+            updates = {
+                key: stmt.excluded[key]
+                for key in host_data
+                if key not in ['hh_id', 'latitude', 'longitude']
+            }
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HarvestHost.hh_id],
+                set_={**updates, 'last_scraped': now, 'updated_at': now}
+            )
+            db.execute(stmt)
             db.commit()
             return True
 
@@ -503,7 +502,7 @@ class HarvestHostsScraper:
             for i, stay_id in enumerate(stay_ids):
                 logger.info(f"Scraping stay {i+1}/{len(stay_ids)}: ID {stay_id}")
 
-                self._update_status(
+                self._heartbeat(
                     current_activity=f'Scraping stay {i+1}/{len(stay_ids)}',
                     current_detail=f'Stay ID: {stay_id}',
                     items_processed=i,
@@ -518,6 +517,7 @@ class HarvestHostsScraper:
 
                 await asyncio.sleep(1.5)  # Rate limiting
 
+            self._update_status()
             logger.info(f"Scraped {len(stays)} stays total")
             return stays
 
@@ -1055,27 +1055,16 @@ class HarvestHostsScraper:
             return self._parse_stay_data(stay, user_id)
 
     def save_stay(self, db: Session, stay_data: dict) -> bool:
-        """Save or update stay in database"""
+        """Insert or update stay in database with a single upsert"""
         try:
-            existing = db.query(HarvestHostStay).filter(
-                HarvestHostStay.hh_stay_id == stay_data['hh_stay_id']
-            ).first()
-
-            if existing:
-                # Update existing
-                for key, value in stay_data.items():
-                    if key != 'hh_stay_id':
-                        setattr(existing, key, value)
-                existing.last_synced = datetime.now(timezone.utc)
-                existing.updated_at = datetime.now(timezone.utc)
-            else:
-                # Create new
-                new_stay = HarvestHostStay(
-                    **stay_data,
-                    last_synced=datetime.now(timezone.utc)
-                )
-                db.add(new_stay)
-
+            now = datetime.now(timezone.utc)
+            stmt = insert(HarvestHostStay).values(**stay_data, last_synced=now)
+            updates = {key: stmt.excluded[key] for key in stay_data if key != 'hh_stay_id'}
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HarvestHostStay.hh_stay_id],
+                set_={**updates, 'last_synced': now, 'updated_at': now}
+            )
+            db.execute(stmt)
             db.commit()
             return True
 
@@ -1085,20 +1074,36 @@ class HarvestHostsScraper:
             return False
 
     def _update_status(self, **kwargs):
-        """Update scraper status in database"""
+        """Update scraper status in database (including any pending heartbeat fields)"""
+        fields = {**self._pending_status, **kwargs}
+        self._pending_status = {}
+        self._status_written_at = time.monotonic()
+        if not fields:
+            return
         try:
             db = SessionLocal()
-            scraper = db.query(ScraperStatus).filter(
-                ScraperStatus.scraper_type == self.scraper_type
-            ).first()
-            if scraper:
-                for key, value in kwargs.items():
-                    setattr(scraper, key, value)
+            try:
+                db.execute(
+                    update(ScraperStatus)
+                    .where(ScraperStatus.scraper_type == self.scraper_type)
+                    .values(**fields)
+                )
                 db.commit()
-            db.close()
+            finally:
+                db.close()
         except Exception as e:
             logger.error(f"Error updating scraper status: {e}")
 
+    def _heartbeat(self, **kwargs):
+        """
+        Record per-item progress. Fields are coalesced in memory and written
+        with one UPDATE per STATUS_HEARTBEAT_INTERVAL_SECONDS; the next
+        _update_status call writes whatever is still pending.
+        """
+        self._pending_status.update(kwargs)
+        if time.monotonic() - self._status_written_at >= STATUS_HEARTBEAT_INTERVAL_SECONDS:
+            self._update_status()
+
     async def run_scrape(self, email: str, password: str, user_id: int = None, scrape_hosts: bool = True, scrape_stays: bool = True):
         """Run the full scraping process"""
         logger.info("Starting Harvest Hosts scrape")
@@ -1196,7 +1201,7 @@ class HarvestHostsScraper:
                                         if self.save_host(db, host_data):
                                             self.hosts_scraped += 1
                                             # Update status with last saved host
-                                            self._update_status(
+                                            self._heartbeat(
                                                 items_saved=self.hosts_scraped,
                                                 items_processed=i + 1,
                                                 current_segment=i + 1,
@@ -1211,7 +1216,7 @@ class HarvestHostsScraper:
 
                                     # Progress logging and status update
                                     if (i + 1) % 10 == 0:
-                                        self._update_status(
+                                        self._heartbeat(
                                             current_activity=f'Scraping hosts',
                                             current_detail=f'Processed {i + 1}/{len(host_ids)} - Saved {self.hosts_scraped}',
                                             items_processed=i + 1,
@@ -1234,6 +1239,7 @@ class HarvestHostsScraper:
 
                         finally:
                             db.close()
+                            self._update_status()
 
                         logger.info(f"Host scrape complete: {self.hosts_scraped} hosts saved, {self.errors} errors")
                     else:
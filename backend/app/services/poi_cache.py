@@ -0,0 +1,65 @@
+"""
+POI Cache - Redis cache-aside for single POI reads.
+
+The same popular POIs are fetched by id over and over as trips are viewed.
+When REDIS_URL is configured the serialized POI is cached for
+POI_CACHE_TTL_SECONDS and dropped whenever the row is updated or deleted
+through the ORM. Core bulk writes from the crawlers do not fire ORM events,
+so the TTL bounds how stale an entry can get. Without Redis every read goes
+to the database. Any Redis error falls back silently to the database.
+"""
+
+import json
+import logging
+from typing import Optional
+
+from sqlalchemy import event
+
+from ..core.redis_client import get_redis
+from ..models.poi import POI
+
+logger = logging.getLogger(__name__)
+
+POI_CACHE_TTL_SECONDS = 300
+_KEY_PREFIX = "wm:poi:"
+
+
+def get_cached_poi(poi_id: int) -> Optional[dict]:
+    """Return the cached serialized POI, or None on a miss."""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(f"{_KEY_PREFIX}{poi_id}")
+        return json.loads(raw) if raw is not None else None
+    except Exception as e:
+        logger.debug(f"Redis POI cache read failed: {e}")
+        return None
+
+
+def set_cached_poi(poi_id: int, data: dict) -> None:
+    """Cache a serialized POI (JSON-compatible dict)."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(f"{_KEY_PREFIX}{poi_id}", POI_CACHE_TTL_SECONDS, json.dumps(data))
+    except Exception as e:
+        logger.debug(f"Redis POI cache write failed: {e}")
+
+
+def invalidate_poi(poi_id: int) -> None:
+    """Drop a cached POI."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(f"{_KEY_PREFIX}{poi_id}")
+    except Exception as e:
+        logger.debug(f"Redis POI cache invalidation failed: {e}")
+
+
+@event.listens_for(POI, "after_update")
+@event.listens_for(POI, "after_delete")
+def _invalidate_on_write(mapper, connection, target):
+    invalidate_poi(target.id)
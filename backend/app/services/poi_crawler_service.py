@@ -22,8 +22,8 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
 from math import cos
 from sqlalchemy.orm import Session
-from geoalchemy2.elements import WKTElement
 
+from ..core.bulk_copy import ewkb_point
 from ..core.database import SessionLocal
 from ..models.poi import POI as POIModel
 from ..models.crawl_status import CrawlStatus as CrawlStatusModel
@@ -611,39 +611,41 @@ class POICrawlerService:
 
     def upsert_pois(self, db: Session, pois: List[dict]) -> int:
         """Insert or update POIs in database with all available data"""
+        # Last occurrence wins when a cell returns the same element twice
+        by_external_id = {poi_data["external_id"]: poi_data for poi_data in pois if poi_data.get("external_id")}
         updated_count = 0
 
-        for poi_data in pois:
-            try:
-                existing = db.query(POIModel).filter(
-                    POIModel.external_id == poi_data["external_id"]
-                ).first()
-
-                if existing:
-                    # Update existing POI with all new data
-                    for key, value in poi_data.items():
-                        if key not in ["latitude", "longitude", "external_id"]:
-                            setattr(existing, key, value)
-                    existing.updated_at = datetime.now(timezone.utc)
-                    updated_count += 1
-                else:
-                    # Create new POI
-                    point_wkt = f"POINT({poi_data['longitude']} {poi_data['latitude']})"
-                    new_poi = POIModel(
-                        **{k: v for k, v in poi_data.items() if k not in ["latitude", "longitude"]},
-                        latitude=poi_data["latitude"],
-                        longitude=poi_data["longitude"],
-                        location=WKTElement(point_wkt, srid=4326),
-                        source="overpass"
-                    )
-                    db.add(new_poi)
-                    updated_count += 1
-
-            except Exception as e:
-                logger.error(f"Error upserting POI {poi_data.get('external_id')}: {str(e)}")
-                continue
-
         try:
+            # One lookup for the whole batch instead of a query per POI
+            existing_pois = db.query(POIModel).filter(
+                POIModel.external_id.in_(list(by_external_id))
+            ).all()
+            now = datetime.now(timezone.utc)
+
+            for existing in existing_pois:
+                # Update existing POI with all new data
+                poi_data = by_external_id.pop(existing.external_id)
+                for key, value in poi_data.items():
+                    if key not in ["latitude", "longitude", "external_id"]:
+                        setattr(existing, key, value)
+                existing.updated_at = now
+                updated_count += 1
+
+            # Build rows for the remaining new POIs, skipping malformed ones
+            new_rows = []
+            for poi_data in by_external_id.values():
+                try:
+                    new_rows.append({
+                        **poi_data,
+                        "location": ewkb_point(poi_data["longitude"], poi_data["latitude"]),
+                        "source": "overpass"
+                    })
+                except Exception as e:
+                    logger.error(f"Error upserting POI {poi_data.get('external_id')}: {str(e)}")
+
+            # Insert in batches; a failing batch falls back to per-row inserts
+            updated_count += POIModel.bulk_insert_or_skip(db, new_rows, ewkb_columns=("location",))
+
             db.commit()
             logger.info(f"Successfully upserted {updated_count} POIs")
         except Exception as e:
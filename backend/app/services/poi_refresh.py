@@ -9,8 +9,8 @@ import httpx
 from datetime import datetime, timezone
 from typing import List
 from sqlalchemy.orm import Session
-from geoalchemy2.elements import WKTElement
 
+from ..core.bulk_copy import ewkb_point
 from ..core.database import SessionLocal
 from ..models.poi import POI as POIModel
 from ..api.pois import POI_CATEGORIES, determine_poi_type
@@ -162,46 +162,50 @@ async def fetch_pois_for_region(region: dict, categories: List[str]) -> List[dic
 
 def upsert_pois(db: Session, pois: List[dict]) -> int:
     """Insert or update POIs in database"""
+    # Last occurrence wins when a region returns the same element twice
+    by_external_id = {poi_data["external_id"]: poi_data for poi_data in pois if poi_data.get("external_id")}
     updated_count = 0
 
-    for poi_data in pois:
-        try:
-            # Check if this external POI already exists
-            existing = db.query(POIModel).filter(
-                POIModel.external_id == poi_data["external_id"]
-            ).first()
-
-            if existing:
-                # Update existing
-                existing.name = poi_data["name"]
-                existing.category = poi_data["category"]
-                existing.phone = poi_data.get("phone")
-                existing.website = poi_data.get("website")
-                existing.amenities = str(poi_data.get("tags", {}))
-                existing.updated_at = datetime.now(timezone.utc)
-                updated_count += 1
-            else:
-                # Create new
-                point_wkt = f"POINT({poi_data['longitude']} {poi_data['latitude']})"
-                new_poi = POIModel(
-                    external_id=poi_data["external_id"],
-                    name=poi_data["name"],
-                    category=poi_data["category"],
-                    latitude=poi_data["latitude"],
-                    longitude=poi_data["longitude"],
-                    phone=poi_data.get("phone"),
-                    website=poi_data.get("website"),
-                    location=WKTElement(point_wkt, srid=4326),
-                    source="overpass",
-                    amenities=str(poi_data.get("tags", {}))
-                )
-                db.add(new_poi)
-                updated_count += 1
-        except Exception as e:
-            logger.error(f"Error upserting POI {poi_data.get('external_id')}: {str(e)}")
-            continue
-
     try:
+        # One lookup for the whole batch instead of a query per POI
+        existing_pois = db.query(POIModel).filter(
+            POIModel.external_id.in_(list(by_external_id))
+        ).all()
+        now = datetime.now(timezone.utc)
+
+        for existing in existing_pois:
+            # Update existing
+            poi_data = by_external_id.pop(existing.external_id)
+            existing.name = poi_data["name"]
+            existing.category = poi_data["category"]
+            existing.phone = poi_data.get("phone")
+            existing.website = poi_data.get("website")
+            existing.amenities = str(poi_data.get("tags", {}))
+            existing.updated_at = now
+            updated_count += 1
+
+        # Create new, skipping malformed rows
+        new_rows = []
+        for poi_data in by_external_id.values():
+            try:
+                new_rows.append({
+                    "external_id": poi_data["external_id"],
+                    "name": poi_data["name"],
+                    "category": poi_data["category"],
+                    "latitude": poi_data["latitude"],
+                    "longitude": poi_data["longitude"],
+                    "phone": poi_data.get("phone"),
+                    "website": poi_data.get("website"),
+                    "location": ewkb_point(poi_data["longitude"], poi_data["latitude"]),
+                    "source": "overpass",
+                    "amenities": str(poi_data.get("tags", {}))
+                })
+            except Exception as e:
+                logger.error(f"Error upserting POI {poi_data.get('external_id')}: {str(e)}")
+
+        # Insert in batches; a failing batch falls back to per-row inserts
+        updated_count += POIModel.bulk_insert_or_skip(db, new_rows, ewkb_columns=("location",))
+
         db.commit()
         logger.info(f"Successfully upserted {updated_count} POIs")
     except Exception as e:
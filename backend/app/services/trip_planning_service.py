@@ -396,6 +396,73 @@ def get_route_geometry_sync(points: List[tuple[float, float]]) -> List[List[floa
     return loop.run_until_complete(get_route_geometry(points))
 
 
+async def get_route_polyline(
+    points: List[tuple[float, float]],
+    service: str = None
+) -> Optional[str]:
+    """
+    Get route geometry as an encoded polyline (precision 6) for multiple waypoints.
+
+    OSRM returns the geometry already encoded, so it is passed through as-is
+    for clients that decode it themselves.
+
+    Args:
+        points: List of (latitude, longitude) tuples
+        service: Routing service to use (defaults to ACTIVE_ROUTING_SERVICE)
+
+    Returns:
+        Encoded polyline string, or None if the route could not be fetched
+    """
+    if len(points) < 2:
+        return None
+
+    service = service or ACTIVE_ROUTING_SERVICE
+    config = ROUTING_CONFIG.get(service, ROUTING_CONFIG["osrm_public"])
+
+    try:
+        # Build coordinates string (lon,lat pairs separated by semicolons)
+        coords = ";".join([f"{p[1]},{p[0]}" for p in points])
+
+        url = (
+            f"{config['base_url']}/route/v1/{config['profile']}/{coords}"
+            f"?overview=full&geometries=polyline6"
+        )
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get("code") != "Ok":
+                raise Exception(f"OSRM error: {data.get('message', 'Unknown error')}")
+
+            return data["routes"][0]["geometry"]
+    except Exception as e:
+        logger.warning(f"Failed to get encoded route geometry: {e}")
+        return None
+
+
+def get_route_polyline_sync(points: List[tuple[float, float]]) -> Optional[str]:
+    """
+    Synchronous wrapper for get_route_polyline.
+
+    Args:
+        points: List of (latitude, longitude) tuples
+
+    Returns:
+        Encoded polyline string (precision 6), or None on failure
+    """
+    import asyncio
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(get_route_polyline(points))
+
+
 def plan_trip_route(
     start: Dict[str, Any],
     destination: Dict[str, Any],
@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
 import asyncio
+from collections import OrderedDict
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -23,14 +24,46 @@ NWS_HEADERS = {
     "Accept": "application/geo+json"
 }
 
-# Simple in-memory cache for forecast data
-_forecast_cache: Dict[str, Dict[str, Any]] = {}
+# In-memory TTL + LRU caches, keyed on quantized coordinates
+_CACHE_MAX_ENTRIES = 8192
+_GRIDPOINT_MAX_AGE_MINUTES = 24 * 60  # Gridpoint metadata rarely changes
+_forecast_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_hourly_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_gridpoint_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 _cache_stats = {"hits": 0, "misses": 0}
 
 
+def _quantize(lat: float, lon: float) -> tuple:
+    """
+    Snap coordinates to a 0.01 degree grid (~1.1 km).
+
+    NWS gridpoints are ~2.5 km apart, so jittered GPS fixes within the same
+    cell resolve to the same forecast and share one cache entry.
+    """
+    return round(lat, 2), round(lon, 2)
+
+
 def _cache_key(lat: float, lon: float) -> str:
     """Generate cache key from coordinates (rounded to 2 decimal places)"""
-    return f"{round(lat, 2)},{round(lon, 2)}"
+    lat_q, lon_q = _quantize(lat, lon)
+    return f"{lat_q},{lon_q}"
+
+
+def _cache_get(cache: OrderedDict, key: str, max_age_minutes: int = 30) -> Optional[Any]:
+    """Return cached data if present and fresh, marking it most recently used."""
+    entry = cache.get(key)
+    if not _is_cache_valid(entry, max_age_minutes):
+        return None
+    cache.move_to_end(key)
+    return entry["data"]
+
+
+def _cache_put(cache: OrderedDict, key: str, data: Any) -> None:
+    """Store data in a cache, evicting least recently used entries past the cap."""
+    cache[key] = {"data": data, "cached_at": datetime.utcnow()}
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
 
 
 def _is_cache_valid(cache_entry: Dict[str, Any], max_age_minutes: int = 30) -> bool:
@@ -45,14 +78,22 @@ def _is_cache_valid(cache_entry: Dict[str, Any], max_age_minutes: int = 30) -> b
 
 
 async def _get_gridpoint(lat: float, lon: float) -> Optional[Dict[str, Any]]:
-    """Get NWS gridpoint info for coordinates"""
-    url = f"{NWS_API_BASE}/points/{lat},{lon}"
+    """Get NWS gridpoint info for coordinates (cached for 24 hours)"""
+    cache_key = _cache_key(lat, lon)
+    cached = _cache_get(_gridpoint_cache, cache_key, _GRIDPOINT_MAX_AGE_MINUTES)
+    if cached is not None:
+        return cached
+
+    lat_q, lon_q = _quantize(lat, lon)
+    url = f"{NWS_API_BASE}/points/{lat_q},{lon_q}"
 
     try:
         async with httpx.AsyncClient(timeout=15.0) as client:
             response = await client.get(url, headers=NWS_HEADERS)
             if response.status_code == 200:
-                return response.json()
+                gridpoint = response.json()
+                _cache_put(_gridpoint_cache, cache_key, gridpoint)
+                return gridpoint
             else:
                 logger.warning(f"NWS points API returned {response.status_code} for {lat},{lon}")
                 return None
@@ -71,9 +112,10 @@ async def get_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     cache_key = _cache_key(lat, lon)
 
     # Check cache
-    if cache_key in _forecast_cache and _is_cache_valid(_forecast_cache[cache_key]):
+    cached = _cache_get(_forecast_cache, cache_key)
+    if cached is not None:
         _cache_stats["hits"] += 1
-        return _forecast_cache[cache_key]["data"]
+        return cached
 
     _cache_stats["misses"] += 1
 
@@ -132,10 +174,7 @@ async def get_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
             }
 
             # Cache the result
-            _forecast_cache[cache_key] = {
-                "data": result,
-                "cached_at": datetime.utcnow()
-            }
+            _cache_put(_forecast_cache, cache_key, result)
 
             return result
 
@@ -145,7 +184,19 @@ async def get_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
 
 
 async def get_hourly_forecast(lat: float, lon: float) -> Optional[List[Dict[str, Any]]]:
-    """Get hourly weather forecast for a location (next 156 hours)."""
+    """
+    Get hourly weather forecast for a location (next 156 hours).
+    Results are cached for 30 minutes.
+    """
+    cache_key = _cache_key(lat, lon)
+
+    cached = _cache_get(_hourly_cache, cache_key)
+    if cached is not None:
+        _cache_stats["hits"] += 1
+        return cached
+
+    _cache_stats["misses"] += 1
+
     gridpoint = await _get_gridpoint(lat, lon)
     if not gridpoint:
         return None
@@ -165,7 +216,7 @@ async def get_hourly_forecast(lat: float, lon: float) -> Optional[List[Dict[str,
             forecast_data = response.json()
             periods = forecast_data.get("properties", {}).get("periods", [])
 
-            return [
+            result = [
                 {
                     "startTime": p.get("startTime"),
                     "temperature": p.get("temperature"),
@@ -179,6 +230,9 @@ async def get_hourly_forecast(lat: float, lon: float) -> Optional[List[Dict[str,
                 for p in periods[:48]  # Return first 48 hours
             ]
 
+            _cache_put(_hourly_cache, cache_key, result)
+            return result
+
     except Exception as e:
         logger.error(f"Error fetching hourly forecast: {e}")
         return None
@@ -252,14 +306,18 @@ def get_radar_tile_config() -> Dict[str, Any]:
 
 def clear_forecast_cache():
     """Clear the forecast cache."""
-    global _forecast_cache
-    _forecast_cache = {}
+    _forecast_cache.clear()
+    _hourly_cache.clear()
+    _gridpoint_cache.clear()
 
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics."""
     return {
         "size": len(_forecast_cache),
+        "hourly_size": len(_hourly_cache),
+        "gridpoint_size": len(_gridpoint_cache),
+        "max_entries": _CACHE_MAX_ENTRIES,
         "hits": _cache_stats["hits"],
         "misses": _cache_stats["misses"],
         "hit_rate": _cache_stats["hits"] / max(1, _cache_stats["hits"] + _cache_stats["misses"])
@@ -10,9 +10,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
 from app.core.database import engine, Base
+from app.core.zorder import ZORDER_FUNCTION_SQL
 from app.models import (
     User, RVProfile, Trip, TripStop, RouteNote,
-    POI, OverpassHeight, FuelLog
+    POI, OverpassHeight, FuelLog, load_all_models
 )
 
 
@@ -24,13 +25,20 @@ def init_db():
     with engine.connect() as conn:
         try:
             conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis;"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
             conn.commit()
-            print("PostGIS extension enabled")
+            print("PostGIS and pg_trgm extensions enabled")
         except Exception as e:
             print(f"Warning: Could not enable PostGIS: {e}")
             print("Make sure PostgreSQL has PostGIS installed")
 
+    # Functions used by generated columns must exist before the tables
+    with engine.connect() as conn:
+        conn.execute(text(ZORDER_FUNCTION_SQL))
+        conn.commit()
+
     # Create all tables
+    load_all_models()
     Base.metadata.create_all(bind=engine)
     print("All tables created successfully!")
 
@@ -43,12 +51,12 @@ def init_db():
                 ON trip_stops USING GIST (location);
             """))
             conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_pois_location
-                ON pois USING GIST (location);
+                CREATE INDEX IF NOT EXISTS idx_pois_location_spgist
+                ON pois USING SPGIST (location);
             """))
             conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_overpass_heights_location
-                ON overpass_heights USING GIST (location);
+                CREATE INDEX IF NOT EXISTS idx_overpass_heights_location_spgist
+                ON overpass_heights USING SPGIST (location);
             """))
             conn.execute(text("""
                 CREATE INDEX IF NOT EXISTS idx_fuel_logs_location
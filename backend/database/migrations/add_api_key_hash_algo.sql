@@ -0,0 +1,4 @@
+-- Record which digest produced api_keys.key_hash
+-- Existing keys were hashed with SHA-256; new keys use BLAKE2b (32-byte digest)
+
+ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS hash_algo VARCHAR(16) NOT NULL DEFAULT 'sha256';
@@ -0,0 +1,20 @@
+-- Web Mercator (EPSG:3857) copies of point locations for planar radius searches.
+-- Generated from location, so existing writers need no changes.
+-- pois lives in the main database; poi_master, pois_verified and harvest_hosts
+-- in the POI database.
+
+ALTER TABLE pois ADD COLUMN IF NOT EXISTS location_3857 geometry(Point, 3857)
+    GENERATED ALWAYS AS (ST_Transform(location::geometry, 3857)) STORED;
+CREATE INDEX IF NOT EXISTS idx_pois_location_3857_spgist ON pois USING SPGIST (location_3857);
+
+ALTER TABLE poi_master ADD COLUMN IF NOT EXISTS location_3857 geometry(Point, 3857)
+    GENERATED ALWAYS AS (ST_Transform(location, 3857)) STORED;
+CREATE INDEX IF NOT EXISTS idx_poi_master_location_3857_spgist ON poi_master USING SPGIST (location_3857);
+
+ALTER TABLE pois_verified ADD COLUMN IF NOT EXISTS location_3857 geometry(Point, 3857)
+    GENERATED ALWAYS AS (ST_Transform(location, 3857)) STORED;
+CREATE INDEX IF NOT EXISTS idx_pois_verified_location_3857_spgist ON pois_verified USING SPGIST (location_3857);
+
+ALTER TABLE harvest_hosts ADD COLUMN IF NOT EXISTS location_3857 geometry(Point, 3857)
+    GENERATED ALWAYS AS (ST_Transform(location::geometry, 3857)) STORED;
+CREATE INDEX IF NOT EXISTS idx_harvest_hosts_location_3857_spgist ON harvest_hosts USING SPGIST (location_3857);
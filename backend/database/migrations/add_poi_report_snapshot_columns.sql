@@ -0,0 +1,8 @@
+-- Snapshot POI name/category/state onto poi_user_reports so report listings
+-- don't look each POI up in the separate POI database. Filled by the
+-- application when a report is created (no cross-database trigger).
+
+ALTER TABLE poi_user_reports
+    ADD COLUMN IF NOT EXISTS poi_name VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS poi_category VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS poi_state VARCHAR(50);
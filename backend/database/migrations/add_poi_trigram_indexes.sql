@@ -0,0 +1,9 @@
+-- Trigram indexes so the serialized-item search (ILIKE '%q%' across serial,
+-- name, brand and city) can use a BitmapOr instead of scanning pois.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_pois_serial_trgm ON pois USING GIN (serial gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_pois_name_trgm ON pois USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_pois_brand_trgm ON pois USING GIN (brand gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_pois_city_trgm ON pois USING GIN (city gin_trgm_ops);
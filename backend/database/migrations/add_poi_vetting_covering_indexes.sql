@@ -0,0 +1,15 @@
+-- Covering indexes for the POI vetting list queries: the open-report review
+-- queue, per-POI vote tallies and per-POI image galleries. The poi_id
+-- single-column indexes on votes and images are covered by the new composites.
+
+CREATE INDEX IF NOT EXISTS ix_poi_reports_pending ON poi_user_reports (status, created_at)
+    INCLUDE (id, poi_id, report_type, user_id)
+    WHERE status IN ('pending', 'under_review');
+
+CREATE INDEX IF NOT EXISTS ix_poi_votes_poi_type ON poi_verification_votes (poi_id, vote_type)
+    INCLUDE (vote_weight);
+DROP INDEX IF EXISTS ix_poi_verification_votes_poi_id;
+
+CREATE INDEX IF NOT EXISTS ix_poi_images_gallery ON poi_images (poi_id, is_approved, display_order)
+    INCLUDE (id);
+DROP INDEX IF EXISTS ix_poi_images_poi_id;
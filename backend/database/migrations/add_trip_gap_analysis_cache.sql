@@ -0,0 +1,7 @@
+-- Cache gap analysis results on trips so unchanged trips skip re-routing
+
+-- blake2b digest of the analysis inputs (stop ids/coords/order, daily limit, start date)
+ALTER TABLE trips ADD COLUMN IF NOT EXISTS gap_analysis_hash VARCHAR(64);
+
+-- Full analyze-gaps response for the stored hash
+ALTER TABLE trips ADD COLUMN IF NOT EXISTS gap_analysis_result JSON;
@@ -0,0 +1,44 @@
+-- Z-order (Morton) cell ids on point tables for B-tree bbox range prefilters.
+-- wm_zorder_cell() must match zorder_cell() in app/core/zorder.py.
+-- pois lives in the main database; poi_master, pois_verified and harvest_hosts
+-- in the POI database. Create the function in each database.
+CREATE OR REPLACE FUNCTION wm_zorder_cell(lat double precision, lon double precision)
+RETURNS bigint
+LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+DECLARE
+    x bigint := least(greatest(floor((lon + 180.0) / 360.0 * 2147483648.0), 0), 2147483647);
+    y bigint := least(greatest(floor((lat + 90.0) / 180.0 * 2147483648.0), 0), 2147483647);
+BEGIN
+    x := (x | (x << 16)) & 281470681808895;
+    x := (x | (x << 8)) & 71777214294589695;
+    x := (x | (x << 4)) & 1085102592571150095;
+    x := (x | (x << 2)) & 3689348814741910323;
+    x := (x | (x << 1)) & 6148914691236517205;
+    y := (y | (y << 16)) & 281470681808895;
+    y := (y | (y << 8)) & 71777214294589695;
+    y := (y | (y << 4)) & 1085102592571150095;
+    y := (y | (y << 2)) & 3689348814741910323;
+    y := (y | (y << 1)) & 6148914691236517205;
+    RETURN x | (y << 1);
+END
+$$;
+
+ALTER TABLE pois ADD COLUMN IF NOT EXISTS zorder_cell bigint
+    GENERATED ALWAYS AS (wm_zorder_cell(latitude, longitude)) STORED;
+CREATE INDEX IF NOT EXISTS idx_pois_category_zorder ON pois (category, zorder_cell);
+CREATE INDEX IF NOT EXISTS idx_pois_state_zorder ON pois (state, zorder_cell);
+
+ALTER TABLE poi_master ADD COLUMN IF NOT EXISTS zorder_cell bigint
+    GENERATED ALWAYS AS (wm_zorder_cell(latitude, longitude)) STORED;
+CREATE INDEX IF NOT EXISTS idx_poi_master_category_zorder ON poi_master (category, zorder_cell);
+CREATE INDEX IF NOT EXISTS idx_poi_master_state_zorder ON poi_master (state, zorder_cell);
+
+ALTER TABLE pois_verified ADD COLUMN IF NOT EXISTS zorder_cell bigint
+    GENERATED ALWAYS AS (wm_zorder_cell(latitude, longitude)) STORED;
+CREATE INDEX IF NOT EXISTS idx_pois_verified_category_zorder ON pois_verified (category, zorder_cell);
+CREATE INDEX IF NOT EXISTS idx_pois_verified_state_zorder ON pois_verified (state, zorder_cell);
+
+ALTER TABLE harvest_hosts ADD COLUMN IF NOT EXISTS zorder_cell bigint
+    GENERATED ALWAYS AS (wm_zorder_cell(latitude, longitude)) STORED;
+CREATE INDEX IF NOT EXISTS idx_harvest_hosts_host_type_zorder ON harvest_hosts (host_type, zorder_cell);
+CREATE INDEX IF NOT EXISTS idx_harvest_hosts_state_zorder ON harvest_hosts (state, zorder_cell);
@@ -0,0 +1,12 @@
+-- Drop single-column indexes whose column already leads a composite index
+-- (e.g. ix_pois_category vs idx_pois_category_zorder); each one only adds
+-- write amplification on bulk loads.
+
+DROP INDEX IF EXISTS ix_fuel_prices_region;
+DROP INDEX IF EXISTS ix_pois_category;
+DROP INDEX IF EXISTS ix_poi_master_category;
+DROP INDEX IF EXISTS ix_poi_master_state;
+DROP INDEX IF EXISTS ix_pois_verified_category;
+DROP INDEX IF EXISTS ix_pois_verified_state;
+DROP INDEX IF EXISTS ix_harvest_hosts_host_type;
+DROP INDEX IF EXISTS ix_harvest_hosts_state;
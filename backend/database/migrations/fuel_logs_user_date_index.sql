@@ -0,0 +1,4 @@
+-- Serve "most recent fuel logs for a user" from an index scan instead of
+-- filtering on user_id and sorting.
+
+CREATE INDEX IF NOT EXISTS ix_fuel_logs_user_date ON fuel_logs (user_id, date DESC);
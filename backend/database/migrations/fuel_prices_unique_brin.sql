@@ -0,0 +1,14 @@
+-- Make (region, grade, price_date) unique so EIA dumps can be upserted in one
+-- statement, and replace the B-tree on price_date with a BRIN index.
+
+-- Keep the newest row for any duplicated (region, grade, price_date)
+DELETE FROM fuel_prices a
+USING fuel_prices b
+WHERE a.region = b.region AND a.grade = b.grade AND a.price_date = b.price_date
+  AND a.id < b.id;
+
+DROP INDEX IF EXISTS ix_fuel_prices_region_grade_date;
+CREATE UNIQUE INDEX ix_fuel_prices_region_grade_date ON fuel_prices (region, grade, price_date);
+
+DROP INDEX IF EXISTS ix_fuel_prices_price_date;
+CREATE INDEX IF NOT EXISTS ix_fuel_prices_date_brin ON fuel_prices USING BRIN (price_date) WITH (pages_per_range = 32);
@@ -0,0 +1,5 @@
+-- weight_lbs was never written by the scrapers; derive it from weight_tons.
+
+ALTER TABLE weight_restrictions DROP COLUMN IF EXISTS weight_lbs;
+ALTER TABLE weight_restrictions
+    ADD COLUMN weight_lbs double precision GENERATED ALWAYS AS (weight_tons * 2000) STORED;
@@ -0,0 +1,9 @@
+-- Store fuel money columns as NUMERIC so totals aggregate exactly.
+-- Distances and gallons stay double precision.
+
+ALTER TABLE fuel_logs
+    ALTER COLUMN price_per_gallon TYPE NUMERIC(12, 4),
+    ALTER COLUMN total_cost TYPE NUMERIC(12, 4);
+
+ALTER TABLE trips
+    ALTER COLUMN total_fuel_cost TYPE NUMERIC(12, 4);
@@ -0,0 +1,25 @@
+-- POI source tables: drop the name/city/state btrees (nothing filters on them
+-- by equality) and serve name search with a trigram GIN index instead.
+-- category keeps its btree; the bbox endpoints filter on it.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DROP INDEX IF EXISTS ix_overpass_pois_name;
+DROP INDEX IF EXISTS ix_overpass_pois_city;
+DROP INDEX IF EXISTS ix_overpass_pois_state;
+CREATE INDEX IF NOT EXISTS idx_overpass_pois_name_trgm ON overpass_pois USING GIN (name gin_trgm_ops);
+
+DROP INDEX IF EXISTS ix_google_places_pois_name;
+DROP INDEX IF EXISTS ix_google_places_pois_city;
+DROP INDEX IF EXISTS ix_google_places_pois_state;
+CREATE INDEX IF NOT EXISTS idx_google_places_pois_name_trgm ON google_places_pois USING GIN (name gin_trgm_ops);
+
+DROP INDEX IF EXISTS ix_yelp_pois_name;
+DROP INDEX IF EXISTS ix_yelp_pois_city;
+DROP INDEX IF EXISTS ix_yelp_pois_state;
+CREATE INDEX IF NOT EXISTS idx_yelp_pois_name_trgm ON yelp_pois USING GIN (name gin_trgm_ops);
+
+DROP INDEX IF EXISTS ix_foursquare_pois_name;
+DROP INDEX IF EXISTS ix_foursquare_pois_city;
+DROP INDEX IF EXISTS ix_foursquare_pois_state;
+CREATE INDEX IF NOT EXISTS idx_foursquare_pois_name_trgm ON foursquare_pois USING GIN (name gin_trgm_ops);
@@ -0,0 +1,27 @@
+-- POI source tables (overpass_pois, google_places_pois, yelp_pois,
+-- foursquare_pois): replace the lat/lon btrees and the GiST + btree pair on
+-- location with a single SP-GiST index. All spatial lookups go through location.
+
+DROP INDEX IF EXISTS ix_overpass_pois_latitude;
+DROP INDEX IF EXISTS ix_overpass_pois_longitude;
+DROP INDEX IF EXISTS ix_overpass_pois_location;
+DROP INDEX IF EXISTS idx_overpass_pois_location;
+CREATE INDEX IF NOT EXISTS idx_overpass_pois_location_spgist ON overpass_pois USING SPGIST (location);
+
+DROP INDEX IF EXISTS ix_google_places_pois_latitude;
+DROP INDEX IF EXISTS ix_google_places_pois_longitude;
+DROP INDEX IF EXISTS ix_google_places_pois_location;
+DROP INDEX IF EXISTS idx_google_places_pois_location;
+CREATE INDEX IF NOT EXISTS idx_google_places_pois_location_spgist ON google_places_pois USING SPGIST (location);
+
+DROP INDEX IF EXISTS ix_yelp_pois_latitude;
+DROP INDEX IF EXISTS ix_yelp_pois_longitude;
+DROP INDEX IF EXISTS ix_yelp_pois_location;
+DROP INDEX IF EXISTS idx_yelp_pois_location;
+CREATE INDEX IF NOT EXISTS idx_yelp_pois_location_spgist ON yelp_pois USING SPGIST (location);
+
+DROP INDEX IF EXISTS ix_foursquare_pois_latitude;
+DROP INDEX IF EXISTS ix_foursquare_pois_longitude;
+DROP INDEX IF EXISTS ix_foursquare_pois_location;
+DROP INDEX IF EXISTS idx_foursquare_pois_location;
+CREATE INDEX IF NOT EXISTS idx_foursquare_pois_location_spgist ON foursquare_pois USING SPGIST (location);
@@ -0,0 +1,13 @@
+-- primary_image holds already-compressed JPEG/PNG/WebP bytes; pglz only burns
+-- CPU trying to shrink them. Store them out of line without compression.
+-- Existing rows keep their current storage until rewritten.
+
+ALTER TABLE poi_master ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+ALTER TABLE pois_verified ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+
+ALTER TABLE overpass_pois ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+ALTER TABLE google_places_pois ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+ALTER TABLE yelp_pois ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+ALTER TABLE foursquare_pois ALTER COLUMN primary_image SET STORAGE EXTERNAL;
+
+ALTER TABLE poi_images ALTER COLUMN image_data SET STORAGE EXTERNAL;
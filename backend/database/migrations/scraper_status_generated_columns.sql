@@ -0,0 +1,16 @@
+-- Compute scraper progress and health in Postgres on write instead of in
+-- Python on every dashboard poll. elapsed_seconds and is_stale depend on
+-- now() and stay in Python (generated columns must be immutable).
+
+ALTER TABLE scraper_status
+    ADD COLUMN IF NOT EXISTS progress_percentage DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE WHEN total_segments > 0
+            THEN round(COALESCE(current_segment, 0)::numeric / total_segments * 100, 1)::float8
+            ELSE 0 END
+    ) STORED,
+    ADD COLUMN IF NOT EXISTS health_status VARCHAR(10) GENERATED ALWAYS AS (
+        CASE WHEN consecutive_errors >= 5 THEN 'critical'
+            WHEN consecutive_errors >= 3 OR rate_limit_hits > 10 THEN 'warning'
+            WHEN success_rate < 80 THEN 'degraded'
+            ELSE 'healthy' END
+    ) STORED;
@@ -0,0 +1,6 @@
+-- Short generated prefix of scraper_status.last_error for dashboard status
+-- lines, so listing scrapers doesn't pull whole stack traces.
+
+ALTER TABLE scraper_status
+    ADD COLUMN IF NOT EXISTS last_error_short VARCHAR(100)
+        GENERATED ALWAYS AS (left(last_error, 100)) STORED;
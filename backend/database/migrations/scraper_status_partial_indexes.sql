@@ -0,0 +1,7 @@
+-- Partial indexes for the stale-scraper and health checks on scraper_status;
+-- each covers only the handful of running / unhealthy rows.
+
+CREATE INDEX IF NOT EXISTS ix_scraper_running_activity ON scraper_status (last_activity_at)
+    WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS ix_scraper_unhealthy ON scraper_status (health_status)
+    WHERE health_status <> 'healthy';
@@ -0,0 +1,26 @@
+-- Timestamps on the POI source and POI vetting tables now default in Postgres
+-- (now()) instead of being generated in Python for every inserted row.
+
+ALTER TABLE overpass_pois
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN last_fetched SET DEFAULT now();
+ALTER TABLE google_places_pois
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN last_fetched SET DEFAULT now();
+ALTER TABLE yelp_pois
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN last_fetched SET DEFAULT now();
+ALTER TABLE foursquare_pois
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN last_fetched SET DEFAULT now();
+
+ALTER TABLE poi_user_reports
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+ALTER TABLE poi_verification_votes ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE poi_user_contributions ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE poi_images ALTER COLUMN created_at SET DEFAULT now();
@@ -0,0 +1,23 @@
+-- Derive trip_stops / route_notes latitude and longitude from the PostGIS
+-- point instead of storing them separately. Postgres can't turn an existing
+-- column into a generated one, so backfill any missing points and re-add them.
+
+UPDATE trip_stops
+SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+
+ALTER TABLE trip_stops
+    DROP COLUMN IF EXISTS latitude,
+    DROP COLUMN IF EXISTS longitude,
+    ADD COLUMN latitude DOUBLE PRECISION GENERATED ALWAYS AS (ST_Y(location::geometry)) STORED,
+    ADD COLUMN longitude DOUBLE PRECISION GENERATED ALWAYS AS (ST_X(location::geometry)) STORED;
+
+UPDATE route_notes
+SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE location IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+
+ALTER TABLE route_notes
+    DROP COLUMN IF EXISTS latitude,
+    DROP COLUMN IF EXISTS longitude,
+    ADD COLUMN latitude DOUBLE PRECISION GENERATED ALWAYS AS (ST_Y(location::geometry)) STORED,
+    ADD COLUMN longitude DOUBLE PRECISION GENERATED ALWAYS AS (ST_X(location::geometry)) STORED;
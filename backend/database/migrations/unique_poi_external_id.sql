@@ -0,0 +1,19 @@
+-- Make pois.external_id unique so scraper batches can be merged with
+-- INSERT ... ON CONFLICT (external_id), and so external_id lookups are indexed.
+
+-- Repoint trip stops at the oldest copy of any duplicated POI, then drop the rest
+WITH ranked AS (
+    SELECT id, min(id) OVER (PARTITION BY external_id) AS keep_id
+    FROM pois
+    WHERE external_id IS NOT NULL
+)
+UPDATE trip_stops t
+SET poi_id = r.keep_id
+FROM ranked r
+WHERE t.poi_id = r.id AND r.id <> r.keep_id;
+
+DELETE FROM pois p
+USING pois k
+WHERE p.external_id = k.external_id AND p.id > k.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_pois_external_id ON pois (external_id);
@@ -0,0 +1,12 @@
+-- One vote per user per POI, enforced by the database so vote casting can be
+-- a single INSERT ... ON CONFLICT (poi_id, user_id) DO UPDATE.
+-- Keep each user's most recent vote before adding the constraint.
+
+DELETE FROM poi_verification_votes v
+USING poi_verification_votes newer
+WHERE v.poi_id = newer.poi_id
+  AND v.user_id = newer.user_id
+  AND (v.created_at, v.id) < (newer.created_at, newer.id);
+
+ALTER TABLE poi_verification_votes
+    ADD CONSTRAINT uq_verify_vote_user_poi UNIQUE (poi_id, user_id);
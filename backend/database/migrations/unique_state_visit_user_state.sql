@@ -0,0 +1,12 @@
+-- One state_visits row per user per state, so creating a visit can be a single
+-- INSERT ... ON CONFLICT (user_id, state_code) DO UPDATE.
+-- Keep the most recently updated row for any existing duplicates.
+
+DELETE FROM state_visits v
+USING state_visits newer
+WHERE v.user_id = newer.user_id
+  AND v.state_code = newer.state_code
+  AND (COALESCE(v.updated_at, v.created_at), v.id) < (COALESCE(newer.updated_at, newer.created_at), newer.id);
+
+ALTER TABLE state_visits
+    ADD CONSTRAINT uq_state_visit_user_state UNIQUE (user_id, state_code);
@@ -0,0 +1,36 @@
+-- Store trip status and the fixed weather vocabularies as Postgres enums
+-- (4 bytes, compared as integers) instead of free-form text.
+
+DO $$ BEGIN
+    CREATE TYPE trip_status AS ENUM ('planning', 'planned', 'in_progress', 'completed', 'cancelled');
+EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+
+DO $$ BEGIN
+    CREATE TYPE weather_location_type AS ENUM ('user_location', 'trip_stop', 'manual');
+EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+
+DO $$ BEGIN
+    CREATE TYPE weather_forecast_type AS ENUM ('daily', 'hourly');
+EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+
+DO $$ BEGIN
+    CREATE TYPE weather_alert_severity AS ENUM ('Minor', 'Moderate', 'Severe', 'Extreme', 'Unknown');
+EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+
+-- Anything outside the known set is recomputed by the API on next read
+UPDATE trips SET status = 'planning'
+WHERE status NOT IN ('planning', 'planned', 'in_progress', 'completed', 'cancelled');
+
+ALTER TABLE trips ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE trips ALTER COLUMN status TYPE trip_status USING status::trip_status;
+ALTER TABLE trips ALTER COLUMN status SET DEFAULT 'planning';
+
+ALTER TABLE weather_forecasts
+    ALTER COLUMN location_type TYPE weather_location_type USING location_type::weather_location_type,
+    ALTER COLUMN forecast_type TYPE weather_forecast_type USING forecast_type::weather_forecast_type;
+
+UPDATE weather_alerts SET severity = 'Unknown'
+WHERE severity NOT IN ('Minor', 'Moderate', 'Severe', 'Extreme', 'Unknown');
+
+ALTER TABLE weather_alerts
+    ALTER COLUMN severity TYPE weather_alert_severity USING severity::weather_alert_severity;
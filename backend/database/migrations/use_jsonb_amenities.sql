@@ -0,0 +1,31 @@
+-- Store HarvestHost and POI master/verified JSON columns as JSONB so filters do
+-- not re-parse text per row, and GIN-index the containment-queried columns.
+
+ALTER TABLE harvest_hosts
+    ALTER COLUMN business_hours TYPE JSONB USING business_hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN highlights TYPE JSONB USING highlights::jsonb,
+    ALTER COLUMN on_site_features TYPE JSONB USING on_site_features::jsonb,
+    ALTER COLUMN nearby_hosts TYPE JSONB USING nearby_hosts::jsonb,
+    ALTER COLUMN raw_json TYPE JSONB USING raw_json::jsonb;
+
+ALTER TABLE poi_master
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN source_ratings TYPE JSONB USING source_ratings::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN payment_methods TYPE JSONB USING payment_methods::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb;
+
+ALTER TABLE pois_verified
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb;
+
+ALTER TABLE poi_correlation
+    ALTER COLUMN conflict_fields TYPE JSONB USING conflict_fields::jsonb;
+
+CREATE INDEX IF NOT EXISTS idx_harvest_hosts_amenities_gin ON harvest_hosts USING GIN (amenities jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_poi_master_amenities_gin ON poi_master USING GIN (amenities jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_poi_master_hours_gin ON poi_master USING GIN (hours jsonb_path_ops);
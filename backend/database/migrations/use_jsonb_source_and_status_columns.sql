@@ -0,0 +1,60 @@
+-- Store the remaining JSON columns on the POI source tables, the POI vetting
+-- tables and scraper_status as JSONB: parsed once on write, indexable, and
+-- no text re-parse per row on read.
+
+ALTER TABLE overpass_pois
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN payment_methods TYPE JSONB USING payment_methods::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb,
+    ALTER COLUMN fuel_brands TYPE JSONB USING fuel_brands::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb,
+    ALTER COLUMN raw_tags TYPE JSONB USING raw_tags::jsonb,
+    ALTER COLUMN api_response TYPE JSONB USING api_response::jsonb;
+
+ALTER TABLE google_places_pois
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN payment_methods TYPE JSONB USING payment_methods::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb,
+    ALTER COLUMN fuel_brands TYPE JSONB USING fuel_brands::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb,
+    ALTER COLUMN raw_tags TYPE JSONB USING raw_tags::jsonb,
+    ALTER COLUMN api_response TYPE JSONB USING api_response::jsonb;
+
+ALTER TABLE yelp_pois
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN payment_methods TYPE JSONB USING payment_methods::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb,
+    ALTER COLUMN fuel_brands TYPE JSONB USING fuel_brands::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb,
+    ALTER COLUMN raw_tags TYPE JSONB USING raw_tags::jsonb,
+    ALTER COLUMN api_response TYPE JSONB USING api_response::jsonb;
+
+ALTER TABLE foursquare_pois
+    ALTER COLUMN hours TYPE JSONB USING hours::jsonb,
+    ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb,
+    ALTER COLUMN payment_methods TYPE JSONB USING payment_methods::jsonb,
+    ALTER COLUMN fuel_types TYPE JSONB USING fuel_types::jsonb,
+    ALTER COLUMN fuel_brands TYPE JSONB USING fuel_brands::jsonb,
+    ALTER COLUMN images TYPE JSONB USING images::jsonb,
+    ALTER COLUMN raw_tags TYPE JSONB USING raw_tags::jsonb,
+    ALTER COLUMN api_response TYPE JSONB USING api_response::jsonb;
+
+ALTER TABLE poi_user_reports
+    ALTER COLUMN field_corrections TYPE JSONB USING field_corrections::jsonb,
+    ALTER COLUMN evidence_images TYPE JSONB USING evidence_images::jsonb,
+    ALTER COLUMN evidence_urls TYPE JSONB USING evidence_urls::jsonb;
+
+ALTER TABLE poi_verification_votes
+    ALTER COLUMN evidence_images TYPE JSONB USING evidence_images::jsonb;
+
+ALTER TABLE scraper_status
+    ALTER COLUMN last_item_details TYPE JSONB USING last_item_details::jsonb,
+    ALTER COLUMN config TYPE JSONB USING config::jsonb;
+
+-- The start endpoint used to store config as a serialized string; unwrap
+-- those JSON string scalars into the objects they contain
+UPDATE scraper_status SET config = (config #>> '{}')::jsonb
+WHERE jsonb_typeof(config) = 'string';
@@ -0,0 +1,14 @@
+-- Store weather forecast/alert payloads and user preferences as JSONB (parsed
+-- once on write), and GIN-index forecast_data for containment queries.
+
+ALTER TABLE weather_forecasts
+    ALTER COLUMN forecast_data TYPE JSONB USING forecast_data::jsonb,
+    ALTER COLUMN alerts TYPE JSONB USING alerts::jsonb;
+
+ALTER TABLE weather_alerts
+    ALTER COLUMN affected_zones TYPE JSONB USING affected_zones::jsonb;
+
+ALTER TABLE users
+    ALTER COLUMN preferences TYPE JSONB USING preferences::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_weather_forecast_data_gin ON weather_forecasts USING GIN (forecast_data jsonb_path_ops);
@@ -0,0 +1,30 @@
+-- Replace default GiST indexes on 2D point location columns with SP-GiST
+-- (smaller, faster for point radius/bbox lookups).
+-- Requires PostGIS >= 3.0 (SP-GiST support for geography); poi_master and
+-- pois_verified use geometry, supported since PostGIS 2.5.
+-- pois, overpass_heights, railroad_crossings and weight_restrictions live in the
+-- road/main database; poi_master, pois_verified and harvest_hosts in the POI database.
+-- Statements for tables that do not exist in the target database can be skipped.
+
+DROP INDEX IF EXISTS idx_pois_location;
+CREATE INDEX IF NOT EXISTS idx_pois_location_spgist ON pois USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_overpass_heights_location;
+CREATE INDEX IF NOT EXISTS idx_overpass_heights_location_spgist ON overpass_heights USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_railroad_crossings_location;
+CREATE INDEX IF NOT EXISTS idx_railroad_crossings_location_spgist ON railroad_crossings USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_weight_restrictions_location;
+CREATE INDEX IF NOT EXISTS idx_weight_restrictions_location_spgist ON weight_restrictions USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_poi_master_location;
+DROP INDEX IF EXISTS ix_poi_master_location;
+CREATE INDEX IF NOT EXISTS idx_poi_master_location_spgist ON poi_master USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_pois_verified_location;
+DROP INDEX IF EXISTS ix_pois_verified_location;
+CREATE INDEX IF NOT EXISTS idx_pois_verified_location_spgist ON pois_verified USING SPGIST (location);
+
+DROP INDEX IF EXISTS idx_harvest_hosts_location;
+CREATE INDEX IF NOT EXISTS idx_harvest_hosts_location_spgist ON harvest_hosts USING SPGIST (location);
@@ -0,0 +1,8 @@
+-- Default users.preferences to an empty object in Postgres instead of
+-- sending one from Python on every insert, and disallow NULL.
+
+UPDATE users SET preferences = '{}'::jsonb WHERE preferences IS NULL;
+
+ALTER TABLE users
+    ALTER COLUMN preferences SET DEFAULT '{}'::jsonb,
+    ALTER COLUMN preferences SET NOT NULL;
@@ -0,0 +1,6 @@
+-- Partial covering index for "current forecast for this trip stop".
+-- forecast_data is deliberately not included (B-tree tuple size limit).
+
+CREATE INDEX IF NOT EXISTS ix_wf_current_by_stop ON weather_forecasts (trip_stop_id)
+    INCLUDE (forecast_type, fetched_at)
+    WHERE is_current = true;
@@ -0,0 +1,12 @@
+-- Restrict the "current forecast" indexes to is_current rows; historical
+-- forecasts are retained but never looked up through them.
+
+DROP INDEX IF EXISTS ix_weather_forecast_user_current;
+CREATE INDEX IF NOT EXISTS ix_weather_forecast_user_current ON weather_forecasts (user_id, location_type)
+    WHERE is_current = true;
+
+DROP INDEX IF EXISTS ix_weather_forecast_type_current;
+CREATE INDEX IF NOT EXISTS ix_weather_forecast_type_current ON weather_forecasts (forecast_type, fetched_at)
+    WHERE is_current = true;
+
+DROP INDEX IF EXISTS ix_weather_forecasts_is_current;
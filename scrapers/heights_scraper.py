@@ -13,7 +13,6 @@ import httpx
 import logging
 import secrets
 import re
-from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from pathlib import Path
 
@@ -38,8 +37,8 @@ load_dotenv(f'{BACKEND_DIR}/.env')
 from base_runner import ScraperRunner
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from geoalchemy2.elements import WKTElement
 
+from app.core.bulk_copy import copy_upsert, ewkb_point_hex
 from app.core.database import POISessionLocal
 from app.models.poi import OverpassHeight
 from app.models.scraper_status import ScraperStatus
@@ -339,6 +338,7 @@ class HeightsScraperRunner(ScraperRunner):
     async def process_heights(self, elements: List[Dict], state_code: str):
         """Process and save height records to database."""
         road_db = self.get_road_db()
+        rows = []
 
         for element in elements:
             if self.should_stop:
@@ -386,20 +386,7 @@ class HeightsScraperRunner(ScraperRunner):
                 continue
             self.seen_serials.add(serial)
 
-            # Check if exists in database
-            existing = road_db.query(OverpassHeight).filter(
-                OverpassHeight.serial == serial
-            ).first()
-
-            if existing:
-                # Update if height changed
-                if existing.height_feet != height_feet:
-                    existing.height_feet = height_feet
-                    existing.updated_at = datetime.now(timezone.utc)
-                    self.items_updated += 1
-                continue
-
-            # Create new record
+            # Build record
             name = tags.get('name') or tags.get('bridge:name') or tags.get('ref')
             road_name = tags.get('addr:street') or tags.get('name:en')
 
@@ -415,37 +402,39 @@ class HeightsScraperRunner(ScraperRunner):
             if tags.get('operator'):
                 description_parts.append(f"Operator: {tags.get('operator')}")
 
-            height_record = OverpassHeight(
-                serial=serial,
-                name=name,
-                road_name=road_name,
-                location=WKTElement(f'POINT({lon} {lat})', srid=4326),
-                latitude=lat,
-                longitude=lon,
-                height_feet=height_feet,
-                height_inches=height_feet * 12 if height_feet else None,
-                restriction_type=restriction_type,
-                description='; '.join(description_parts) if description_parts else None,
-                direction=tags.get('direction'),
-                source='osm',
-                verified=False
-            )
-
-            road_db.add(height_record)
-            self.items_saved += 1
-
-            # Commit in batches
-            if self.items_saved % 100 == 0:
-                road_db.commit()
-                self.update_status(
-                    items_found=self.items_found,
-                    items_saved=self.items_saved,
-                    items_updated=self.items_updated,
-                    items_skipped=self.items_skipped
-                )
-
+            rows.append({
+                'serial': serial,
+                'name': name,
+                'road_name': road_name,
+                'location': ewkb_point_hex(lon, lat),
+                'latitude': lat,
+                'longitude': lon,
+                'height_feet': height_feet,
+                'height_inches': height_feet * 12 if height_feet else None,
+                'restriction_type': restriction_type,
+                'description': '; '.join(description_parts) if description_parts else None,
+                'direction': tags.get('direction'),
+                'source': 'osm',
+                'verified': False,
+            })
+
+        # Existing records only have their height refreshed
+        inserted, updated = copy_upsert(
+            road_db, OverpassHeight, rows,
+            conflict_column='serial',
+            update_columns=('height_feet',)
+        )
         road_db.commit()
 
+        self.items_saved += inserted
+        self.items_updated += updated
+        self.update_status(
+            items_found=self.items_found,
+            items_saved=self.items_saved,
+            items_updated=self.items_updated,
+            items_skipped=self.items_skipped
+        )
+
     async def run_scraper(self):
         """Main scraper logic."""
         logger.info("Starting Heights Scraper")
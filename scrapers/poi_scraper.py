@@ -34,14 +34,21 @@ sys.path.insert(0, SCRAPERS_DIR)
 
 from base_runner import ScraperRunner
 from sqlalchemy.orm import Session
-from geoalchemy2.elements import WKTElement
 
+from app.core.bulk_copy import copy_upsert, ewkb_point_hex
 from app.core.database import POISessionLocal
 from app.models.poi import POI as POIModel
 from app.models.scraper_status import ScraperStatus
 
 logger = logging.getLogger(__name__)
 
+# Columns refreshed on existing POIs (only when OSM has a value for them)
+POI_UPDATE_FIELDS = (
+    'name', 'brand', 'latitude', 'longitude', 'category', 'state',
+    'address', 'city', 'zip_code', 'phone', 'website', 'email',
+    'google_maps_url', 'amenities'
+)
+
 # US States with geographic bounds
 US_STATES = {
     'AL': {'name': 'Alabama', 'bounds': (30.2, -88.5, 35.0, -84.9)},
@@ -302,69 +309,6 @@ class POIScraperRunner(ScraperRunner):
         random_part = secrets.token_hex(24)  # 48 chars
         return f"POI-{date_part}-{random_part}"[:64]
 
-    def save_poi(self, poi_data: Dict) -> tuple:
-        """
-        Save a POI to the database.
-        Returns: (success: bool, is_new: bool)
-        - success: whether the save was successful
-        - is_new: True if new record, False if updated existing
-        """
-        db = self.get_poi_db()
-        try:
-            # Check for existing by external_id
-            existing = db.query(POIModel).filter(
-                POIModel.external_id == poi_data['external_id']
-            ).first()
-
-            if existing:
-                # Update existing - preserve serial number
-                fields_to_update = [
-                    'name', 'brand', 'latitude', 'longitude', 'category', 'state',
-                    'address', 'city', 'zip_code', 'phone', 'website', 'email',
-                    'google_maps_url', 'amenities', 'source'
-                ]
-                for key in fields_to_update:
-                    if key in poi_data and poi_data[key]:
-                        setattr(existing, key, poi_data[key])
-
-                # Update location geometry
-                existing.location = WKTElement(
-                    f"POINT({poi_data['longitude']} {poi_data['latitude']})", srid=4326
-                )
-                existing.updated_at = datetime.now(timezone.utc)
-                db.commit()
-                return (True, False)  # Success, but not new
-            else:
-                # Create new with generated serial
-                poi = POIModel(
-                    serial=self.generate_serial(),
-                    name=poi_data['name'],
-                    brand=poi_data.get('brand'),
-                    external_id=poi_data['external_id'],
-                    latitude=poi_data['latitude'],
-                    longitude=poi_data['longitude'],
-                    category=poi_data['category'],
-                    state=poi_data['state'],
-                    address=poi_data.get('address'),
-                    city=poi_data.get('city'),
-                    zip_code=poi_data.get('zip_code'),
-                    phone=poi_data.get('phone'),
-                    website=poi_data.get('website'),
-                    email=poi_data.get('email'),
-                    google_maps_url=poi_data.get('google_maps_url'),
-                    amenities=poi_data.get('amenities'),
-                    source=poi_data.get('source', 'osm'),
-                    location=WKTElement(f"POINT({poi_data['longitude']} {poi_data['latitude']})", srid=4326),
-                    is_active=True,
-                )
-                db.add(poi)
-                db.commit()
-                return (True, True)  # Success, is new
-        except Exception as e:
-            logger.error(f"Failed to save POI: {e}")
-            db.rollback()
-            return (False, False)
-
     async def scrape_category_state(self, category_id: str, category_info: Dict, state_code: str, state_info: Dict) -> Dict:
         """Scrape a single category for a single state."""
         bounds = state_info['bounds']
@@ -376,25 +320,40 @@ class POIScraperRunner(ScraperRunner):
         result = await self.query_overpass(query)
         elements = result.get('elements', [])
 
-        found = 0
-        saved = 0
-        updated = 0
-
+        rows = []
         for element in elements:
             if self.should_stop:
                 break
 
             poi_data = self.parse_poi(element, category_id, state_code)
             if poi_data:
-                found += 1
-                success, is_new = self.save_poi(poi_data)
-                if success:
-                    if is_new:
-                        saved += 1
-                    else:
-                        updated += 1
-
-        return {'found': found, 'saved': saved, 'updated': updated}
+                row = {key: poi_data.get(key) or None for key in POI_UPDATE_FIELDS}
+                row.update(
+                    serial=self.generate_serial(),
+                    external_id=poi_data['external_id'],
+                    source=poi_data.get('source') or 'osm',
+                    location=ewkb_point_hex(poi_data['longitude'], poi_data['latitude']),
+                    is_active=True,
+                )
+                rows.append(row)
+
+        # One COPY + merge per category/state; existing POIs keep their serial,
+        # and empty values from OSM don't overwrite stored ones
+        db = self.get_poi_db()
+        try:
+            saved, updated = copy_upsert(
+                db, POIModel, rows,
+                conflict_column='external_id',
+                update_columns=POI_UPDATE_FIELDS + ('source', 'location'),
+                keep_existing_on_null=POI_UPDATE_FIELDS
+            )
+            db.commit()
+        except Exception as e:
+            logger.error(f"Failed to save POIs for {category_id} in {state_code}: {e}")
+            db.rollback()
+            saved = updated = 0
+
+        return {'found': len(rows), 'saved': saved, 'updated': updated}
 
     async def run_scraper(self):
         """Run the POI scraper."""
@@ -12,7 +12,6 @@ import asyncio
 import httpx
 import logging
 import math
-from datetime import datetime, timezone
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
@@ -37,8 +36,8 @@ load_dotenv(f'{BACKEND_DIR}/.env')
 from base_runner import ScraperRunner
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from geoalchemy2.elements import WKTElement
 
+from app.core.bulk_copy import copy_upsert, ewkb_point_hex
 from app.core.database import POISessionLocal
 from app.models.poi import RailroadCrossing
 from app.models.scraper_status import ScraperStatus
@@ -203,6 +202,7 @@ class RailroadScraperRunner(ScraperRunner):
     async def process_crossings(self, elements: List[Dict], state_code: str):
         """Process and save crossing records to database."""
         road_db = self.get_road_db()
+        rows = []
 
         for element in elements:
             if self.should_stop:
@@ -223,38 +223,6 @@ class RailroadScraperRunner(ScraperRunner):
 
             tags = element.get('tags', {})
 
-            # Generate serial
-            serial = self.generate_serial(lat, lon, 'osm')
-
-            # Check if exists
-            existing = road_db.query(RailroadCrossing).filter(
-                RailroadCrossing.serial == serial
-            ).first()
-
-            if existing:
-                # Update safety equipment if changed
-                gates = tags.get('crossing:barrier') == 'full' or \
-                       tags.get('crossing:gates') == 'yes' or \
-                       tags.get('crossing:barrier') == 'yes'
-                light = tags.get('crossing:light') == 'yes'
-                bell = tags.get('crossing:bell') == 'yes'
-
-                updated = False
-                if existing.gates != gates:
-                    existing.gates = gates
-                    updated = True
-                if existing.light != light:
-                    existing.light = light
-                    updated = True
-                if existing.bell != bell:
-                    existing.bell = bell
-                    updated = True
-
-                if updated:
-                    existing.updated_at = datetime.now(timezone.utc)
-                    self.items_updated += 1
-                continue
-
             # Parse safety equipment
             gates = tags.get('crossing:barrier') == 'full' or \
                    tags.get('crossing:gates') == 'yes' or \
@@ -272,42 +240,43 @@ class RailroadScraperRunner(ScraperRunner):
                 except:
                     pass
 
-            # Create record
-            crossing = RailroadCrossing(
-                serial=serial,
-                name=tags.get('name'),
-                road_name=tags.get('addr:street') or tags.get('name:road'),
-                railway_name=tags.get('operator') or tags.get('railway:operator'),
-                location=WKTElement(f'POINT({lon} {lat})', srid=4326),
-                latitude=lat,
-                longitude=lon,
-                crossing_type=tags.get('crossing') or 'at_grade',
-                barrier=tags.get('crossing:barrier'),
-                gates=gates,
-                light=light,
-                bell=bell,
-                supervised=supervised,
-                tracks=tracks,
-                state=state_code,
-                source='osm',
-                verified=False
-            )
-
-            road_db.add(crossing)
-            self.items_saved += 1
-
-            # Commit in batches
-            if self.items_saved % 100 == 0:
-                road_db.commit()
-                self.update_status(
-                    items_found=self.items_found,
-                    items_saved=self.items_saved,
-                    items_updated=self.items_updated,
-                    items_skipped=self.items_skipped
-                )
-
+            rows.append({
+                'serial': self.generate_serial(lat, lon, 'osm'),
+                'name': tags.get('name'),
+                'road_name': tags.get('addr:street') or tags.get('name:road'),
+                'railway_name': tags.get('operator') or tags.get('railway:operator'),
+                'location': ewkb_point_hex(lon, lat),
+                'latitude': lat,
+                'longitude': lon,
+                'crossing_type': tags.get('crossing') or 'at_grade',
+                'barrier': tags.get('crossing:barrier'),
+                'gates': gates,
+                'light': light,
+                'bell': bell,
+                'supervised': supervised,
+                'tracks': tracks,
+                'state': state_code,
+                'source': 'osm',
+                'verified': False,
+            })
+
+        # Existing crossings only have their safety equipment refreshed
+        inserted, updated = copy_upsert(
+            road_db, RailroadCrossing, rows,
+            conflict_column='serial',
+            update_columns=('gates', 'light', 'bell')
+        )
         road_db.commit()
 
+        self.items_saved += inserted
+        self.items_updated += updated
+        self.update_status(
+            items_found=self.items_found,
+            items_saved=self.items_saved,
+            items_updated=self.items_updated,
+            items_skipped=self.items_skipped
+        )
+
     async def run_scraper(self):
         """Main scraper logic."""
         logger.info("Starting Railroad Crossings Scraper")
@@ -185,7 +185,6 @@ interface WeightRestriction {
   longitude: number
   weight_tons: number
   weight_lbs?: number
-  weight_display?: string
   road_name?: string
   restriction_type?: string
   applies_to?: string